@@ -2,8 +2,8 @@
 set -e
 
 # Ensure required directories exist and have correct permissions
-mkdir -p /app/logs
-chown -R appuser:appgroup /app/logs
+mkdir -p /app/logs /app/data
+chown -R appuser:appgroup /app/logs /app/data
 
 # Activate virtual environment if needed
 if [ -d "/app/.venv" ]; then
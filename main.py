@@ -4,7 +4,11 @@ import server.tools.board as board  # noqa: F401
 import server.tools.card as card  # noqa: F401
 import server.tools.list as list  # noqa: F401
 import server.tools.checklist as checklist  # noqa: F401
+import server.tools.snapshot as snapshot  # noqa: F401
+import server.tools.webhook as webhook  # noqa: F401
+import server.tools.search as search  # noqa: F401
 import server.health_app  # noqa: F401
+import server.webhook_app  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
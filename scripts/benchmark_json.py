@@ -0,0 +1,137 @@
+"""
+Compares the stdlib and orjson codecs on a board-sized Trello payload.
+
+The payload mirrors /boards/{id}?lists=all&cards=all&checklists=all: a board
+with its lists, cards, labels and checklists. Decoding starts from the raw
+response bytes, as TrelloClient does.
+
+Run from the repository root:
+    python scripts/benchmark_json.py
+"""
+
+import gc
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from server.utils.json_codec import OrjsonCodec, StdlibCodec  # noqa: E402
+
+LIST_COUNT = 12
+CARDS_PER_LIST = 250
+ROUNDS = 15
+
+BOARD_ID = "5" * 24
+LABELS = [
+    {"id": f"{i:024x}", "idBoard": BOARD_ID, "name": name, "color": color}
+    for i, (name, color) in enumerate(
+        [("Bug", "red"), ("UX", "blue"), ("Backend", "green"), ("Blocked", "black")]
+    )
+]
+
+
+def make_card(list_index: int, i: int) -> dict:
+    card_id = f"{0x60000000 + i:08x}{list_index:04x}{i:012x}"
+    return {
+        "id": card_id,
+        "name": f"Card {i} in list {list_index}",
+        "desc": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+        "closed": False,
+        "idList": f"{list_index:024x}",
+        "idBoard": BOARD_ID,
+        "url": f"https://trello.com/c/abc{i}/card-{i}",
+        "pos": 16384.0 * i,
+        "dateLastActivity": "2024-05-01T12:34:56.789Z",
+        "labels": LABELS[: i % 4],
+        "idLabels": [label["id"] for label in LABELS[: i % 4]],
+        "due": "2024-06-01T12:00:00.000Z" if i % 3 == 0 else None,
+        "start": None,
+        "dueComplete": False,
+        "idChecklists": [f"c{card_id[1:]}"],
+        "idMembers": ["m" * 24],
+        "shortLink": f"abc{i}",
+        "badges": {"votes": 0, "comments": i % 5, "attachments": 0, "checkItems": 3},
+    }
+
+
+def make_checklist(card: dict) -> dict:
+    return {
+        "id": card["idChecklists"][0],
+        "name": "Checklist",
+        "idCard": card["id"],
+        "idBoard": BOARD_ID,
+        "pos": 16384.0,
+        "checkItems": [
+            {
+                "id": f"{card['id'][:-1]}{n}",
+                "name": f"Step {n}",
+                "state": "complete" if n == 0 else "incomplete",
+                "idChecklist": card["idChecklists"][0],
+                "pos": 16384.0 * n,
+            }
+            for n in range(3)
+        ],
+    }
+
+
+def make_board() -> dict:
+    lists = [
+        {"id": f"{n:024x}", "name": f"List {n}", "closed": False, "idBoard": BOARD_ID, "pos": 16384.0 * n}
+        for n in range(LIST_COUNT)
+    ]
+    cards = [make_card(n, i) for n in range(LIST_COUNT) for i in range(CARDS_PER_LIST)]
+    return {
+        "id": BOARD_ID,
+        "name": "Benchmark board",
+        "url": "https://trello.com/b/bench",
+        "labels": LABELS,
+        "lists": lists,
+        "cards": cards,
+        "checklists": [make_checklist(card) for card in cards],
+    }
+
+
+def measure(func) -> list[float]:
+    timings = []
+    for _ in range(ROUNDS):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    board = make_board()
+    codecs = [StdlibCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed; only the stdlib codec is measured")
+    payload = StdlibCodec().dumps(board)
+    print(
+        f"Board with {len(board['cards'])} cards, {len(payload) / 1024:.0f} KiB,"
+        f" median of {ROUNDS} rounds"
+    )
+    medians = {}
+    for codec in codecs:
+        for operation, func in (
+            ("decode", lambda: codec.loads(payload)),
+            ("encode", lambda: codec.dumps(board)),
+        ):
+            timings = measure(func)
+            medians[codec.name, operation] = statistics.median(timings)
+            print(
+                f"  {codec.name:7} {operation}  median {medians[codec.name, operation]:7.1f} ms"
+                f"  min {min(timings):7.1f} ms"
+            )
+    if len(codecs) > 1:
+        for operation in ("decode", "encode"):
+            ratio = medians["stdlib", operation] / medians["orjson", operation]
+            print(f"  orjson {operation} speed-up: {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
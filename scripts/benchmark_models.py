@@ -0,0 +1,90 @@
+"""
+Compares strict and trusted model construction on a 5,000-card list.
+
+Strict mode builds each TrelloCard on its own; trusted mode validates the
+whole list with one cached TypeAdapter. Both fully validate every card, so
+the difference is only per-item call overhead.
+
+Run from the repository root:
+    python scripts/benchmark_models.py
+"""
+
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from server.models import (  # noqa: E402
+    STRICT,
+    TRUSTED,
+    TrelloCard,
+    parse_models,
+    set_validation_mode,
+)
+
+CARD_COUNT = 5000
+ROUNDS = 15
+
+
+def make_card(i: int) -> dict:
+    """Builds a card payload shaped like Trello's default /lists/{id}/cards fields."""
+    return {
+        "id": f"{0x60000000 + i:08x}{i:016x}",
+        "name": f"Card {i}",
+        "desc": "Lorem ipsum dolor sit amet. " * 8,
+        "closed": False,
+        "idList": "6" * 24,
+        "idBoard": "5" * 24,
+        "url": f"https://trello.com/c/abc{i}/card-{i}",
+        "pos": 16384.0 * i,
+        "dateLastActivity": "2024-05-01T12:34:56.789Z",
+        "labels": [
+            {"id": "l1" * 12, "idBoard": "5" * 24, "name": "Bug", "color": "red"},
+            {"id": "l2" * 12, "idBoard": "5" * 24, "name": "UX", "color": "blue"},
+        ],
+        "idLabels": ["l1" * 12, "l2" * 12],
+        "due": "2024-06-01T12:00:00.000Z",
+        "start": None,
+        "dueComplete": False,
+        "idChecklists": ["c" * 24],
+        "idMembers": ["m" * 24],
+        "shortLink": f"abc{i}",
+        "idAttachmentCover": None,
+        "cover": {"color": None, "size": "normal", "brightness": "dark"},
+        "badges": {"votes": 0, "comments": 3, "attachments": 1, "checkItems": 4},
+        "subscribed": False,
+    }
+
+
+def measure(mode: str, payload: bytes) -> list[float]:
+    set_validation_mode(mode)
+    timings = []
+    for _ in range(ROUNDS):
+        items = json.loads(payload)
+        gc.collect()
+        start = time.perf_counter()
+        parse_models(TrelloCard, items)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    payload = json.dumps([make_card(i) for i in range(CARD_COUNT)]).encode()
+    print(f"Building {CARD_COUNT} TrelloCard models, median of {ROUNDS} rounds")
+    results = {mode: measure(mode, payload) for mode in (STRICT, TRUSTED)}
+    set_validation_mode(STRICT)
+    for mode, timings in results.items():
+        print(
+            f"  {mode:8} median {statistics.median(timings):7.1f} ms"
+            f"  min {min(timings):7.1f} ms"
+        )
+    ratio = statistics.median(results[TRUSTED]) / statistics.median(results[STRICT])
+    print(f"  trusted/strict: {ratio:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class CreateCardPayload(BaseModel):
+    """
+    Payload for creating a card.
+
+    Attributes:
+        name (str): The name of the card.
+        list_id (str): The ID of the list to create the card in; defaults to the list given to the tool.
+        desc (str): The description of the card.
+        labels (List[str]): The IDs of the labels to add to the card.
+        members (List[str]): The IDs of the members to assign to the card.
+        due (str): The due date of the card in ISO 8601 format.
+        pos (str | float): The position of the card: "top", "bottom" or a number.
+    """
+
+    name: str
+    list_id: str | None = None
+    desc: str | None = None
+    labels: List[str] | None = None
+    members: List[str] | None = None
+    due: str | None = None
+    pos: str | float | None = None
@@ -32,4 +32,17 @@ async def health_check(request: Request) -> JSONResponse:
             {"status": "unhealthy", "reason": f"Trello API error: {str(e)}"},
             status_code=HTTP_503_SERVICE_UNAVAILABLE
         )
-    return JSONResponse({"status": "healthy", "trello_connection": "ok", "version": "1.0.0"}) 
\ No newline at end of file
+    return JSONResponse({"status": "healthy", "trello_connection": "ok", "version": "1.0.0"}) 
+
+
+@mcp.custom_route("/stats", methods=["GET"])
+async def stats(request: Request) -> JSONResponse:
+    # Runtime counters of the shared Trello client, useful for tuning limits
+    from server.trello import client, snapshot_disk_cache
+
+    return JSONResponse(
+        {
+            **client.stats(),
+            "snapshot_disk_cache": snapshot_disk_cache.stats() if snapshot_disk_cache else None,
+        }
+    )
@@ -1,3 +1,23 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from mcp.server.fastmcp import FastMCP
 
-mcp = FastMCP("Trello MCP Server") 
\ No newline at end of file
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """Warms up the shared Trello client and starts background board sync when the MCP server starts."""
+    from server.config import settings
+    from server.trello import client
+
+    if settings.TRELLO_HTTP_WARMUP:
+        await client.warm_up()
+    if settings.TRELLO_SYNC_INTERVAL > 0:
+        from server.tools.snapshot import sync
+
+        # Runs once per process, however many sessions open
+        sync.start(settings.TRELLO_SYNC_INTERVAL)
+    yield {}
+
+
+mcp = FastMCP("Trello MCP Server", lifespan=lifespan)
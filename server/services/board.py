@@ -2,9 +2,10 @@
 Service for managing Trello boards in MCP server.
 """
 
-from typing import List
+from typing import Any, AsyncIterator, Dict, List
 
-from server.models import TrelloBoard
+from server.models import TrelloBoard, parse_model, parse_models
+from server.utils.fields import field_params
 from server.utils.trello_api import TrelloClient
 
 
@@ -16,26 +17,69 @@ class BoardService:
     def __init__(self, client: TrelloClient):
         self.client = client
 
-    async def get_board(self, board_id: str) -> TrelloBoard:
+    async def get_board(
+        self, board_id: str, fields: str | List[str] | None = None
+    ) -> TrelloBoard:
         """Retrieves a specific board by its ID.
 
         Args:
             board_id (str): The ID of the board to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
 
         Returns:
             TrelloBoard: The board object containing board details.
         """
-        response = await self.client.GET(f"/boards/{board_id}")
-        return TrelloBoard(**response)
+        response = await self.client.GET(
+            f"/boards/{board_id}", params=field_params(TrelloBoard, fields)
+        )
+        return parse_model(TrelloBoard, response)
 
-    async def get_boards(self, member_id: str = "me") -> List[TrelloBoard]:
+    async def get_boards(
+        self, member_id: str = "me", fields: str | List[str] | None = None
+    ) -> List[TrelloBoard]:
         """Retrieves all boards for a given member.
 
         Args:
             member_id (str): The ID of the member whose boards to retrieve. Defaults to "me" for the authenticated user.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
 
         Returns:
             List[TrelloBoard]: A list of board objects.
         """
-        response = await self.client.GET(f"/members/{member_id}/boards")
-        return [TrelloBoard(**board) for board in response]
+        response = await self.client.GET(
+            f"/members/{member_id}/boards", params=field_params(TrelloBoard, fields)
+        )
+        return parse_models(TrelloBoard, response)
+
+    async def iter_actions(
+        self,
+        board_id: str,
+        since: str | None = None,
+        filter: str | None = None,
+        page_size: int = 50,
+        max_items: int | None = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterates over a board's actions, newest first, fetching pages as needed.
+
+        Args:
+            board_id (str): The ID of the board whose actions to retrieve.
+            since (str, optional): Only return actions after this action ID or ISO 8601 date.
+            filter (str, optional): Comma-separated action types to return, e.g. "createCard,updateCard".
+            page_size (int): Actions fetched per request. Defaults to 50.
+            max_items (int, optional): Maximum number of actions to return.
+
+        Yields:
+            Dict[str, Any]: Each action.
+        """
+        params = {}
+        if since:
+            params["since"] = since
+        if filter:
+            params["filter"] = filter
+        async for action in self.client.paginate(
+            f"/boards/{board_id}/actions",
+            params=params,
+            page_size=page_size,
+            max_items=max_items,
+        ):
+            yield action
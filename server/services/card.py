@@ -2,11 +2,18 @@
 Service for managing Trello cards in MCP server.
 """
 
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from urllib.parse import quote
 
-from server.models import TrelloCard
+from server.models import TrelloCard, TrelloCardDetail, TrelloMember, parse_model, parse_models
+from server.utils.concurrency import FanOutResult, gather_bounded
+from server.utils.fields import field_params, projection
+from server.utils.query import CardQuery
 from server.utils.trello_api import TrelloClient
 
+# Gap Trello leaves between the positions of consecutive cards
+POSITION_STEP = 65536.0
+
 
 class CardService:
     """
@@ -16,29 +23,121 @@ class CardService:
     def __init__(self, client: TrelloClient):
         self.client = client
 
-    async def get_card(self, card_id: str) -> TrelloCard:
+    async def get_card(
+        self, card_id: str, fields: str | List[str] | None = None
+    ) -> TrelloCard:
         """Retrieves a specific card by its ID.
 
         Args:
             card_id (str): The ID of the card to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
 
         Returns:
             TrelloCard: The card object containing card details.
         """
-        response = await self.client.GET(f"/cards/{card_id}")
-        return TrelloCard(**response)
+        response = await self.client.GET(
+            f"/cards/{card_id}", params=field_params(TrelloCard, fields)
+        )
+        return parse_model(TrelloCard, response)
+
+    async def get_card_details(
+        self,
+        card_id: str,
+        fields: str | List[str] | None = None,
+        actions_limit: int = 0,
+    ) -> TrelloCardDetail:
+        """Retrieves a card with its checklists, attachments, members and recent actions in one request.
 
-    async def get_cards(self, list_id: str) -> List[TrelloCard]:
+        Args:
+            card_id (str): The ID of the card to retrieve.
+            fields (str | List[str], optional): Trello fields of the card to return, or "all". Required fields are always included. Defaults to Trello's default set.
+            actions_limit (int): Number of most recent actions to include. Defaults to 0, none.
+
+        Returns:
+            TrelloCardDetail: The card and its nested resources.
+        """
+        params = {
+            **(field_params(TrelloCard, fields) or {}),
+            "checklists": "all",
+            "attachments": "true",
+            "members": "true",
+            "member_fields": ",".join(TrelloMember.model_fields),
+        }
+        if actions_limit:
+            params["actions"] = "all"
+            params["actions_limit"] = str(actions_limit)
+        response = await self.client.GET(f"/cards/{card_id}", params=params)
+        return parse_model(TrelloCardDetail, response)
+
+    async def get_cards(
+        self,
+        list_id: str,
+        fields: str | List[str] | None = None,
+        query: CardQuery | None = None,
+    ) -> List[TrelloCard]:
         """Retrieves all cards in a given list.
 
         Args:
             list_id (str): The ID of the list whose cards to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
+            query (CardQuery, optional): Filters to apply, pushed down to Trello where it supports them.
 
         Returns:
             List[TrelloCard]: A list of card objects.
         """
-        response = await self.client.GET(f"/lists/{list_id}/cards")
-        return [TrelloCard(**card) for card in response]
+        query = query or CardQuery()
+        params = {**(field_params(TrelloCard, fields) or {}), **query.params()}
+        response = await self.client.GET(query.path(list_id), params=params or None)
+        return query.apply(parse_models(TrelloCard, response))
+
+    async def iter_cards(
+        self, list_id: str, fields: str | List[str] | None = None
+    ) -> AsyncIterator[TrelloCard]:
+        """Streams the cards in a given list, parsing each one as it arrives.
+
+        Args:
+            list_id (str): The ID of the list whose cards to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
+
+        Yields:
+            TrelloCard: Each card object, in list order.
+        """
+        async for card in self.client.iter_array(
+            f"/lists/{list_id}/cards", params=field_params(TrelloCard, fields)
+        ):
+            yield parse_model(TrelloCard, card)
+
+    async def get_cards_by_ids(
+        self,
+        card_ids: List[str],
+        fields: str | List[str] | None = None,
+        query: CardQuery | None = None,
+    ) -> Tuple[List[TrelloCard], Dict[str, str]]:
+        """Retrieves a set of cards by ID using Trello's batch endpoint.
+
+        Args:
+            card_ids (List[str]): The IDs of the cards to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
+            query (CardQuery, optional): Filters to apply to the fetched cards. Batch routes take no filters, so they are applied locally.
+
+        Returns:
+            Tuple[List[TrelloCard], Dict[str, str]]: The cards that were found, in
+                request order, and an error message for each ID that failed.
+        """
+        # Batch routes are comma-separated, so commas inside a route are escaped
+        route_query = f"?fields={quote(projection(TrelloCard, fields), safe='')}" if fields else ""
+        results = await self.client.BATCH(
+            [f"/cards/{card_id}{route_query}" for card_id in card_ids]
+        )
+        cards, errors = [], {}
+        for card_id, (status, body) in zip(card_ids, results):
+            if status == 200:
+                cards.append(parse_model(TrelloCard, body))
+            else:
+                errors[card_id] = f"HTTP {status}: {body}" if status else str(body)
+        if query is not None:
+            cards = query.apply(cards, pushed=False)
+        return cards, errors
 
     async def create_card(
         self, list_id: str, name: str, desc: str | None = None
@@ -57,7 +156,44 @@ class CardService:
         if desc:
             data["desc"] = desc
         response = await self.client.POST("/cards", data=data)
-        return TrelloCard(**response)
+        return parse_model(TrelloCard, response)
+
+    async def create_cards(
+        self, cards: List[Dict[str, Any]]
+    ) -> FanOutResult[Dict[str, Any], TrelloCard]:
+        """Creates several cards concurrently, keeping their order within each list.
+
+        Requests are bounded by the fan-out limit and go through the client's rate
+        limiter. Cards without a `pos` are given increasing positions after the
+        last card of their list, so they land in the requested order even though
+        they are created concurrently.
+
+        Args:
+            cards (List[Dict[str, Any]]): Trello card fields per card, each with at least `idList` and `name`.
+
+        Returns:
+            FanOutResult[Dict[str, Any], TrelloCard]: The created card or the error for each card, in request order.
+        """
+        cards = [dict(data) for data in cards]
+        unplaced: Dict[str, List[Dict[str, Any]]] = {}
+        for data in cards:
+            if data.get("pos") is None and data.get("idList"):
+                unplaced.setdefault(data["idList"], []).append(data)
+        lists = await gather_bounded(
+            unplaced, lambda list_id: self.get_cards(list_id, fields=["pos"])
+        )
+        for list_id, outcome in zip(lists.items, lists.outcomes):
+            if isinstance(outcome, BaseException):
+                # Still created, at the bottom, in whatever order the requests complete
+                continue
+            last = max((card.pos for card in outcome), default=0.0)
+            for offset, data in enumerate(unplaced[list_id], start=1):
+                data["pos"] = last + POSITION_STEP * offset
+
+        async def create(data: Dict[str, Any]) -> TrelloCard:
+            return parse_model(TrelloCard, await self.client.POST("/cards", data=data))
+
+        return await gather_bounded(cards, create)
 
     async def update_card(self, card_id: str, **kwargs) -> TrelloCard:
         """Updates a card's attributes.
@@ -70,7 +206,7 @@ class CardService:
             TrelloCard: The updated card object.
         """
         response = await self.client.PUT(f"/cards/{card_id}", data=kwargs)
-        return TrelloCard(**response)
+        return parse_model(TrelloCard, response)
 
     async def delete_card(self, card_id: str) -> Dict[str, Any]:
         """Deletes a card.
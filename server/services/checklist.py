@@ -1,6 +1,7 @@
 import logging
 from typing import Dict, List, Optional
 
+from server.models import TrelloCheckItem, TrelloChecklist, parse_model, parse_models
 from server.utils.trello_api import TrelloClient
 
 logger = logging.getLogger(__name__)
@@ -14,7 +15,7 @@ class ChecklistService:
     def __init__(self, client: TrelloClient):
         self.client = client
 
-    async def get_checklist(self, checklist_id: str) -> Dict:
+    async def get_checklist(self, checklist_id: str) -> TrelloChecklist:
         """
         Get a specific checklist by ID.
 
@@ -22,11 +23,12 @@ class ChecklistService:
             checklist_id (str): The ID of the checklist to retrieve
 
         Returns:
-            Dict: The checklist data
+            TrelloChecklist: The checklist and its items
         """
-        return await self.client.GET(f"/checklists/{checklist_id}")
+        response = await self.client.GET(f"/checklists/{checklist_id}")
+        return parse_model(TrelloChecklist, response)
 
-    async def get_card_checklists(self, card_id: str) -> List[Dict]:
+    async def get_card_checklists(self, card_id: str) -> List[TrelloChecklist]:
         """
         Get all checklists for a specific card.
 
@@ -34,13 +36,14 @@ class ChecklistService:
             card_id (str): The ID of the card to get checklists for
 
         Returns:
-            List[Dict]: List of checklists on the card
+            List[TrelloChecklist]: List of checklists on the card
         """
-        return await self.client.GET(f"/cards/{card_id}/checklists")
+        response = await self.client.GET(f"/cards/{card_id}/checklists")
+        return parse_models(TrelloChecklist, response)
 
     async def create_checklist(
         self, card_id: str, name: str, pos: Optional[str] = None
-    ) -> Dict:
+    ) -> TrelloChecklist:
         """
         Create a new checklist on a card.
 
@@ -50,16 +53,17 @@ class ChecklistService:
             pos (Optional[str]): The position of the checklist (top, bottom, or a positive number)
 
         Returns:
-            Dict: The created checklist data
+            TrelloChecklist: The created checklist
         """
         data = {"name": name}
         if pos:
             data["pos"] = pos
-        return await self.client.POST("/checklists", data={"idCard": card_id, **data})
+        response = await self.client.POST("/checklists", data={"idCard": card_id, **data})
+        return parse_model(TrelloChecklist, response)
 
     async def update_checklist(
         self, checklist_id: str, name: Optional[str] = None, pos: Optional[str] = None
-    ) -> Dict:
+    ) -> TrelloChecklist:
         """
         Update an existing checklist.
 
@@ -69,14 +73,15 @@ class ChecklistService:
             pos (Optional[str]): New position for the checklist
 
         Returns:
-            Dict: The updated checklist data
+            TrelloChecklist: The updated checklist
         """
         data = {}
         if name:
             data["name"] = name
         if pos:
             data["pos"] = pos
-        return await self.client.PUT(f"/checklists/{checklist_id}", data=data)
+        response = await self.client.PUT(f"/checklists/{checklist_id}", data=data)
+        return parse_model(TrelloChecklist, response)
 
     async def delete_checklist(self, checklist_id: str) -> Dict:
         """
@@ -96,7 +101,7 @@ class ChecklistService:
         name: str,
         checked: bool = False,
         pos: Optional[str] = None,
-    ) -> Dict:
+    ) -> TrelloCheckItem:
         """
         Add a new item to a checklist.
 
@@ -107,14 +112,15 @@ class ChecklistService:
             pos (Optional[str]): The position of the item
 
         Returns:
-            Dict: The created checkitem data
+            TrelloCheckItem: The created checkitem
         """
         data = {"name": name, "checked": checked}
         if pos:
             data["pos"] = pos
-        return await self.client.POST(
+        response = await self.client.POST(
             f"/checklists/{checklist_id}/checkItems", data=data
         )
+        return parse_model(TrelloCheckItem, response)
 
     async def update_checkitem(
         self,
@@ -123,7 +129,7 @@ class ChecklistService:
         name: Optional[str] = None,
         checked: Optional[bool] = None,
         pos: Optional[str] = None,
-    ) -> Dict:
+    ) -> TrelloCheckItem:
         """
         Update a checkitem in a checklist.
 
@@ -135,7 +141,7 @@ class ChecklistService:
             pos (Optional[str]): New position for the item
 
         Returns:
-            Dict: The updated checkitem data
+            TrelloCheckItem: The updated checkitem
         """
         data = {}
         if name:
@@ -144,9 +150,10 @@ class ChecklistService:
             data["checked"] = checked
         if pos:
             data["pos"] = pos
-        return await self.client.PUT(
+        response = await self.client.PUT(
             f"/checklists/{checklist_id}/checkItems/{checkitem_id}", data=data
         )
+        return parse_model(TrelloCheckItem, response)
 
     async def delete_checkitem(self, checklist_id: str, checkitem_id: str) -> Dict:
         """
@@ -1,6 +1,7 @@
-from typing import List
+from typing import AsyncIterator, List
 
-from server.models import TrelloList
+from server.models import TrelloList, parse_model, parse_models
+from server.utils.fields import field_params
 from server.utils.trello_api import TrelloClient
 
 
@@ -13,29 +14,56 @@ class ListService:
         self.client = client
 
     # Lists
-    async def get_list(self, list_id: str) -> TrelloList:
+    async def get_list(
+        self, list_id: str, fields: str | List[str] | None = None
+    ) -> TrelloList:
         """Retrieves a specific list by its ID.
 
         Args:
             list_id (str): The ID of the list to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
 
         Returns:
             TrelloList: The list object containing list details.
         """
-        response = await self.client.GET(f"/lists/{list_id}")
-        return TrelloList(**response)
+        response = await self.client.GET(
+            f"/lists/{list_id}", params=field_params(TrelloList, fields)
+        )
+        return parse_model(TrelloList, response)
 
-    async def get_lists(self, board_id: str) -> List[TrelloList]:
+    async def get_lists(
+        self, board_id: str, fields: str | List[str] | None = None
+    ) -> List[TrelloList]:
         """Retrieves all lists on a given board.
 
         Args:
             board_id (str): The ID of the board whose lists to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
 
         Returns:
             List[TrelloList]: A list of list objects.
         """
-        response = await self.client.GET(f"/boards/{board_id}/lists")
-        return [TrelloList(**list_data) for list_data in response]
+        response = await self.client.GET(
+            f"/boards/{board_id}/lists", params=field_params(TrelloList, fields)
+        )
+        return parse_models(TrelloList, response)
+
+    async def iter_lists(
+        self, board_id: str, fields: str | List[str] | None = None
+    ) -> AsyncIterator[TrelloList]:
+        """Streams the lists on a given board, parsing each one as it arrives.
+
+        Args:
+            board_id (str): The ID of the board whose lists to retrieve.
+            fields (str | List[str], optional): Trello fields to return, or "all". Required fields are always included. Defaults to Trello's default set.
+
+        Yields:
+            TrelloList: Each list object, in board order.
+        """
+        async for list_data in self.client.iter_array(
+            f"/boards/{board_id}/lists", params=field_params(TrelloList, fields)
+        ):
+            yield parse_model(TrelloList, list_data)
 
     async def create_list(
         self, board_id: str, name: str, pos: str = "bottom"
@@ -52,7 +80,7 @@ class ListService:
         """
         data = {"name": name, "idBoard": board_id, "pos": pos}
         response = await self.client.POST("/lists", data=data)
-        return TrelloList(**response)
+        return parse_model(TrelloList, response)
 
     async def update_list(self, list_id: str, name: str) -> TrelloList:
         """Updates the name of a list.
@@ -65,7 +93,7 @@ class ListService:
             TrelloList: The updated list object.
         """
         response = await self.client.PUT(f"/lists/{list_id}", data={"name": name})
-        return TrelloList(**response)
+        return parse_model(TrelloList, response)
 
     async def delete_list(self, list_id: str) -> TrelloList:
         """Archives a list.
@@ -79,4 +107,4 @@ class ListService:
         response = await self.client.PUT(
             f"/lists/{list_id}/closed", data={"value": "true"}
         )
-        return TrelloList(**response)
+        return parse_model(TrelloList, response)
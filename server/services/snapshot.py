@@ -0,0 +1,103 @@
+"""
+Service for loading whole Trello boards in one request.
+"""
+
+from typing import Any, Dict
+
+from server.models import BoardSnapshot, parse_model
+from server.utils.disk_cache import SnapshotDiskCache
+from server.utils.snapshot_store import BoardSnapshotStore
+from server.utils.trello_api import TrelloClient
+
+# Trello's default board fields, plus the version used by the disk cache
+SNAPSHOT_FIELDS = "name,desc,descData,closed,idOrganization,pinned,url,shortUrl,prefs,labelNames,dateLastActivity"
+# Nested resources returned with the board, instead of one request per list and card
+SNAPSHOT_PARAMS = {
+    "fields": SNAPSHOT_FIELDS,
+    "lists": "open",
+    "cards": "open",
+    "checklists": "all",
+    "labels": "all",
+    "members": "all",
+}
+SNAPSHOT_COLLECTIONS = ("lists", "cards", "checklists", "labels", "members")
+
+
+class BoardSnapshotService:
+    """
+    Service class for loading and reusing whole-board snapshots.
+    """
+
+    def __init__(
+        self,
+        client: TrelloClient,
+        store: BoardSnapshotStore | None = None,
+        disk_cache: SnapshotDiskCache | None = None,
+    ):
+        self.client = client
+        self.store = store if store is not None else BoardSnapshotStore()
+        # Optional on-disk copy of board payloads, reused after restarts
+        self.disk_cache = disk_cache
+
+    async def load_snapshot(self, board_id: str, fresh: bool = False) -> BoardSnapshot:
+        """Fetches a board with its open lists and cards, checklists, labels and members.
+
+        Args:
+            board_id (str): The ID of the board to load.
+            fresh (bool): Bypass the client's response cache. Defaults to False.
+
+        Returns:
+            BoardSnapshot: The board and its contents, also kept in the snapshot store.
+        """
+        response = await self.client.GET(
+            f"/boards/{board_id}", params=SNAPSHOT_PARAMS, fresh=fresh
+        )
+        snapshot = self._build(response)
+        if self.disk_cache is not None:
+            await self.disk_cache.save(board_id, response.get("dateLastActivity"), response)
+        return snapshot
+
+    async def get_snapshot(
+        self, board_id: str, max_age: float | None = None, fresh: bool = False
+    ) -> BoardSnapshot:
+        """Returns the stored snapshot of a board, loading it if missing or stale.
+
+        Args:
+            board_id (str): The ID of the board.
+            max_age (float, optional): Maximum age in seconds of a stored snapshot. Defaults to the store's setting.
+            fresh (bool): Bypass the client's response cache when loading. Defaults to False.
+
+        Returns:
+            BoardSnapshot: The board and its contents.
+        """
+        snapshot = self.store.get(board_id, max_age)
+        if snapshot is None and self.disk_cache is not None:
+            snapshot = await self._load_from_disk(board_id)
+        if snapshot is None:
+            snapshot = await self.load_snapshot(board_id, fresh=fresh)
+        return snapshot
+
+    async def _load_from_disk(self, board_id: str) -> BoardSnapshot | None:
+        """Reuses the on-disk payload of a board if its version is still current."""
+        entry = await self.disk_cache.load(board_id)
+        if entry is None:
+            return None
+        version, payload = entry
+        # Only the version is fetched, instead of the whole board, and never from the response cache
+        current = await self.client.GET(
+            f"/boards/{board_id}", params={"fields": "dateLastActivity"}, fresh=True
+        )
+        if current.get("dateLastActivity") != version:
+            return None
+        return self._build(payload)
+
+    def _build(self, response: Dict[str, Any]) -> BoardSnapshot:
+        snapshot = parse_model(
+            BoardSnapshot,
+            {
+                "board": response,
+                **{name: response.get(name) or [] for name in SNAPSHOT_COLLECTIONS},
+            },
+        )
+        self.store.put(snapshot)
+        return snapshot
@@ -0,0 +1,384 @@
+"""
+Service for keeping board snapshots up to date from the board actions feed.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List
+
+from server.models import (
+    BoardSnapshot,
+    BoardSyncResult,
+    TrelloBoard,
+    TrelloCard,
+    TrelloChecklist,
+    TrelloLabel,
+    TrelloList,
+    parse_model,
+)
+from server.services.board import BoardService
+from server.services.snapshot import BoardSnapshotService
+from server.utils.snapshot_store import BoardSnapshotStore
+from server.utils.trello_api import TrelloClient
+
+logger = logging.getLogger(__name__)
+
+# Beyond this many new actions a full resync is cheaper than replaying them
+MAX_DELTA_ACTIONS = 500
+
+# Boards whose webhook has delivered nothing for this many sync intervals are polled again
+WEBHOOK_SILENCE_INTERVALS = 10
+
+# Actions whose effect is picked up by refetching the card they name
+CARD_ACTIONS = {
+    "createCard",
+    "updateCard",
+    "copyCard",
+    "moveCardToBoard",
+    "convertToCardFromCheckItem",
+    "emailCard",
+    "addLabelToCard",
+    "removeLabelFromCard",
+    "addMemberToCard",
+    "removeMemberFromCard",
+    "addAttachmentToCard",
+    "deleteAttachmentFromCard",
+    "commentCard",
+    "updateComment",
+    "deleteComment",
+}
+CARD_REMOVAL_ACTIONS = {"deleteCard", "moveCardFromBoard"}
+CHECKLIST_ACTIONS = {
+    "addChecklistToCard",
+    "updateChecklist",
+    "createCheckItem",
+    "updateCheckItem",
+    "deleteCheckItem",
+}
+LIST_ACTIONS = {"createList", "updateList", "moveListToBoard"}
+LIST_REMOVAL_ACTIONS = {"moveListFromBoard"}
+LABEL_ACTIONS = {"createLabel", "updateLabel"}
+BOARD_ACTIONS = {"updateBoard"}
+
+# Snapshot collections refreshed through /batch, with their model and endpoint
+REFRESHED = {
+    "cards": (TrelloCard, "/cards"),
+    "checklists": (TrelloChecklist, "/checklists"),
+    "lists": (TrelloList, "/lists"),
+    "labels": (TrelloLabel, "/labels"),
+}
+
+
+class ResyncNeeded(Exception):
+    """Raised when the actions feed cannot be applied and the board must be reloaded."""
+
+
+class BoardSyncService:
+    """
+    Service class keeping board mirrors up to date from `/boards/{id}/actions`.
+
+    Each synced board keeps a mirror snapshot and the ID of the newest action
+    it reflects. A sync only fetches the actions since then and the entities
+    they touch, so its cost follows the rate of change, not the board size.
+    Unknown action types, a backlog larger than MAX_DELTA_ACTIONS or a failed
+    refetch fall back to a full resync.
+
+    Boards with a working webhook receive their actions through `receive`
+    and are left out of background polling, until the webhook has been
+    silent for WEBHOOK_SILENCE_INTERVALS sync intervals, e.g. because
+    Trello deactivated it.
+    """
+
+    def __init__(self, client: TrelloClient, snapshots: BoardSnapshotService):
+        self.client = client
+        self.snapshots = snapshots
+        self.boards = BoardService(client)
+        self.mirrors: Dict[str, BoardSnapshot] = {}
+        self.cursors: Dict[str, str | None] = {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+        # Board ID -> ID of the webhook pushing its actions
+        self.webhooks: Dict[str, str] = {}
+        # Board ID -> monotonic time of its webhook's registration or last delivery
+        self.webhook_seen: Dict[str, float] = {}
+        self.poller: asyncio.Task | None = None
+
+    @property
+    def store(self) -> BoardSnapshotStore:
+        return self.snapshots.store
+
+    async def get_snapshot(self, board_id: str, refresh: bool = False) -> BoardSnapshot:
+        """Returns a fresh snapshot of a board, syncing its mirror if needed.
+
+        Args:
+            board_id (str): The ID of the board.
+            refresh (bool): Reload the whole board instead of applying recent actions. Defaults to False.
+
+        Returns:
+            BoardSnapshot: The board and its contents.
+        """
+        if not refresh:
+            snapshot = self.store.get(board_id)
+            if snapshot is not None:
+                return snapshot
+            await self.sync_board(board_id)
+        else:
+            await self.resync(board_id)
+        return self.mirrors[board_id]
+
+    async def sync_board(self, board_id: str) -> BoardSyncResult:
+        """Brings a board's mirror up to date, incrementally when possible.
+
+        Args:
+            board_id (str): The ID of the board to sync.
+
+        Returns:
+            BoardSyncResult: How the board was synced.
+        """
+        async with self._lock(board_id):
+            snapshot = self.mirrors.get(board_id)
+            cursor = self.cursors.get(board_id)
+            if snapshot is None or cursor is None:
+                return await self._resync(board_id, "board is not mirrored yet")
+            actions = [
+                action
+                async for action in self.boards.iter_actions(
+                    board_id, since=cursor, page_size=100, max_items=MAX_DELTA_ACTIONS + 1
+                )
+            ]
+            if len(actions) > MAX_DELTA_ACTIONS:
+                return await self._resync(
+                    board_id, f"more than {MAX_DELTA_ACTIONS} actions since the last sync"
+                )
+            if not actions:
+                self.store.touch(snapshot)
+                return BoardSyncResult(board_id=board_id, mode="unchanged")
+            # The feed is newest first
+            actions.reverse()
+            try:
+                snapshot = await self._apply(snapshot, actions)
+            except ResyncNeeded as e:
+                return await self._resync(board_id, str(e))
+            self.mirrors[board_id] = snapshot
+            self.cursors[board_id] = actions[-1]["id"]
+            self.store.put(snapshot)
+            return BoardSyncResult(board_id=board_id, mode="incremental", actions=len(actions))
+
+    async def receive(
+        self, board_id: str, action: Dict[str, Any], webhook_id: str | None = None
+    ) -> BoardSyncResult | None:
+        """Applies an action pushed by a board webhook to the board's mirror.
+
+        Args:
+            board_id (str): The ID of the board the webhook watches.
+            action (Dict[str, Any]): The delivered action.
+            webhook_id (str, optional): The ID of the delivering webhook.
+
+        Returns:
+            BoardSyncResult | None: How the mirror was updated, or None if the board is not mirrored.
+        """
+        if webhook_id:
+            # A delivery proves the webhook works, even one registered before a restart
+            self.set_webhook(board_id, webhook_id)
+        async with self._lock(board_id):
+            snapshot = self.mirrors.get(board_id)
+            cursor = self.cursors.get(board_id)
+            if snapshot is None or cursor is None:
+                return None
+            # Trello IDs start with their creation time, so newer actions sort after the cursor
+            if action.get("id", "") <= cursor:
+                self.store.touch(snapshot)
+                return BoardSyncResult(board_id=board_id, mode="unchanged")
+            try:
+                snapshot = await self._apply(snapshot, [action])
+            except ResyncNeeded as e:
+                return await self._resync(board_id, str(e))
+            self.mirrors[board_id] = snapshot
+            self.cursors[board_id] = action["id"]
+            self.store.put(snapshot)
+            return BoardSyncResult(board_id=board_id, mode="incremental", actions=1)
+
+    def set_webhook(self, board_id: str, webhook_id: str):
+        """Records that a webhook pushes the board's actions, so polling skips it while it keeps delivering."""
+        self.webhooks[board_id] = webhook_id
+        self.webhook_seen[board_id] = time.monotonic()
+
+    def clear_webhook(self, board_id: str):
+        self.webhooks.pop(board_id, None)
+        self.webhook_seen.pop(board_id, None)
+
+    def webhook_healthy(self, board_id: str, max_silence: float) -> bool:
+        """Returns True if the board's webhook registered or delivered within the last `max_silence` seconds."""
+        seen = self.webhook_seen.get(board_id)
+        return (
+            board_id in self.webhooks
+            and seen is not None
+            and time.monotonic() - seen <= max_silence
+        )
+
+    async def resync(self, board_id: str) -> BoardSyncResult:
+        """Reloads a board's mirror in full."""
+        async with self._lock(board_id):
+            return await self._resync(board_id, "requested")
+
+    def start(self, interval: float):
+        """Starts syncing every mirrored board without a healthy webhook in the background every `interval` seconds."""
+        if self.poller is None or self.poller.done():
+            self.poller = asyncio.create_task(self._poll(interval))
+
+    async def stop(self):
+        if self.poller is not None:
+            self.poller.cancel()
+            try:
+                await self.poller
+            except asyncio.CancelledError:
+                pass
+            self.poller = None
+
+    def _lock(self, board_id: str) -> asyncio.Lock:
+        return self.locks.setdefault(board_id, asyncio.Lock())
+
+    async def _poll(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            for board_id in list(self.mirrors):
+                # A silent webhook may have been deactivated, so the board falls back to polling
+                if self.webhook_healthy(board_id, interval * WEBHOOK_SILENCE_INTERVALS):
+                    continue
+                try:
+                    await self.sync_board(board_id)
+                except Exception:
+                    logger.exception(f"Background sync of board {board_id} failed")
+
+    async def _resync(self, board_id: str, reason: str) -> BoardSyncResult:
+        logger.info(f"Full resync of board {board_id}: {reason}")
+        # The cursor is read first so actions racing the reload are replayed, not lost
+        newest = [
+            action async for action in self.boards.iter_actions(board_id, max_items=1)
+        ]
+        self.cursors[board_id] = newest[0]["id"] if newest else None
+        # A cached board payload may predate the cursor, and the changes in between would be lost
+        self.mirrors[board_id] = await self.snapshots.get_snapshot(
+            board_id, max_age=0, fresh=True
+        )
+        return BoardSyncResult(board_id=board_id, mode="full", reason=reason)
+
+    async def _apply(
+        self, snapshot: BoardSnapshot, actions: List[Dict[str, Any]]
+    ) -> BoardSnapshot:
+        """Applies actions, oldest first, to a copy of a snapshot.
+
+        The stored snapshot is shared with readers, so it is left untouched
+        in case the actions cannot be applied.
+        """
+        collections = {
+            name: {item.id: item for item in getattr(snapshot, name)} for name in REFRESHED
+        }
+        stale = {name: {} for name in REFRESHED}
+        board_stale = False
+        for action in actions:
+            kind = action.get("type")
+            data = action.get("data") or {}
+            try:
+                if kind in CARD_ACTIONS:
+                    stale["cards"][data["card"]["id"]] = True
+                elif kind in CARD_REMOVAL_ACTIONS:
+                    card_id = data["card"]["id"]
+                    collections["cards"].pop(card_id, None)
+                    stale["cards"].pop(card_id, None)
+                elif kind == "updateCheckItemStateOnCard":
+                    self._set_check_item_state(collections, stale, data)
+                elif kind in CHECKLIST_ACTIONS:
+                    stale["checklists"][data["checklist"]["id"]] = True
+                    stale["cards"][data["card"]["id"]] = True
+                elif kind == "removeChecklistFromCard":
+                    collections["checklists"].pop(data["checklist"]["id"], None)
+                    stale["checklists"].pop(data["checklist"]["id"], None)
+                    stale["cards"][data["card"]["id"]] = True
+                elif kind in LIST_ACTIONS:
+                    stale["lists"][data["list"]["id"]] = True
+                elif kind in LIST_REMOVAL_ACTIONS:
+                    collections["lists"].pop(data["list"]["id"], None)
+                    stale["lists"].pop(data["list"]["id"], None)
+                elif kind in LABEL_ACTIONS:
+                    stale["labels"][data["label"]["id"]] = True
+                elif kind == "deleteLabel":
+                    collections["labels"].pop(data["label"]["id"], None)
+                    stale["labels"].pop(data["label"]["id"], None)
+                elif kind in BOARD_ACTIONS:
+                    board_stale = True
+                else:
+                    raise ResyncNeeded(f"unknown action type {kind}")
+            except (KeyError, TypeError):
+                raise ResyncNeeded(f"unexpected data in {kind} action {action.get('id')}")
+
+        board = await self._refetch(snapshot, collections, stale, board_stale)
+        updated = snapshot.model_copy(
+            update={
+                "board": board or snapshot.board,
+                **{name: list(items.values()) for name, items in collections.items()},
+            }
+        )
+        updated.reindex()
+        return updated
+
+    @staticmethod
+    def _set_check_item_state(collections, stale, data: Dict[str, Any]):
+        checklist = collections["checklists"].get(data["checklist"]["id"])
+        item_id = data["checkItem"]["id"]
+        if checklist is not None and any(item.id == item_id for item in checklist.checkItems):
+            state = data["checkItem"]["state"]
+            # Copied rather than changed in place, as the items are shared with the stored snapshot
+            collections["checklists"][checklist.id] = checklist.model_copy(
+                update={
+                    "checkItems": [
+                        item.model_copy(update={"state": state}) if item.id == item_id else item
+                        for item in checklist.checkItems
+                    ]
+                }
+            )
+            return
+        # Not mirrored yet, e.g. added before this action: refetch the checklist
+        stale["checklists"][data["checklist"]["id"]] = True
+
+    async def _refetch(
+        self, snapshot: BoardSnapshot, collections, stale, board_stale: bool
+    ) -> TrelloBoard | None:
+        """Refetches the entities touched by the applied actions in as few requests as possible.
+
+        Returns:
+            TrelloBoard | None: The refetched board, if the board itself changed.
+        """
+        targets = [(name, item_id) for name, ids in stale.items() for item_id in ids]
+        urls = [f"{REFRESHED[name][1]}/{item_id}" for name, item_id in targets]
+        if board_stale:
+            urls.append(f"/boards/{snapshot.id}")
+        if not urls:
+            return None
+        results = await self.client.BATCH(urls)
+        for (name, item_id), (status, body) in zip(targets, results):
+            if isinstance(body, BaseException):
+                # A whole /batch call failed, which says nothing about this entity
+                raise ResyncNeeded(f"failed to refetch {name} {item_id}: {body}")
+            if status == 404:
+                collections[name].pop(item_id, None)
+            elif status != 200:
+                raise ResyncNeeded(f"failed to refetch {name} {item_id}: HTTP {status}")
+            elif self._belongs(name, body, snapshot.id):
+                collections[name][item_id] = parse_model(REFRESHED[name][0], body)
+            else:
+                collections[name].pop(item_id, None)
+        if board_stale:
+            status, body = results[-1]
+            if status != 200:
+                raise ResyncNeeded(f"failed to refetch board: HTTP {status}")
+            return parse_model(TrelloBoard, body)
+        return None
+
+    @staticmethod
+    def _belongs(name: str, body: Dict[str, Any], board_id: str) -> bool:
+        """Checks that a refetched entity still belongs in an open-items snapshot of the board."""
+        if body.get("idBoard", board_id) != board_id:
+            return False
+        # Snapshots hold open lists and cards only
+        return not (name in ("cards", "lists") and body.get("closed"))
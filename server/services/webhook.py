@@ -0,0 +1,69 @@
+"""
+Service for managing Trello webhooks in MCP server.
+"""
+
+from typing import Any, Dict, List
+
+from server.models import TrelloWebhook, parse_model, parse_models
+from server.utils.trello_api import TrelloClient
+
+
+class WebhookService:
+    """
+    Service class for managing Trello webhooks
+    """
+
+    def __init__(self, client: TrelloClient):
+        self.client = client
+
+    async def get_webhooks(self, board_id: str | None = None) -> List[TrelloWebhook]:
+        """Retrieves the webhooks registered by the authenticated member's tokens.
+
+        Args:
+            board_id (str, optional): Only return webhooks watching this board.
+
+        Returns:
+            List[TrelloWebhook]: A list of webhook objects.
+        """
+        # /tokens/{token}/webhooks would put the token in the URL, and so in logs
+        tokens = await self.client.GET("/members/me/tokens", params={"webhooks": "true"})
+        webhooks = parse_models(
+            TrelloWebhook,
+            [webhook for token in tokens for webhook in token.get("webhooks") or []],
+        )
+        if board_id is not None:
+            webhooks = [webhook for webhook in webhooks if webhook.idModel == board_id]
+        return webhooks
+
+    async def create_webhook(
+        self, board_id: str, callback_url: str, description: str | None = None
+    ) -> TrelloWebhook:
+        """Registers a webhook posting a board's actions to a callback URL.
+
+        Trello sends a HEAD request to the callback URL first and only creates
+        the webhook if it answers with 200.
+
+        Args:
+            board_id (str): The ID of the board to watch.
+            callback_url (str): The public URL Trello posts actions to.
+            description (str, optional): A description of the webhook. Defaults to None.
+
+        Returns:
+            TrelloWebhook: The newly created webhook object.
+        """
+        data = {"idModel": board_id, "callbackURL": callback_url}
+        if description:
+            data["description"] = description
+        response = await self.client.POST("/webhooks", data=data)
+        return parse_model(TrelloWebhook, response)
+
+    async def delete_webhook(self, webhook_id: str) -> Dict[str, Any]:
+        """Deletes a webhook.
+
+        Args:
+            webhook_id (str): The ID of the webhook to delete.
+
+        Returns:
+            Dict[str, Any]: The response from the delete operation.
+        """
+        return await self.client.DELETE(f"/webhooks/{webhook_id}")
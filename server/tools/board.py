@@ -3,7 +3,7 @@ This module contains tools for managing Trello boards.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 from mcp.server.fastmcp import Context
 
@@ -12,32 +12,51 @@ from server.services.board import BoardService
 from server.trello import client
 from server.mcp_instance import mcp
 from server.utils.decorators import mcp_tool
+from server.utils.serialization import OutputMode, format_result
 
 logger = logging.getLogger(__name__)
 
 service = BoardService(client)
 
+# Lean default projection: skips large blobs such as prefs and labelNames
+DEFAULT_BOARD_FIELDS = "id,name,desc,closed,idOrganization,url,shortUrl,dateLastActivity,shortLink"
+
 
 @mcp.tool()
 @mcp_tool
-async def get_board(context: Context, board_id: str) -> TrelloBoard:
+async def get_board(
+    context: Context,
+    board_id: str,
+    fields: Optional[str] = None,
+    output_mode: Optional[OutputMode] = None,
+) -> TrelloBoard:
     """Retrieves a specific board by its ID.
 
     Args:
         board_id (str): The ID of the board to retrieve.
+        fields (str, optional): Comma-separated Trello fields to return, or "all". Defaults to a lean set.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
 
     Returns:
         TrelloBoard: The board object containing board details.
     """
-    return await service.get_board(board_id)
+    board = await service.get_board(board_id, fields=fields or DEFAULT_BOARD_FIELDS)
+    return format_result(board, output_mode)
 
 
 @mcp.tool()
 @mcp_tool
-async def get_boards(context: Context) -> List[TrelloBoard]:
+async def get_boards(
+    context: Context, fields: Optional[str] = None, output_mode: Optional[OutputMode] = None
+) -> List[TrelloBoard]:
     """Retrieves all boards for the authenticated user.
 
+    Args:
+        fields (str, optional): Comma-separated Trello fields to return, or "all". Defaults to a lean set.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+
     Returns:
         List[TrelloBoard]: A list of board objects.
     """
-    return await service.get_boards()
+    boards = await service.get_boards(fields=fields or DEFAULT_BOARD_FIELDS)
+    return format_result(boards, output_mode)
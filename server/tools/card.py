@@ -4,75 +4,129 @@ This module contains tools for managing Trello cards.
 
 import logging
 from typing import List, Optional
-from datetime import datetime
 
 from mcp.server.fastmcp import Context
 
-from server.models import TrelloCard
+from server.models import CardCreationResult, Page, TrelloCard
 from server.services.card import CardService
 from server.trello import client
+from server.dtos.create_card import CreateCardPayload
 from server.dtos.update_card import UpdateCardPayload
 from server.mcp_instance import mcp
+from server.utils.concurrency import describe_error
 from server.utils.decorators import mcp_tool
+from server.utils.pagination import first_page, next_page
+from server.utils.query import CardQuery, parse_date
+from server.utils.serialization import OutputMode, format_result
 
 logger = logging.getLogger(__name__)
 
 service = CardService(client)
 
+# Lean default projection: skips badges, cover and other rarely used fields
+DEFAULT_CARD_FIELDS = (
+    "id,name,desc,closed,idList,idBoard,url,pos,dateLastActivity,labels,idLabels,"
+    "due,start,dueComplete,idChecklists,idMembers,shortLink"
+)
+
 
 @mcp.tool()
 @mcp_tool
-async def get_card(context: Context, card_id: str) -> TrelloCard:
-    """Retrieves a specific card by its ID.
+async def get_card(
+    context: Context,
+    card_id: str,
+    fields: Optional[str] = None,
+    output_mode: Optional[OutputMode] = None,
+    details: bool = False,
+    actions_limit: int = 0,
+) -> TrelloCard:
+    """Retrieves a specific card by its ID, optionally with its checklists, attachments, members and recent actions.
+
+    Prefer `details` over separate get_card_checklists calls: everything comes back in one request.
 
     Args:
         card_id (str): The ID of the card to retrieve.
+        fields (str, optional): Comma-separated Trello fields to return, or "all". Defaults to a lean set.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+        details (bool, optional): Also return the card's checklists, attachments and members. Defaults to False.
+        actions_limit (int, optional): Also return this many of the card's most recent actions, e.g. comments and moves. Implies `details`. Defaults to 0.
 
     Returns:
-        TrelloCard: The card object containing card details.
+        TrelloCard: The card object containing card details, plus `checklists`, `attachments`, `members` and `actions` when requested.
     """
-    return await service.get_card(card_id)
+    fields = fields or DEFAULT_CARD_FIELDS
+    if details or actions_limit:
+        card = await service.get_card_details(card_id, fields=fields, actions_limit=actions_limit)
+    else:
+        card = await service.get_card(card_id, fields=fields)
+    return format_result(card, output_mode)
 
 
 @mcp.tool()
 @mcp_tool
-async def get_cards(context: Context, list_id: str, from_date: Optional[str] = None, card_ids: Optional[List[str]] = None) -> List[TrelloCard]:
-    """Retrieves all cards in a given list, or a specific set of cards by ID, optionally filtered by creation or last activity date.
+async def get_cards(
+    context: Context,
+    list_id: str,
+    from_date: Optional[str] = None,
+    card_ids: Optional[List[str]] = None,
+    fields: Optional[str] = None,
+    output_mode: Optional[OutputMode] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None,
+    max_cards: Optional[int] = None,
+) -> List[TrelloCard] | Page[TrelloCard]:
+    """Retrieves all cards in a given list, or a specific set of cards by ID, optionally filtered by status, creation or last activity date.
+
+    Filters are passed on to Trello where its API supports them, so fewer cards are downloaded.
+
+    With `limit` or `cursor` the result is paginated: a page of cards is returned with the total count and a
+    `next_cursor`. Later pages are served from a short-lived snapshot of the first request, so pass the same
+    list_id with the cursor; the other filters are taken from the first request.
 
     Args:
         list_id (str): The ID of the list whose cards to retrieve.
         from_date (str, optional): ISO 8601 date string. Only cards created or updated on/after this date are returned.
         card_ids (List[str], optional): List of card IDs to fetch. If provided, only these cards are returned.
+        fields (str, optional): Comma-separated Trello fields to return, or "all". Defaults to a lean set.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+        limit (int, optional): Maximum number of cards per page. Enables pagination.
+        cursor (str, optional): The `next_cursor` of the previous page.
+        status (str, optional): "open", "closed" or "all". Defaults to open cards for a list and any status for card_ids.
+        created_after (str, optional): ISO 8601 date string. Only cards created on/after this date are returned.
+        created_before (str, optional): ISO 8601 date string. Only cards created before this date are returned.
+        max_cards (int, optional): Maximum number of cards to retrieve.
 
     Returns:
-        List[TrelloCard]: A list of card objects.
+        List[TrelloCard] | Page[TrelloCard]: A list of card objects, or one page of them when paginating.
     """
-    if card_ids:
-        cards = []
-        for card_id in card_ids:
-            try:
-                card = await service.get_card(card_id)
-                cards.append(card)
-            except Exception as e:
-                await context.error(f"Failed to fetch card {card_id}: {str(e)}")
-        result = cards
+    scope = f"cards:{list_id}"
+    if cursor:
+        return format_result(next_page(scope, cursor, limit), output_mode, wrap=True)
+    try:
+        query = CardQuery(
+            status=status,
+            created_since=parse_date(created_after) if created_after else None,
+            created_before=parse_date(created_before) if created_before else None,
+            active_since=parse_date(from_date) if from_date else None,
+            limit=max_cards,
+        )
+    except ValueError as e:
+        await context.error(f"Invalid card filter: {e}. Use ISO 8601 format for dates.")
+        result = []
     else:
-        result = await service.get_cards(list_id)
-    
-    if from_date:
-        try:
-            cutoff = datetime.fromisoformat(from_date)
-        except Exception:
-            await context.error(f"Invalid from_date format: {from_date}. Use ISO 8601 format.")
-            return []
-        filtered = []
-        for card in result:
-            created = card.creationDate
-            updated = card.dateLastActivity
-            if (created and created >= cutoff) or (updated and updated >= cutoff):
-                filtered.append(card)
-        return filtered
-    return result
+        fields = fields or DEFAULT_CARD_FIELDS
+        if card_ids:
+            result, errors = await service.get_cards_by_ids(card_ids, fields=fields, query=query)
+            for card_id, error in errors.items():
+                await context.error(f"Failed to fetch card {card_id}: {error}")
+        else:
+            result = await service.get_cards(list_id, fields=fields, query=query)
+    if limit:
+        return format_result(first_page(scope, result, limit), output_mode, wrap=True)
+    return format_result(result, output_mode, wrap=True)
 
 
 @mcp.tool()
@@ -93,6 +147,55 @@ async def create_card(
     return await service.create_card(list_id, name, desc)
 
 
+@mcp.tool()
+@mcp_tool
+async def create_cards(
+    context: Context, cards: List[CreateCardPayload], list_id: Optional[str] = None
+) -> List[CardCreationResult]:
+    """Creates many cards in one call, e.g. a sprint's backlog, instead of calling create_card per card.
+
+    Cards are created concurrently within the server's rate limits. Cards without a position keep the
+    requested order in their list. A failing card does not stop the others.
+
+    Args:
+        cards (List[CreateCardPayload]): The cards to create: name, and optionally list_id, desc, labels, members, due and pos.
+        list_id (str, optional): The list for cards that do not name their own. Defaults to None.
+
+    Returns:
+        List[CardCreationResult]: One result per requested card, in request order, with the created card or the error.
+    """
+    results = [CardCreationResult(index=index, name=spec.name) for index, spec in enumerate(cards)]
+    requested = []
+    for result, spec in zip(results, cards):
+        target = spec.list_id or list_id
+        if not target:
+            result.error = "No list_id given for this card"
+            continue
+        data = {"idList": target, "name": spec.name}
+        if spec.desc:
+            data["desc"] = spec.desc
+        if spec.labels:
+            data["idLabels"] = spec.labels
+        if spec.members:
+            data["idMembers"] = spec.members
+        if spec.due:
+            data["due"] = spec.due
+        if spec.pos is not None:
+            data["pos"] = spec.pos
+        requested.append((result, data))
+
+    fanout = await service.create_cards([data for _, data in requested])
+    for (result, _), outcome in zip(requested, fanout.outcomes):
+        if isinstance(outcome, BaseException):
+            result.error = describe_error(outcome)
+        else:
+            result.card = outcome
+    for result in results:
+        if result.error:
+            await context.error(f"Failed to create card {result.index} ({result.name}): {result.error}")
+    return results
+
+
 @mcp.tool()
 @mcp_tool
 async def update_card(
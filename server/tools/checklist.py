@@ -7,10 +7,12 @@ from typing import Dict, List, Optional
 
 from mcp.server.fastmcp import Context
 
+from server.models import TrelloCheckItem, TrelloChecklist
 from server.services.checklist import ChecklistService
 from server.trello import client
 from server.mcp_instance import mcp
 from server.utils.decorators import mcp_tool
+from server.utils.serialization import OutputMode, format_result
 
 logger = logging.getLogger(__name__)
 service = ChecklistService(client)
@@ -18,37 +20,41 @@ service = ChecklistService(client)
 
 @mcp.tool()
 @mcp_tool
-async def get_checklist(context: Context, checklist_id: str) -> Dict:
+async def get_checklist(context: Context, checklist_id: str, output_mode: Optional[OutputMode] = None) -> TrelloChecklist:
     """
     Get a specific checklist by ID.
 
     Args:
         checklist_id (str): The ID of the checklist to retrieve
+        output_mode (Optional[OutputMode]): "full" or "compact". Defaults to the server setting
 
     Returns:
-        Dict: The checklist data
+        TrelloChecklist: The checklist and its items
     """
-    return await service.get_checklist(checklist_id)
+    checklist = await service.get_checklist(checklist_id)
+    return format_result(checklist, output_mode)
 
 
 @mcp.tool()
 @mcp_tool
-async def get_card_checklists(context: Context, card_id: str) -> List[Dict]:
+async def get_card_checklists(context: Context, card_id: str, output_mode: Optional[OutputMode] = None) -> List[TrelloChecklist]:
     """
     Get all checklists for a specific card.
 
     Args:
         card_id (str): The ID of the card to get checklists for
+        output_mode (Optional[OutputMode]): "full" or "compact". Defaults to the server setting
 
     Returns:
-        List[Dict]: List of checklists on the card
+        List[TrelloChecklist]: List of checklists on the card
     """
-    return await service.get_card_checklists(card_id)
+    checklists = await service.get_card_checklists(card_id)
+    return format_result(checklists, output_mode)
 
 
 @mcp.tool()
 @mcp_tool
-async def create_checklist(context: Context, card_id: str, name: str, pos: Optional[str] = None) -> Dict:
+async def create_checklist(context: Context, card_id: str, name: str, pos: Optional[str] = None) -> TrelloChecklist:
     """
     Create a new checklist on a card.
 
@@ -58,14 +64,14 @@ async def create_checklist(context: Context, card_id: str, name: str, pos: Optio
         pos (Optional[str]): The position of the checklist (top, bottom, or a positive number)
 
     Returns:
-        Dict: The created checklist data
+        TrelloChecklist: The created checklist
     """
     return await service.create_checklist(card_id, name, pos)
 
 
 @mcp.tool()
 @mcp_tool
-async def update_checklist(context: Context, checklist_id: str, name: Optional[str] = None, pos: Optional[str] = None) -> Dict:
+async def update_checklist(context: Context, checklist_id: str, name: Optional[str] = None, pos: Optional[str] = None) -> TrelloChecklist:
     """
     Update an existing checklist.
 
@@ -75,7 +81,7 @@ async def update_checklist(context: Context, checklist_id: str, name: Optional[s
         pos (Optional[str]): New position for the checklist
 
     Returns:
-        Dict: The updated checklist data
+        TrelloChecklist: The updated checklist
     """
     return await service.update_checklist(checklist_id, name, pos)
 
@@ -97,7 +103,7 @@ async def delete_checklist(context: Context, checklist_id: str) -> Dict:
 
 @mcp.tool()
 @mcp_tool
-async def add_checkitem(context: Context, checklist_id: str, name: str, checked: bool = False, pos: Optional[str] = None) -> Dict:
+async def add_checkitem(context: Context, checklist_id: str, name: str, checked: bool = False, pos: Optional[str] = None) -> TrelloCheckItem:
     """
     Add a new item to a checklist.
 
@@ -108,14 +114,14 @@ async def add_checkitem(context: Context, checklist_id: str, name: str, checked:
         pos (Optional[str]): The position of the item
 
     Returns:
-        Dict: The created checkitem data
+        TrelloCheckItem: The created checkitem
     """
     return await service.add_checkitem(checklist_id, name, checked, pos)
 
 
 @mcp.tool()
 @mcp_tool
-async def update_checkitem(context: Context, checklist_id: str, checkitem_id: str, name: Optional[str] = None, checked: Optional[bool] = None, pos: Optional[str] = None) -> Dict:
+async def update_checkitem(context: Context, checklist_id: str, checkitem_id: str, name: Optional[str] = None, checked: Optional[bool] = None, pos: Optional[str] = None) -> TrelloCheckItem:
     """
     Update a checkitem in a checklist.
 
@@ -127,7 +133,7 @@ async def update_checkitem(context: Context, checklist_id: str, checkitem_id: st
         pos (Optional[str]): New position for the item
 
     Returns:
-        Dict: The updated checkitem data
+        TrelloCheckItem: The updated checkitem
     """
     return await service.update_checkitem(checklist_id, checkitem_id, name, checked, pos)
 
@@ -3,48 +3,80 @@ This module contains tools for managing Trello lists.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 from mcp.server.fastmcp import Context
 
-from server.models import TrelloList
+from server.models import Page, TrelloList
 from server.services.list import ListService
 from server.trello import client
 from server.mcp_instance import mcp
 from server.utils.decorators import mcp_tool
+from server.utils.pagination import first_page, next_page
+from server.utils.serialization import OutputMode, format_result
 
 logger = logging.getLogger(__name__)
 
 service = ListService(client)
 
+DEFAULT_LIST_FIELDS = "id,name,closed,idBoard,pos"
+
 
 # List Tools
 @mcp.tool()
 @mcp_tool
-async def get_list(ctx: Context, list_id: str) -> TrelloList:
+async def get_list(
+    ctx: Context,
+    list_id: str,
+    fields: Optional[str] = None,
+    output_mode: Optional[OutputMode] = None,
+) -> TrelloList:
     """Retrieves a specific list by its ID.
 
     Args:
         list_id (str): The ID of the list to retrieve.
+        fields (str, optional): Comma-separated Trello fields to return, or "all". Defaults to a lean set.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
 
     Returns:
         TrelloList: The list object containing list details.
     """
-    return await service.get_list(list_id)
+    trello_list = await service.get_list(list_id, fields=fields or DEFAULT_LIST_FIELDS)
+    return format_result(trello_list, output_mode)
 
 
 @mcp.tool()
 @mcp_tool
-async def get_lists(ctx: Context, board_id: str) -> List[TrelloList]:
+async def get_lists(
+    ctx: Context,
+    board_id: str,
+    fields: Optional[str] = None,
+    output_mode: Optional[OutputMode] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> List[TrelloList] | Page[TrelloList]:
     """Retrieves all lists on a given board.
 
+    With `limit` or `cursor` the result is paginated: a page of lists is returned with the total count and a
+    `next_cursor`. Later pages are served from a short-lived snapshot of the first request.
+
     Args:
         board_id (str): The ID of the board whose lists to retrieve.
+        fields (str, optional): Comma-separated Trello fields to return, or "all". Defaults to a lean set.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+        limit (int, optional): Maximum number of lists per page. Enables pagination.
+        cursor (str, optional): The `next_cursor` of the previous page.
 
     Returns:
-        List[TrelloList]: A list of list objects.
+        List[TrelloList] | Page[TrelloList]: A list of list objects, or one page of them when paginating.
     """
-    return await service.get_lists(board_id)
+    scope = f"lists:{board_id}"
+    if cursor:
+        return format_result(next_page(scope, cursor, limit), output_mode, wrap=True)
+    lists = await service.get_lists(board_id, fields=fields or DEFAULT_LIST_FIELDS)
+    if limit:
+        return format_result(first_page(scope, lists, limit), output_mode, wrap=True)
+    return format_result(lists, output_mode, wrap=True)
 
 
 @mcp.tool()
@@ -0,0 +1,212 @@
+"""
+This module contains tools for searching the cards of loaded Trello boards.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from mcp.server.fastmcp import Context
+
+from server.models import BoardSnapshot, CardSearchHit, CrossBoardCards, TrelloCard
+from server.tools.board import service as board_service
+from server.tools.snapshot import sync
+from server.trello import card_index, card_query_index
+from server.mcp_instance import mcp
+from server.utils.concurrency import describe_error, gather_bounded
+from server.utils.decorators import mcp_tool
+from server.utils.query import parse_date
+from server.utils.serialization import OutputMode, format_result
+
+logger = logging.getLogger(__name__)
+
+
+async def _load_boards(board_id: str | None) -> List[str]:
+    """Returns the boards to search, loading any that are missing from the indexes."""
+    # Mirrors outlive snapshots dropped by a write, so those are brought back incrementally
+    board_ids = [board_id] if board_id else list(sync.mirrors)
+    for loaded_id in board_ids:
+        if loaded_id not in card_index.boards or loaded_id not in card_query_index.boards:
+            await sync.get_snapshot(loaded_id)
+    return board_ids
+
+
+def _due_filters(
+    due_after: str | None, due_before: str | None, overdue: bool, due_complete: bool | None
+) -> Dict[str, Any]:
+    """Parses due date arguments into `CardIndex.query` keyword arguments, raising ValueError for bad dates."""
+    after = parse_date(due_after) if due_after else None
+    before = parse_date(due_before) if due_before else None
+    if overdue:
+        now = datetime.now(timezone.utc)
+        before = min(before, now) if before else now
+        due_complete = False
+    return {"due_after": after, "due_before": before, "due_complete": due_complete}
+
+
+def _people_filters(
+    labels: List[str] | None, members: List[str] | None, board_ids: List[str]
+) -> Dict[str, Any]:
+    """Resolves label and member names on the given boards into `CardIndex.query` keyword arguments."""
+    return {
+        "label_ids": [card_query_index.resolve_labels(label, board_ids) for label in labels or []],
+        "member_ids": [
+            card_query_index.resolve_members(member, board_ids) for member in members or []
+        ],
+    }
+
+
+@mcp.tool()
+@mcp_tool
+async def search_cards(
+    context: Context,
+    query: str,
+    board_id: Optional[str] = None,
+    limit: int = 20,
+    output_mode: Optional[OutputMode] = None,
+) -> List[CardSearchHit]:
+    """Searches card names, descriptions, label names and checklist items of loaded boards, best matches first.
+
+    Searching runs in memory without calling Trello. Boards are loaded with get_board_snapshot;
+    pass board_id to load and search a board that is not loaded yet.
+
+    Args:
+        query (str): Words to find; every word must match, and words of 3+ letters also match as prefixes.
+        board_id (str, optional): Only search this board. Defaults to every loaded board.
+        limit (int, optional): Maximum number of results. Defaults to 20.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+
+    Returns:
+        List[CardSearchHit]: The matching cards with their relevance scores.
+    """
+    board_ids = await _load_boards(board_id)
+    hits = card_index.search(query, board_ids=board_ids, limit=limit)
+    return format_result(hits, output_mode)
+
+
+@mcp.tool()
+@mcp_tool
+async def query_cards(
+    context: Context,
+    board_id: Optional[str] = None,
+    list_id: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    members: Optional[List[str]] = None,
+    due_after: Optional[str] = None,
+    due_before: Optional[str] = None,
+    overdue: bool = False,
+    due_complete: Optional[bool] = None,
+    limit: int = 50,
+    output_mode: Optional[OutputMode] = None,
+) -> List[TrelloCard]:
+    """Finds cards of loaded boards by list, labels, members and due date, soonest due first.
+
+    Runs in memory without calling Trello, e.g. "overdue cards assigned to ada with label Bug".
+    Boards are loaded with get_board_snapshot; pass board_id to load and query a board that is not loaded yet.
+
+    Args:
+        board_id (str, optional): Only return cards of this board. Defaults to every loaded board.
+        list_id (str, optional): Only return cards in this list.
+        labels (List[str], optional): Label IDs or names; cards must have all of them.
+        members (List[str], optional): Member IDs, usernames or full names; cards must be assigned to all of them.
+        due_after (str, optional): Only return cards due at or after this ISO 8601 date.
+        due_before (str, optional): Only return cards due before this ISO 8601 date.
+        overdue (bool, optional): Only return cards past their due date that are not marked complete. Defaults to False.
+        due_complete (bool, optional): Only return cards whose due date is (or is not) marked complete.
+        limit (int, optional): Maximum number of cards. Defaults to 50.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+
+    Returns:
+        List[TrelloCard]: The matching cards.
+    """
+    try:
+        due_filters = _due_filters(due_after, due_before, overdue, due_complete)
+    except ValueError as e:
+        await context.error(f"Invalid due date filter: {e}. Use ISO 8601 format for dates.")
+        return format_result([], output_mode)
+
+    board_ids = await _load_boards(board_id)
+    cards = card_query_index.query(
+        board_ids=board_ids,
+        list_id=list_id,
+        **_people_filters(labels, members, board_ids),
+        **due_filters,
+    )
+    return format_result(cards[:limit], output_mode)
+
+
+@mcp.tool()
+@mcp_tool
+async def query_all_boards(
+    context: Context,
+    board_ids: Optional[List[str]] = None,
+    text: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    members: Optional[List[str]] = None,
+    due_after: Optional[str] = None,
+    due_before: Optional[str] = None,
+    overdue: bool = False,
+    due_complete: Optional[bool] = None,
+    limit: int = 50,
+    output_mode: Optional[OutputMode] = None,
+) -> CrossBoardCards:
+    """Finds cards across all of the user's open boards (or the given ones) in one call, e.g. "what's due this week everywhere".
+
+    Boards are loaded concurrently, one request each, and progress is reported as each board completes
+    with its number of matches. Boards that are already loaded are not fetched again.
+
+    Args:
+        board_ids (List[str], optional): The boards to search. Defaults to every open board of the user.
+        text (str, optional): Words to find in names, descriptions, labels and checklist items; ranks results by relevance.
+        labels (List[str], optional): Label IDs or names; cards must have all of them.
+        members (List[str], optional): Member IDs, usernames or full names; cards must be assigned to all of them.
+        due_after (str, optional): Only return cards due at or after this ISO 8601 date.
+        due_before (str, optional): Only return cards due before this ISO 8601 date.
+        overdue (bool, optional): Only return cards past their due date that are not marked complete. Defaults to False.
+        due_complete (bool, optional): Only return cards whose due date is (or is not) marked complete.
+        limit (int, optional): Maximum number of cards. Defaults to 50.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+
+    Returns:
+        CrossBoardCards: The best matches across boards, soonest due first or by relevance when `text` is given.
+    """
+    try:
+        due_filters = _due_filters(due_after, due_before, overdue, due_complete)
+    except ValueError as e:
+        await context.error(f"Invalid due date filter: {e}. Use ISO 8601 format for dates.")
+        return format_result(CrossBoardCards(cards=[], total=0, boards=[]), output_mode)
+    if board_ids is None:
+        boards = await board_service.get_boards(fields=["id", "name", "closed"])
+        board_ids = [board.id for board in boards if not board.closed]
+
+    def matches(loaded_ids: List[str]) -> List[TrelloCard]:
+        cards = card_query_index.query(
+            board_ids=loaded_ids, **_people_filters(labels, members, loaded_ids), **due_filters
+        )
+        if not text:
+            return cards
+        matched = {card.id for card in cards}
+        hits = card_index.search(text, board_ids=loaded_ids, limit=len(card_index.cards))
+        return [hit.card for hit in hits if hit.card.id in matched]
+
+    completed = 0
+
+    async def report(board_id: str, outcome: BoardSnapshot | BaseException):
+        nonlocal completed
+        completed += 1
+        if isinstance(outcome, BaseException):
+            message = f"Board {board_id} failed: {describe_error(outcome)}"
+        else:
+            message = f"{outcome.board.name}: {len(matches([board_id]))} matching cards"
+        await context.report_progress(completed, len(board_ids), message)
+
+    fanout = await gather_bounded(board_ids, sync.get_snapshot, on_result=report)
+    loaded_ids = [board_id for board_id, _ in fanout.results]
+    cards = matches(loaded_ids)
+    result = CrossBoardCards(
+        cards=cards[:limit],
+        total=len(cards),
+        boards=loaded_ids,
+        errors={board_id: describe_error(error) for board_id, error in fanout.errors},
+    )
+    return format_result(result, output_mode)
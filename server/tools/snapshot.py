@@ -0,0 +1,67 @@
+"""
+This module contains tools for loading whole Trello boards.
+"""
+
+import logging
+from typing import Optional
+
+from mcp.server.fastmcp import Context
+
+from server.models import BoardSnapshot, BoardSummary
+from server.services.snapshot import BoardSnapshotService
+from server.services.sync import BoardSyncService
+from server.trello import client, snapshot_disk_cache, snapshot_store
+from server.mcp_instance import mcp
+from server.utils.decorators import mcp_tool
+from server.utils.serialization import OutputMode, format_result
+from server.utils.summary import summarize_board
+
+logger = logging.getLogger(__name__)
+
+service = BoardSnapshotService(client, snapshot_store, snapshot_disk_cache)
+# Keeps loaded boards up to date from their actions feed instead of reloading them
+sync = BoardSyncService(client, service)
+
+
+@mcp.tool()
+@mcp_tool
+async def get_board_snapshot(
+    context: Context,
+    board_id: str,
+    refresh: bool = False,
+    output_mode: Optional[OutputMode] = None,
+) -> BoardSnapshot:
+    """Retrieves a whole board in one request: its open lists and cards, checklists, labels and members.
+
+    Prefer this over calling get_lists, get_cards and get_card_checklists for every list and card.
+    Recently loaded boards are served from memory and brought up to date from the board's recent actions.
+
+    Args:
+        board_id (str): The ID of the board to retrieve.
+        refresh (bool, optional): Reload the board from Trello even if a recent snapshot exists. Defaults to False.
+        output_mode (str, optional): "full" or "compact". Defaults to the server setting.
+
+    Returns:
+        BoardSnapshot: The board and its contents.
+    """
+    snapshot = await sync.get_snapshot(board_id, refresh=refresh)
+    return format_result(snapshot, output_mode)
+
+
+@mcp.tool()
+@mcp_tool
+async def board_summary(context: Context, board_id: str, refresh: bool = False) -> BoardSummary:
+    """Counts a board's open cards per list, member and label, overdue and due-soon cards, and checklist completion.
+
+    Prefer this over downloading cards when only counts are needed. Uses the same snapshot as get_board_snapshot,
+    so it costs at most one request and none for a recently loaded board.
+
+    Args:
+        board_id (str): The ID of the board to summarize.
+        refresh (bool, optional): Reload the board from Trello even if a recent snapshot exists. Defaults to False.
+
+    Returns:
+        BoardSummary: The board's aggregate counts.
+    """
+    snapshot = await sync.get_snapshot(board_id, refresh=refresh)
+    return summarize_board(snapshot)
@@ -0,0 +1,93 @@
+"""
+This module contains tools for managing Trello board webhooks.
+"""
+
+import logging
+from typing import List, Optional
+
+from mcp.server.fastmcp import Context
+
+from server.config import settings
+from server.models import TrelloWebhook
+from server.services.webhook import WebhookService
+from server.tools.snapshot import sync
+from server.trello import client
+from server.mcp_instance import mcp
+from server.utils.decorators import mcp_tool
+
+logger = logging.getLogger(__name__)
+
+service = WebhookService(client)
+
+
+@mcp.tool()
+@mcp_tool
+async def get_board_webhooks(
+    context: Context, board_id: Optional[str] = None
+) -> List[TrelloWebhook]:
+    """Lists the webhooks registered for the authenticated user's boards.
+
+    Args:
+        board_id (str, optional): Only list webhooks watching this board.
+
+    Returns:
+        List[TrelloWebhook]: A list of webhook objects.
+    """
+    return await service.get_webhooks(board_id)
+
+
+@mcp.tool()
+@mcp_tool
+async def register_board_webhook(
+    context: Context,
+    board_id: str,
+    description: Optional[str] = None,
+) -> TrelloWebhook:
+    """Registers a webhook so Trello pushes a board's changes to this server instead of being polled.
+
+    Requires TRELLO_API_SECRET, and TRELLO_WEBHOOK_CALLBACK_URL set to a URL that Trello can reach
+    and that routes to /webhooks/trello. Deliveries are only accepted when signed for that URL,
+    so no other callback URL can be registered.
+
+    Args:
+        board_id (str): The ID of the board to watch.
+        description (str, optional): A description of the webhook. Defaults to None.
+
+    Returns:
+        TrelloWebhook: The webhook watching the board.
+    """
+    callback_url = settings.TRELLO_WEBHOOK_CALLBACK_URL
+    if not callback_url:
+        raise ValueError("TRELLO_WEBHOOK_CALLBACK_URL must be set to receive webhook deliveries")
+    if not settings.TRELLO_API_SECRET:
+        raise ValueError("TRELLO_API_SECRET must be set to verify webhook deliveries")
+    existing = [
+        webhook
+        for webhook in await service.get_webhooks(board_id)
+        if webhook.callbackURL == callback_url
+    ]
+    # Trello rejects a second webhook for the same board and URL
+    webhook = existing[0] if existing else await service.create_webhook(
+        board_id, callback_url, description
+    )
+    if webhook.active:
+        sync.set_webhook(board_id, webhook.id)
+    return webhook
+
+
+@mcp.tool()
+@mcp_tool
+async def unregister_board_webhook(context: Context, board_id: str) -> List[TrelloWebhook]:
+    """Deletes every webhook watching a board, returning it to polling.
+
+    Args:
+        board_id (str): The ID of the board.
+
+    Returns:
+        List[TrelloWebhook]: The deleted webhooks.
+    """
+    webhooks = await service.get_webhooks(board_id)
+    for webhook in webhooks:
+        await service.delete_webhook(webhook.id)
+    sync.clear_webhook(board_id)
+    return webhooks
@@ -1,6 +1,18 @@
 import logging
 
+import httpx
 
+from server.models import set_validation_mode
+from server.utils.cache import ResponseCache
+from server.utils.card_index import CardIndex
+from server.utils.concurrency import set_default_fanout_limit
+from server.utils.disk_cache import SnapshotDiskCache
+from server.utils.json_codec import get_codec
+from server.utils.pagination import set_snapshot_limits
+from server.utils.rate_limiter import TrelloRateLimiter
+from server.utils.search_index import CardSearchIndex
+from server.utils.serialization import set_output_mode
+from server.utils.snapshot_store import BoardSnapshotStore
 from server.utils.trello_api import TrelloClient
 
 import sys
@@ -17,7 +29,75 @@ logger = logging.getLogger(__name__)
 try:
     from server.config import settings
 
-    client = TrelloClient(api_key=settings.TRELLO_API_KEY, token=settings.TRELLO_TOKEN)
+    client = TrelloClient(
+        api_key=settings.TRELLO_API_KEY,
+        token=settings.TRELLO_TOKEN,
+        limits=httpx.Limits(
+            max_connections=settings.TRELLO_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.TRELLO_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.TRELLO_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.TRELLO_HTTP_CONNECT_TIMEOUT,
+            read=settings.TRELLO_HTTP_READ_TIMEOUT,
+            write=settings.TRELLO_HTTP_WRITE_TIMEOUT,
+            pool=settings.TRELLO_HTTP_POOL_TIMEOUT,
+        ),
+        http2=settings.TRELLO_HTTP2,
+        rate_limiter=(
+            TrelloRateLimiter(
+                key_max=settings.TRELLO_RATE_LIMIT_KEY_MAX,
+                token_max=settings.TRELLO_RATE_LIMIT_TOKEN_MAX,
+                interval=settings.TRELLO_RATE_LIMIT_INTERVAL,
+            )
+            if settings.TRELLO_RATE_LIMIT_ENABLED
+            else None
+        ),
+        cache=(
+            ResponseCache(
+                max_entries=settings.TRELLO_CACHE_MAX_ENTRIES,
+                ttls={
+                    "boards": settings.TRELLO_CACHE_TTL_BOARDS,
+                    "lists": settings.TRELLO_CACHE_TTL_LISTS,
+                    "cards": settings.TRELLO_CACHE_TTL_CARDS,
+                    "checklists": settings.TRELLO_CACHE_TTL_CHECKLISTS,
+                    "members": settings.TRELLO_CACHE_TTL_MEMBERS,
+                },
+            )
+            if settings.TRELLO_CACHE_ENABLED
+            else None
+        ),
+        coalesce=settings.TRELLO_COALESCE_GETS,
+        codec=get_codec(settings.TRELLO_JSON_CODEC),
+    )
+    set_default_fanout_limit(settings.TRELLO_FANOUT_CONCURRENCY)
+    set_validation_mode(settings.TRELLO_MODEL_VALIDATION)
+    set_output_mode(
+        settings.MCP_OUTPUT_MODE,
+        flatten_labels=settings.MCP_OUTPUT_FLATTEN_LABELS,
+        max_desc_length=settings.MCP_OUTPUT_MAX_DESC_LENGTH,
+    )
+    set_snapshot_limits(settings.MCP_PAGE_SNAPSHOT_TTL, settings.MCP_PAGE_SNAPSHOT_MAX)
+    # Whole-board snapshots shared by the tools; writes drop the boards they touch
+    snapshot_store = BoardSnapshotStore(max_age=settings.TRELLO_SNAPSHOT_MAX_AGE)
+    client.add_write_listener(snapshot_store.invalidate)
+    # Full-text index over the cards of loaded boards, following the snapshots
+    card_index = CardSearchIndex()
+    snapshot_store.add_listener(card_index.update)
+    # Label, member, due date and list indexes over the same cards
+    card_query_index = CardIndex()
+    snapshot_store.add_listener(card_query_index.update)
+    # Opened lazily on first use, so startup never waits on the disk
+    snapshot_disk_cache = (
+        SnapshotDiskCache(
+            settings.TRELLO_SNAPSHOT_CACHE_PATH,
+            max_bytes=int(settings.TRELLO_SNAPSHOT_CACHE_MAX_MB * 1024 * 1024),
+            max_entries=settings.TRELLO_SNAPSHOT_CACHE_MAX_BOARDS,
+            codec=client.codec,
+        )
+        if settings.TRELLO_SNAPSHOT_CACHE_PATH
+        else None
+    )
     logger.info("Trello client and service initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize Trello client: {str(e)}")
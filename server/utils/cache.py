@@ -0,0 +1,186 @@
+# cache.py
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, Mapping, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached GET response stays fresh, by the resource type it returns
+DEFAULT_TTLS = {
+    "boards": 60.0,
+    "lists": 30.0,
+    "cards": 15.0,
+    "checklists": 15.0,
+    "members": 300.0,
+    # Feeds that are paged or polled for changes must always be fresh
+    "actions": 0.0,
+    "search": 0.0,
+    # /batch responses bundle unrelated resources
+    "batch": 0.0,
+    # Webhook listings (under /members/me/tokens) must reflect registrations at once
+    "tokens": 0.0,
+}
+DEFAULT_TTL = 15.0
+SECRET_PARAMS = {"key", "token"}
+# Fields of a write payload or response that point at a parent resource
+PARENT_ID_FIELDS = ("id", "idBoard", "idList", "idCard", "idChecklist")
+
+MISS = object()
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def resource_type(endpoint: str) -> str:
+    """Returns the type an endpoint returns, e.g. /lists/{id}/cards -> cards."""
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    return segments[-1] if len(segments) % 2 else segments[-2]
+
+
+def endpoint_ids(endpoint: str) -> Set[str]:
+    """Returns the IDs embedded in an endpoint, e.g. /lists/{id}/cards -> {id}."""
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    return set(segments[1::2])
+
+
+def payload_ids(payload: Any) -> Set[str]:
+    """Returns the IDs of the entities contained in a response payload."""
+    items = payload if isinstance(payload, list) else [payload]
+    return {item["id"] for item in items if isinstance(item, dict) and "id" in item}
+
+
+def parent_ids(*payloads: Any) -> Set[str]:
+    """Returns the resource and parent IDs referenced by write payloads."""
+    ids = set()
+    for payload in payloads:
+        if isinstance(payload, dict):
+            ids.update(
+                str(payload[name])
+                for name in PARENT_ID_FIELDS
+                if isinstance(payload.get(name), str)
+            )
+    return ids
+
+
+class ResponseCache:
+    """
+    In-process TTL + LRU cache for Trello GET responses.
+
+    Entries are keyed by endpoint and non-secret params and tagged with every
+    ID in their endpoint and payload, so a write can invalidate all entries
+    that mention the written resource or its parents. Cached payloads are
+    shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+    ):
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.entries: OrderedDict[CacheKey, Tuple[float, Any, Set[str]]] = OrderedDict()
+        self.tags: Dict[str, Set[CacheKey]] = defaultdict(set)
+        # Bumped on every invalidation so responses fetched before a write are not stored
+        self.generation = 0
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Mapping[str, Any] | None = None) -> CacheKey:
+        return (
+            endpoint,
+            tuple(
+                sorted(
+                    (name, str(value))
+                    for name, value in (params or {}).items()
+                    if name not in SECRET_PARAMS
+                )
+            ),
+        )
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(resource_type(endpoint), self.default_ttl)
+
+    def get(self, endpoint: str, params: Mapping[str, Any] | None = None) -> Any:
+        """Returns the cached payload, or `MISS` if absent or expired."""
+        key = self.make_key(endpoint, params)
+        kind = resource_type(endpoint)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses[kind] += 1
+            return MISS
+        self.entries.move_to_end(key)
+        self.hits[kind] += 1
+        return entry[1]
+
+    def set(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any] | None,
+        value: Any,
+        generation: int | None = None,
+    ):
+        """
+        Stores a payload.
+
+        If `generation` is given and an invalidation has happened since, the
+        payload may predate a write and is dropped instead.
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or (generation is not None and generation != self.generation):
+            return
+        key = self.make_key(endpoint, params)
+        if key in self.entries:
+            self._remove(key)
+        tags = endpoint_ids(endpoint) | payload_ids(value)
+        self.entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self.tags[tag].add(key)
+        while len(self.entries) > self.max_entries:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def invalidate(self, ids: Iterable[str]) -> int:
+        """Drops every entry tagged with one of `ids` and returns how many were dropped."""
+        self.generation += 1
+        dropped = 0
+        for resource_id in set(ids):
+            for key in list(self.tags.get(resource_id, ())):
+                self._remove(key)
+                dropped += 1
+        self.invalidations += dropped
+        return dropped
+
+    def invalidate_write(self, endpoint: str, *payloads: Any) -> int:
+        """Invalidates entries affected by a write to `endpoint`."""
+        return self.invalidate(endpoint_ids(endpoint) | parent_ids(*payloads))
+
+    def clear(self):
+        self.generation += 1
+        self.entries.clear()
+        self.tags.clear()
+
+    def _remove(self, key: CacheKey):
+        _, _, tags = self.entries.pop(key)
+        for tag in tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self.entries),
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
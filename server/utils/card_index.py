@@ -0,0 +1,218 @@
+# card_index.py
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from server.models import BoardSnapshot, TrelloCard
+
+# What a card is indexed under: list, labels, members and due timestamp
+CardKeys = Tuple[str, Tuple[str, ...], Tuple[str, ...], Optional[float]]
+
+
+class CardIndex:
+    """
+    In-memory secondary indexes over the cards of loaded boards.
+
+    Cards are indexed by list, label, member and due date (a sorted list
+    searched with bisect), so `query` answers combined predicates by
+    intersecting small ID sets, smallest first, instead of scanning cards.
+    Register `update` as a board snapshot store listener: only cards whose
+    keys changed are reindexed, and boards dropped by a write are removed.
+    """
+
+    def __init__(self):
+        self.cards: Dict[str, TrelloCard] = {}
+        self.keys: Dict[str, Tuple[str, CardKeys]] = {}  # card ID -> (board ID, keys)
+        self.boards: Dict[str, Set[str]] = {}  # board ID -> card IDs
+        self.by_list: Dict[str, Set[str]] = {}
+        self.by_label: Dict[str, Set[str]] = {}
+        self.by_member: Dict[str, Set[str]] = {}
+        self.by_due: List[Tuple[float, str]] = []  # (due timestamp, card ID), sorted
+        # Board ID -> casefolded label name or member username/full name -> IDs
+        self.label_names: Dict[str, Dict[str, Set[str]]] = {}
+        self.member_names: Dict[str, Dict[str, Set[str]]] = {}
+
+    def update(self, board_id: str, snapshot: Optional[BoardSnapshot]):
+        """Snapshot store listener keeping the indexes in step with the loaded boards."""
+        if snapshot is None:
+            self.remove_board(board_id)
+        else:
+            self.index_board(snapshot)
+
+    def index_board(self, snapshot: BoardSnapshot):
+        """Indexes the cards of a board snapshot, replacing its previous cards."""
+        board_id = snapshot.id
+        card_ids = set()
+        for card in snapshot.cards:
+            card_ids.add(card.id)
+            self.cards[card.id] = card
+            keys = self._card_keys(card)
+            if self.keys.get(card.id) == (board_id, keys):
+                continue
+            self._remove_card(card.id)
+            self._add_card(card.id, board_id, keys)
+        for card_id in self.boards.get(board_id, set()) - card_ids:
+            self._drop(card_id, board_id)
+        self.boards[board_id] = card_ids
+
+        label_names: Dict[str, Set[str]] = {}
+        for label in snapshot.labels:
+            if label.name:
+                label_names.setdefault(label.name.casefold(), set()).add(label.id)
+        self.label_names[board_id] = label_names
+        member_names: Dict[str, Set[str]] = {}
+        for member in snapshot.members:
+            for name in (member.username, member.fullName):
+                if name:
+                    member_names.setdefault(name.casefold(), set()).add(member.id)
+        self.member_names[board_id] = member_names
+
+    def remove_board(self, board_id: str):
+        for card_id in self.boards.pop(board_id, ()):
+            self._drop(card_id, board_id)
+        self.label_names.pop(board_id, None)
+        self.member_names.pop(board_id, None)
+
+    def resolve_labels(self, value: str, board_ids: Iterable[str] | None = None) -> Set[str]:
+        """Returns the IDs of the labels named `value`, or {value} if it is not a label name."""
+        return self._resolve(self.label_names, value, board_ids)
+
+    def resolve_members(self, value: str, board_ids: Iterable[str] | None = None) -> Set[str]:
+        """Returns the IDs of the members with username or full name `value`, or {value} if none."""
+        return self._resolve(self.member_names, value, board_ids)
+
+    def query(
+        self,
+        board_ids: Iterable[str] | None = None,
+        list_id: str | None = None,
+        label_ids: Iterable[Set[str]] = (),
+        member_ids: Iterable[Set[str]] = (),
+        due_after: datetime | None = None,
+        due_before: datetime | None = None,
+        due_complete: bool | None = None,
+    ) -> List[TrelloCard]:
+        """
+        Returns the cards matching every given predicate, soonest due first.
+
+        Args:
+            board_ids (Iterable[str], optional): Only return cards of these boards. Defaults to all indexed boards.
+            list_id (str, optional): Only return cards in this list.
+            label_ids (Iterable[Set[str]]): Each set is one label requirement; a card needs one ID of every set.
+            member_ids (Iterable[Set[str]]): Each set is one member requirement, as for labels.
+            due_after (datetime, optional): Only return cards due at or after this time.
+            due_before (datetime, optional): Only return cards due before this time.
+            due_complete (bool, optional): Only return cards whose due date is (or is not) marked complete.
+
+        Returns:
+            List[TrelloCard]: The matching cards; cards without a due date come last, in board order.
+        """
+        candidates: List[Set[str]] = []
+        if list_id is not None:
+            candidates.append(self.by_list.get(list_id, set()))
+        for ids in label_ids:
+            candidates.append(set().union(*(self.by_label.get(label_id, ()) for label_id in ids)))
+        for ids in member_ids:
+            candidates.append(set().union(*(self.by_member.get(member_id, ()) for member_id in ids)))
+        due_range = None
+        if due_after is not None or due_before is not None:
+            start = 0 if due_after is None else bisect_left(self.by_due, (due_after.timestamp(), ""))
+            end = (
+                len(self.by_due)
+                if due_before is None
+                else bisect_left(self.by_due, (due_before.timestamp(), ""))
+            )
+            if not candidates or end - start < min(map(len, candidates)):
+                candidates.append({card_id for _, card_id in self.by_due[start:end]})
+            else:
+                # Cheaper to check the due dates of the few cards the other indexes match
+                due_range = (
+                    float("-inf") if due_after is None else due_after.timestamp(),
+                    float("inf") if due_before is None else due_before.timestamp(),
+                )
+
+        if candidates:
+            candidates.sort(key=len)
+            matched = set(candidates[0])
+            for ids in candidates[1:]:
+                if not matched:
+                    break
+                matched &= ids
+            if due_range is not None:
+                matched = {card_id for card_id in matched if self._due_in(card_id, *due_range)}
+            if board_ids is not None:
+                # Checked per match: the board sets are usually the largest of all
+                allowed = set(board_ids)
+                matched = {card_id for card_id in matched if self.keys[card_id][0] in allowed}
+        elif board_ids is not None:
+            matched = set().union(*(self.boards.get(board_id, ()) for board_id in board_ids))
+        else:
+            matched = set(self.keys)
+        cards = [self.cards[card_id] for card_id in matched]
+        if due_complete is not None:
+            cards = [card for card in cards if bool(card.dueComplete) == due_complete]
+        return sorted(cards, key=self._sort_key)
+
+    def _due_in(self, card_id: str, start: float, end: float) -> bool:
+        due = self.keys[card_id][1][3]
+        return due is not None and start <= due < end
+
+    def _sort_key(self, card: TrelloCard):
+        due = self.keys[card.id][1][3]
+        return float("inf") if due is None else due, card.idBoard, card.idList, card.pos
+
+    @staticmethod
+    def _card_keys(card: TrelloCard) -> CardKeys:
+        return (
+            card.idList,
+            tuple(card.idLabels or [label.id for label in card.labels]),
+            tuple(card.idMembers),
+            card.due.timestamp() if card.due else None,
+        )
+
+    @staticmethod
+    def _resolve(names, value: str, board_ids: Iterable[str] | None) -> Set[str]:
+        boards = names if board_ids is None else [board_id for board_id in board_ids if board_id in names]
+        ids = set().union(*(names[board_id].get(value.casefold(), ()) for board_id in boards))
+        return ids or {value}
+
+    def _add_card(self, card_id: str, board_id: str, keys: CardKeys):
+        list_id, labels, members, due = keys
+        self.by_list.setdefault(list_id, set()).add(card_id)
+        for label_id in labels:
+            self.by_label.setdefault(label_id, set()).add(card_id)
+        for member_id in members:
+            self.by_member.setdefault(member_id, set()).add(card_id)
+        if due is not None:
+            insort(self.by_due, (due, card_id))
+        self.keys[card_id] = (board_id, keys)
+
+    def _remove_card(self, card_id: str):
+        entry = self.keys.pop(card_id, None)
+        if entry is None:
+            return
+        list_id, labels, members, due = entry[1]
+        self._discard(self.by_list, list_id, card_id)
+        for label_id in labels:
+            self._discard(self.by_label, label_id, card_id)
+        for member_id in members:
+            self._discard(self.by_member, member_id, card_id)
+        if due is not None:
+            index = bisect_left(self.by_due, (due, card_id))
+            if index < len(self.by_due) and self.by_due[index] == (due, card_id):
+                del self.by_due[index]
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, card_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(card_id)
+            if not ids:
+                del index[key]
+
+    def _drop(self, card_id: str, board_id: str):
+        """Removes a card indexed for `board_id`, unless it has since moved to another board."""
+        entry = self.keys.get(card_id)
+        if entry is not None and entry[0] != board_id:
+            return
+        self._remove_card(card_id)
+        self.cards.pop(card_id, None)
@@ -0,0 +1,98 @@
+# concurrency.py
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FANOUT_LIMIT = 8
+
+
+def set_default_fanout_limit(limit: int):
+    """Sets the width used by `gather_bounded` when no explicit limit is given."""
+    global DEFAULT_FANOUT_LIMIT
+    if limit < 1:
+        raise ValueError("Fan-out limit must be at least 1")
+    DEFAULT_FANOUT_LIMIT = limit
+
+
+@dataclass
+class FanOutResult(Generic[T, R]):
+    """Outcome of a fan-out: one value or exception per input item, in input order."""
+
+    items: List[T]
+    outcomes: List[R | BaseException]
+
+    @property
+    def results(self) -> List[Tuple[T, R]]:
+        return [
+            (item, outcome)
+            for item, outcome in zip(self.items, self.outcomes)
+            if not isinstance(outcome, BaseException)
+        ]
+
+    @property
+    def errors(self) -> List[Tuple[T, BaseException]]:
+        return [
+            (item, outcome)
+            for item, outcome in zip(self.items, self.outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+
+
+def describe_error(error: BaseException) -> str:
+    """Returns an error's message, or its type name for errors without one, e.g. TimeoutError()."""
+    return str(error) or type(error).__name__
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[R]],
+    limit: int | None = None,
+    on_result: Callable[[T, R | BaseException], Awaitable[None]] | None = None,
+) -> FanOutResult[T, R]:
+    """
+    Runs `func` over `items` concurrently with at most `limit` calls in flight.
+
+    A failing call does not abort the others; its exception is recorded in the
+    result instead. Trello requests made by `func` still go through the client's
+    rate limiter, so the limit only bounds how many requests wait there at once.
+
+    Args:
+        items (Iterable[T]): The inputs to fan out over.
+        func (Callable[[T], Awaitable[R]]): The coroutine function to call per item.
+        limit (int, optional): Maximum concurrent calls. Defaults to DEFAULT_FANOUT_LIMIT.
+        on_result (Callable, optional): Awaited with each item and its value or exception as soon as it completes, e.g. to report progress. Its own errors are logged and do not affect the result.
+
+    Returns:
+        FanOutResult[T, R]: Partial results plus per-item errors.
+    """
+    items = list(items)
+    semaphore = asyncio.Semaphore(limit or DEFAULT_FANOUT_LIMIT)
+
+    async def notify(item: T, outcome: R | BaseException):
+        # A failing callback is logged, never allowed to change the item's outcome
+        try:
+            await on_result(item, outcome)
+        except Exception:
+            logger.exception(f"Result callback failed for {item!r}")
+
+    async def run(item: T) -> R:
+        # Callbacks run outside the semaphore, so a slow one does not hold up other calls
+        try:
+            async with semaphore:
+                outcome = await func(item)
+        except Exception as e:
+            if on_result is not None:
+                await notify(item, e)
+            raise
+        if on_result is not None:
+            await notify(item, outcome)
+        return outcome
+
+    outcomes = await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+    return FanOutResult(items=items, outcomes=list(outcomes))
@@ -0,0 +1,186 @@
+# disk_cache.py
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from server.utils.json_codec import OrjsonCodec, StdlibCodec, get_codec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    board_id TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class SnapshotDiskCache:
+    """
+    SQLite-backed cache of raw board snapshot payloads that survives restarts.
+
+    Each board is stored once, versioned by its `dateLastActivity`, so a
+    caller can check the version with a tiny request before reusing the
+    payload. Total size and entry count are capped: the least recently used
+    boards are dropped and the file is compacted afterwards.
+
+    The database is opened on first use and all file I/O runs in worker
+    threads, so neither startup nor the event loop waits on the disk. Any
+    SQLite error disables the cache instead of failing tool calls, and a
+    payload that cannot be decoded is dropped and treated as a miss.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        codec: StdlibCodec | OrjsonCodec | None = None,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.codec = codec or get_codec()
+        self.connection: Optional[sqlite3.Connection] = None
+        self.disabled = False
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    async def load(self, board_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Returns the stored version and payload of a board, or None."""
+        return await asyncio.to_thread(self._run, self._load, board_id)
+
+    async def save(self, board_id: str, version: str | None, payload: Dict[str, Any]):
+        """Stores a board payload unless the same version is already stored."""
+        if not version:
+            return
+        await asyncio.to_thread(self._run, self._save, board_id, version, payload)
+
+    async def discard(self, board_id: str):
+        await asyncio.to_thread(self._run, self._discard, board_id)
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": not self.disabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+    def _run(self, func, *args):
+        with self.lock:
+            if self.disabled:
+                return None
+            try:
+                if self.connection is None:
+                    self.connection = self._open()
+                return func(self.connection, *args)
+            except sqlite3.Error as e:
+                logger.warning(f"Snapshot disk cache at {self.path} disabled: {e}")
+                self.disabled = True
+                if self.connection is not None:
+                    self.connection.close()
+                    self.connection = None
+                return None
+
+    def _open(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        # Must be set before the table exists so deleted rows can be given back to the OS
+        connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute(_SCHEMA)
+        connection.commit()
+        logger.info(f"Snapshot disk cache opened at {self.path}")
+        return connection
+
+    def _load(self, connection: sqlite3.Connection, board_id: str):
+        row = connection.execute(
+            "SELECT version, payload FROM snapshots WHERE board_id = ?", (board_id,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        try:
+            payload = self.codec.loads(row[1])
+        except ValueError as e:
+            # A corrupt row is dropped, so the board is reloaded and stored again
+            logger.warning(f"Dropped unreadable disk snapshot of board {board_id}: {e}")
+            self._discard(connection, board_id)
+            self.misses += 1
+            return None
+        connection.execute(
+            "UPDATE snapshots SET accessed_at = ? WHERE board_id = ?",
+            (time.time(), board_id),
+        )
+        connection.commit()
+        self.hits += 1
+        return row[0], payload
+
+    def _save(self, connection: sqlite3.Connection, board_id: str, version: str, payload):
+        now = time.time()
+        row = connection.execute(
+            "SELECT version FROM snapshots WHERE board_id = ?", (board_id,)
+        ).fetchone()
+        if row is not None and row[0] == version:
+            connection.execute(
+                "UPDATE snapshots SET accessed_at = ? WHERE board_id = ?", (now, board_id)
+            )
+            connection.commit()
+            return
+        data = self.codec.dumps(payload)
+        connection.execute(
+            "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?)",
+            (board_id, version, data, len(data), now, now),
+        )
+        self.writes += 1
+        self._compact(connection)
+        connection.commit()
+
+    def _discard(self, connection: sqlite3.Connection, board_id: str):
+        connection.execute("DELETE FROM snapshots WHERE board_id = ?", (board_id,))
+        connection.commit()
+
+    def _compact(self, connection: sqlite3.Connection):
+        """Drops least recently used boards beyond the caps and frees their pages."""
+        count, total = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM snapshots"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        evicted = 0
+        rows = connection.execute(
+            "SELECT board_id, size FROM snapshots ORDER BY accessed_at"
+        ).fetchall()
+        # Always keep the most recently used board, even if it alone exceeds the size cap
+        for board_id, size in rows[:-1]:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM snapshots WHERE board_id = ?", (board_id,))
+            count -= 1
+            total -= size
+            evicted += 1
+        self.evictions += evicted
+        connection.commit()
+        connection.execute("PRAGMA incremental_vacuum")
@@ -0,0 +1,35 @@
+# fields.py
+from typing import Dict, List, Type
+
+from pydantic import BaseModel
+
+ALL_FIELDS = "all"
+
+
+def projection(model: Type[BaseModel], fields: str | List[str]) -> str:
+    """
+    Builds a Trello `fields` value, adding any fields `model` requires.
+
+    Args:
+        model (Type[BaseModel]): The model the response will be parsed into.
+        fields (str | List[str]): Comma-separated field names, a list of names, or "all".
+
+    Returns:
+        str: The value for Trello's `fields` query parameter.
+    """
+    if isinstance(fields, str):
+        if fields.strip() == ALL_FIELDS:
+            return ALL_FIELDS
+        fields = fields.split(",")
+    required = [name for name, info in model.model_fields.items() if info.is_required()]
+    requested = [name.strip() for name in fields if name.strip()]
+    return ",".join(dict.fromkeys(required + requested))
+
+
+def field_params(
+    model: Type[BaseModel], fields: str | List[str] | None
+) -> Dict[str, str] | None:
+    """Returns the query params projecting a request onto `fields`, or None for Trello's defaults."""
+    if not fields:
+        return None
+    return {"fields": projection(model, fields)}
@@ -0,0 +1,73 @@
+# json_codec.py
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+AUTO = "auto"
+ORJSON = "orjson"
+STDLIB = "stdlib"
+
+
+class StdlibCodec:
+    """JSON codec backed by the standard library."""
+
+    name = STDLIB
+
+    def loads(self, data: bytes) -> Any:
+        # json.loads detects the UTF encoding of bytes itself
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class OrjsonCodec:
+    """JSON codec backed by orjson, which parses bytes without decoding them to str first."""
+
+    name = ORJSON
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+def _orjson_available() -> bool:
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_codec(name: str = AUTO) -> StdlibCodec | OrjsonCodec:
+    """
+    Returns the JSON codec to use for Trello request and response bodies.
+
+    Args:
+        name (str): "auto" picks orjson when installed and the stdlib otherwise;
+            "orjson" or "stdlib" select a backend explicitly.
+
+    Returns:
+        StdlibCodec | OrjsonCodec: The selected codec.
+    """
+    if name not in (AUTO, ORJSON, STDLIB):
+        raise ValueError(f"Unknown JSON codec: {name}")
+    if name == STDLIB:
+        return StdlibCodec()
+    if _orjson_available():
+        return OrjsonCodec()
+    if name == ORJSON:
+        logger.warning(
+            "orjson JSON codec requested but the 'orjson' package is not installed "
+            "(pip install orjson). Falling back to the standard library."
+        )
+    return StdlibCodec()
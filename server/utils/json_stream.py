@@ -0,0 +1,77 @@
+# json_stream.py
+import json
+from typing import Any, List
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class JSONArrayStreamParser:
+    """
+    Incrementally parses the elements of a top-level JSON array.
+
+    Text is fed in arbitrary chunks and every element that has been fully
+    received is returned right away, so callers can process large collections
+    without holding the whole response body in memory.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = 0
+        self.count = 0
+        self.started = False
+        self.finished = False
+        # True after "[" or ",", when the next token must be an element
+        self.expect_item = True
+
+    def feed(self, text: str) -> List[Any]:
+        """Adds a chunk of text and returns the elements it completed."""
+        if self.finished:
+            if text.strip(_WHITESPACE):
+                raise ValueError("Unexpected data after the end of the JSON array")
+            return []
+        # Only the unparsed tail of the previous chunk is kept
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        items = []
+        while not self.finished:
+            self._skip_whitespace()
+            if self.pos >= len(self.buffer):
+                break
+            char = self.buffer[self.pos]
+            if not self.started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self.started = True
+                self.pos += 1
+            elif char == "]" and (not self.expect_item or self.count == 0):
+                self.finished = True
+                self.pos += 1
+            elif not self.expect_item:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+                self.expect_item = True
+                self.pos += 1
+            else:
+                try:
+                    item, end = _decoder.raw_decode(self.buffer, self.pos)
+                except json.JSONDecodeError:
+                    # The element is incomplete; wait for more data
+                    break
+                if end >= len(self.buffer) and not isinstance(item, (dict, list, str)):
+                    # A number or literal at the end of the buffer may still be growing
+                    break
+                items.append(item)
+                self.count += 1
+                self.pos = end
+                self.expect_item = False
+        return items
+
+    def close(self):
+        """Raises if the array was not received in full."""
+        if not self.finished:
+            raise ValueError("Incomplete JSON array in response")
+
+    def _skip_whitespace(self):
+        while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+            self.pos += 1
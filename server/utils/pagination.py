@@ -0,0 +1,138 @@
+# pagination.py
+import base64
+import binascii
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, List, Sequence, Tuple
+
+from server.models import Page
+
+# Seconds a paginated result stays available to later pages
+DEFAULT_SNAPSHOT_TTL = 300.0
+DEFAULT_MAX_SNAPSHOTS = 64
+
+
+class CursorError(ValueError):
+    """Raised for a malformed, expired or mismatched pagination cursor."""
+
+
+class SnapshotStore:
+    """
+    Short-lived store of tool results being paged through.
+
+    The first page of a result stores the full item list under a random ID,
+    so later pages are served from the snapshot without refetching and stay
+    consistent with the first one. Snapshots expire after `ttl` seconds and
+    the least recently used are dropped beyond `max_snapshots`.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_SNAPSHOT_TTL,
+        max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+    ):
+        self.ttl = ttl
+        self.max_snapshots = max_snapshots
+        self.snapshots: OrderedDict[str, Tuple[float, str, Sequence[Any]]] = OrderedDict()
+
+    def put(self, scope: str, items: Sequence[Any]) -> str:
+        """Stores `items` for the query identified by `scope` and returns the snapshot ID."""
+        self._expire()
+        snapshot_id = secrets.token_urlsafe(9)
+        self.snapshots[snapshot_id] = (time.monotonic() + self.ttl, scope, items)
+        while len(self.snapshots) > self.max_snapshots:
+            self.snapshots.popitem(last=False)
+        return snapshot_id
+
+    def get(self, snapshot_id: str, scope: str) -> Sequence[Any]:
+        """Returns the items of a snapshot, raising `CursorError` if it is gone or for another query."""
+        self._expire()
+        entry = self.snapshots.get(snapshot_id)
+        if entry is None:
+            raise CursorError("Cursor has expired; request the first page again")
+        if entry[1] != scope:
+            raise CursorError("Cursor belongs to a different query")
+        self.snapshots.move_to_end(snapshot_id)
+        return entry[2]
+
+    def _expire(self):
+        now = time.monotonic()
+        for snapshot_id in [
+            snapshot_id
+            for snapshot_id, (expires, _, _) in self.snapshots.items()
+            if expires < now
+        ]:
+            del self.snapshots[snapshot_id]
+
+
+snapshots = SnapshotStore()
+
+
+def set_snapshot_limits(ttl: float, max_snapshots: int):
+    """Sets how long and how many paginated results are kept for later pages."""
+    if ttl <= 0 or max_snapshots < 1:
+        raise ValueError("Snapshot ttl must be > 0 and max_snapshots >= 1")
+    snapshots.ttl = ttl
+    snapshots.max_snapshots = max_snapshots
+
+
+def encode_cursor(snapshot_id: str, offset: int, limit: int) -> str:
+    raw = f"{snapshot_id}:{offset}:{limit}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        snapshot_id, offset, limit = raw.split(":")
+        return snapshot_id, int(offset), int(limit)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise CursorError(f"Invalid cursor: {cursor}")
+
+
+def _page(snapshot_id: str | None, items: Sequence[Any], offset: int, limit: int) -> Page:
+    end = offset + limit
+    next_cursor = (
+        encode_cursor(snapshot_id, end, limit)
+        if snapshot_id is not None and end < len(items)
+        else None
+    )
+    return Page(items=list(items[offset:end]), total=len(items), next_cursor=next_cursor)
+
+
+def first_page(scope: str, items: List[Any], limit: int) -> Page:
+    """
+    Returns the first `limit` items, keeping the rest in a snapshot for later pages.
+
+    Args:
+        scope (str): Identifies the query, e.g. "cards:<list_id>"; cursors only work for the same scope.
+        items (List[Any]): The full result.
+        limit (int): Maximum number of items per page.
+
+    Returns:
+        Page: The first page, with a `next_cursor` if more items remain.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    snapshot_id = snapshots.put(scope, tuple(items)) if len(items) > limit else None
+    return _page(snapshot_id, items, 0, limit)
+
+
+def next_page(scope: str, cursor: str, limit: int | None = None) -> Page:
+    """
+    Returns the page a cursor points at, served from the result snapshot.
+
+    Args:
+        scope (str): Identifies the query; must match the scope of the first page.
+        cursor (str): The `next_cursor` of the previous page.
+        limit (int, optional): Page size. Defaults to the page size of the first page.
+
+    Returns:
+        Page: The requested page, with a `next_cursor` if more items remain.
+    """
+    snapshot_id, offset, cursor_limit = decode_cursor(cursor)
+    limit = limit or cursor_limit
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    return _page(snapshot_id, snapshots.get(snapshot_id, scope), offset, limit)
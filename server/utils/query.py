@@ -0,0 +1,98 @@
+# query.py
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from server.models import TrelloCard
+
+OPEN = "open"
+CLOSED = "closed"
+ALL = "all"
+CARD_STATUSES = (OPEN, CLOSED, ALL)
+
+
+def parse_date(value: str) -> datetime:
+    """Parses an ISO 8601 date, treating dates without a timezone as UTC."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+@dataclass
+class CardQuery:
+    """
+    Card filters of a tool call, split into what Trello applies server-side
+    and what is left to apply to the returned cards.
+
+    Status is pushed down through the `/cards/{filter}` collection path and
+    creation dates through `since`/`before`, which Trello compares against the
+    timestamp embedded in card IDs. "Created or updated since" has no Trello
+    equivalent, so `active_since` is always applied locally, and `limit` is
+    only pushed down when no local filter could drop cards after it.
+    Pushed-down filters are re-checked locally, which is cheap and keeps
+    results correct where Trello ignores a parameter.
+    """
+
+    status: str | None = None  # None keeps Trello's default, open cards for lists
+    created_since: datetime | None = None
+    created_before: datetime | None = None
+    active_since: datetime | None = None  # Created or last active on/after this date
+    limit: int | None = None
+
+    def __post_init__(self):
+        if self.status is not None and self.status not in CARD_STATUSES:
+            raise ValueError(f"Unknown card status: {self.status}")
+        if self.limit is not None and self.limit < 1:
+            raise ValueError("limit must be >= 1")
+
+    def path(self, list_id: str) -> str:
+        """Returns the Trello endpoint for the cards of `list_id` with the status filter applied."""
+        if self.status in (None, OPEN):
+            return f"/lists/{list_id}/cards"
+        return f"/lists/{list_id}/cards/{self.status}"
+
+    def params(self) -> Dict[str, str]:
+        """Returns the query params for the filters Trello can apply."""
+        params = {}
+        if self.created_since:
+            params["since"] = self.created_since.isoformat()
+        if self.created_before:
+            params["before"] = self.created_before.isoformat()
+        if self.limit and not self.active_since:
+            params["limit"] = str(self.limit)
+        return params
+
+    def matches(self, card: TrelloCard, pushed: bool = True) -> bool:
+        """
+        Checks a card against the filters.
+
+        Args:
+            card (TrelloCard): The card to check.
+            pushed (bool): Whether the status filter was already applied by Trello.
+
+        Returns:
+            bool: True if the card passes every filter.
+        """
+        if not pushed and self.status in (OPEN, CLOSED):
+            if card.closed != (self.status == CLOSED):
+                return False
+        created = card.creationDate
+        if self.created_since and (created is None or created < self.created_since):
+            return False
+        if self.created_before and (created is None or created >= self.created_before):
+            return False
+        if self.active_since:
+            updated = card.dateLastActivity
+            if not (
+                (created and created >= self.active_since)
+                or (updated and updated >= self.active_since)
+            ):
+                return False
+        return True
+
+    def apply(self, cards: List[TrelloCard], pushed: bool = True) -> List[TrelloCard]:
+        """Returns the cards that pass the filters, up to `limit`."""
+        if self.status is not None or self.created_since or self.created_before or self.active_since:
+            cards = [card for card in cards if self.matches(card, pushed)]
+        return cards[: self.limit] if self.limit else cards
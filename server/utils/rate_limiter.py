@@ -0,0 +1,135 @@
+# rate_limiter.py
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Trello limits: 300 requests / 10s per API key, 100 requests / 10s per token.
+TRELLO_KEY_MAX = 300
+TRELLO_TOKEN_MAX = 100
+TRELLO_INTERVAL = 10.0
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of blocking.
+
+    Each reservation consumes a token immediately, letting the balance go
+    negative, and returns how long the caller must wait before its token is
+    actually available. Because asyncio is single-threaded this keeps callers
+    in FIFO order without a lock.
+    """
+
+    def __init__(self, capacity: int, interval: float):
+        self.capacity = capacity
+        self.interval = interval
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.interval
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Consumes one token and returns the seconds until it is available."""
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def sync(self, remaining: int, capacity: int | None, interval: float | None):
+        """Resynchronizes the bucket with the budget reported by Trello."""
+        self._refill(time.monotonic())
+        if capacity:
+            self.capacity = capacity
+        if interval:
+            self.interval = interval
+        # Trello has not seen requests we reserved but have not sent yet, so only
+        # ever lower our local estimate.
+        self.tokens = min(self.tokens, float(remaining))
+
+
+class TrelloRateLimiter:
+    """
+    Client-side limiter modelling Trello's per-key and per-token windows.
+
+    Callers await `acquire()` before every request; requests beyond the budget
+    are queued until tokens refill. `update_from_headers()` keeps the buckets
+    in line with the `x-rate-limit-*` headers returned by Trello.
+    """
+
+    def __init__(
+        self,
+        key_max: int = TRELLO_KEY_MAX,
+        token_max: int = TRELLO_TOKEN_MAX,
+        interval: float = TRELLO_INTERVAL,
+    ):
+        self.buckets = {
+            "api-key": TokenBucket(key_max, interval),
+            "api-token": TokenBucket(token_max, interval),
+        }
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def acquire(self) -> float:
+        """
+        Waits until a request may be sent.
+
+        Returns:
+            float: The time in seconds the request spent queued.
+        """
+        now = time.monotonic()
+        wait = max(bucket.reserve(now) for bucket in self.buckets.values())
+        wait = max(wait, self.blocked_until - now)
+        self.requests += 1
+        if wait > 0:
+            self.queued += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            logger.debug(f"Trello request queued for {wait:.3f}s by rate limiter")
+            await asyncio.sleep(wait)
+        return max(wait, 0.0)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """Resyncs the buckets with Trello's `x-rate-limit-*` response headers."""
+        for name, bucket in self.buckets.items():
+            remaining = headers.get(f"x-rate-limit-{name}-remaining")
+            if remaining is None:
+                continue
+            try:
+                capacity = headers.get(f"x-rate-limit-{name}-max")
+                interval_ms = headers.get(f"x-rate-limit-{name}-interval-ms")
+                bucket.sync(
+                    int(remaining),
+                    int(capacity) if capacity else None,
+                    int(interval_ms) / 1000 if interval_ms else None,
+                )
+            except ValueError:
+                logger.warning(f"Ignoring malformed Trello rate limit headers for {name}")
+
+    def backoff(self, seconds: float):
+        """Holds every queued request for `seconds`, e.g. after a 429."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "max_wait_seconds": round(self.max_wait, 3),
+            "tokens": {
+                name: round(bucket.tokens, 2) for name, bucket in self.buckets.items()
+            },
+        }
@@ -0,0 +1,186 @@
+# search_index.py
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from server.models import BoardSnapshot, CardSearchHit, TrelloCard
+
+TOKEN_PATTERN = re.compile(r"\w+")
+# Weight of one occurrence of a term, by the card field it appears in
+FIELD_WEIGHTS = {"name": 3.0, "labels": 2.0, "desc": 1.0, "checkItems": 1.0}
+# Query terms at least this long also match longer terms they are a prefix of
+MIN_PREFIX_LENGTH = 3
+# Prefix matches count for less than exact ones
+PREFIX_FACTOR = 0.5
+# BM25 term frequency saturation
+SATURATION = 1.2
+
+CardText = Tuple[str, str, str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+class CardSearchIndex:
+    """
+    In-memory inverted index over the cards of loaded boards.
+
+    Card names, descriptions, label names and checklist item text are
+    indexed with per-field weights, and queries are ranked BM25-style. All
+    query terms must match; terms of MIN_PREFIX_LENGTH or more also match as
+    prefixes. Register `update` as a board snapshot store listener: boards
+    are reindexed when a new snapshot is stored, touching only the cards
+    whose text changed, and dropped when their snapshot is invalidated.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, float]] = {}  # term -> card ID -> weight
+        self.texts: Dict[str, Tuple[str, CardText]] = {}  # card ID -> (board ID, indexed text)
+        self.terms: Dict[str, Dict[str, float]] = {}  # card ID -> term -> weight
+        self.cards: Dict[str, TrelloCard] = {}
+        self.boards: Dict[str, Set[str]] = {}  # board ID -> card IDs
+        self._vocabulary: Optional[List[str]] = None  # Sorted terms, rebuilt when needed
+
+    def update(self, board_id: str, snapshot: Optional[BoardSnapshot]):
+        """Snapshot store listener keeping the index in step with the loaded boards."""
+        if snapshot is None:
+            self.remove_board(board_id)
+        else:
+            self.index_board(snapshot)
+
+    def index_board(self, snapshot: BoardSnapshot):
+        """Indexes the cards of a board snapshot, replacing its previous cards."""
+        board_id = snapshot.id
+        card_ids = set()
+        for card in snapshot.cards:
+            card_ids.add(card.id)
+            self.cards[card.id] = card
+            text = self._card_text(snapshot, card)
+            if self.texts.get(card.id) == (board_id, text):
+                continue
+            self._remove_card(card.id)
+            self._add_card(card.id, board_id, text)
+        for card_id in self.boards.get(board_id, set()) - card_ids:
+            self._drop(card_id, board_id)
+        self.boards[board_id] = card_ids
+
+    def remove_board(self, board_id: str):
+        for card_id in self.boards.pop(board_id, ()):
+            self._drop(card_id, board_id)
+
+    def search(
+        self, query: str, board_ids: Iterable[str] | None = None, limit: int = 20
+    ) -> List[CardSearchHit]:
+        """
+        Returns the cards matching every term of `query`, best first.
+
+        Args:
+            query (str): Free text; case and punctuation are ignored.
+            board_ids (Iterable[str], optional): Only search these boards. Defaults to all indexed boards.
+            limit (int): Maximum number of results. Defaults to 20.
+
+        Returns:
+            List[CardSearchHit]: The matching cards and their scores.
+        """
+        scores: Dict[str, float] | None = None
+        for term in dict.fromkeys(tokenize(query)):
+            term_scores = self._term_scores(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    card_id: score + term_scores[card_id]
+                    for card_id, score in scores.items()
+                    if card_id in term_scores
+                }
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        if board_ids is not None:
+            allowed = set(board_ids)
+            scores = {
+                card_id: score
+                for card_id, score in scores.items()
+                if self.texts[card_id][0] in allowed
+            }
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [CardSearchHit(card=self.cards[card_id], score=round(score, 4)) for card_id, score in best]
+
+    def _term_scores(self, term: str) -> Dict[str, float]:
+        """Scores the cards containing `term`, or a term it is a prefix of."""
+        matches = [(term, 1.0)] if term in self.postings else []
+        if len(term) >= MIN_PREFIX_LENGTH:
+            vocabulary = self._sorted_vocabulary()
+            index = bisect_left(vocabulary, term)
+            while index < len(vocabulary) and vocabulary[index].startswith(term):
+                if vocabulary[index] != term:
+                    matches.append((vocabulary[index], PREFIX_FACTOR))
+                index += 1
+        total = len(self.texts)
+        scores: Dict[str, float] = {}
+        for match, factor in matches:
+            postings = self.postings[match]
+            idf = math.log(1 + total / len(postings))
+            for card_id, weight in postings.items():
+                score = factor * idf * weight * (SATURATION + 1) / (weight + SATURATION)
+                if score > scores.get(card_id, 0.0):
+                    scores[card_id] = score
+        return scores
+
+    def _sorted_vocabulary(self) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    @staticmethod
+    def _card_text(snapshot: BoardSnapshot, card: TrelloCard) -> CardText:
+        labels = card.labels or [
+            label for label in map(snapshot.get_label, card.idLabels) if label is not None
+        ]
+        check_items = [
+            item.name
+            for checklist in snapshot.checklists_for_card(card.id)
+            for item in checklist.checkItems
+        ]
+        return (
+            card.name,
+            " ".join(label.name for label in labels),
+            card.desc or "",
+            "\n".join(check_items),
+        )
+
+    def _add_card(self, card_id: str, board_id: str, text: CardText):
+        weights: Counter = Counter()
+        for field_text, weight in zip(text, FIELD_WEIGHTS.values()):
+            for term in tokenize(field_text):
+                weights[term] += weight
+        for term, weight in weights.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                self._vocabulary = None
+            postings[card_id] = weight
+        self.texts[card_id] = (board_id, text)
+        self.terms[card_id] = dict(weights)
+
+    def _remove_card(self, card_id: str):
+        for term in self.terms.pop(card_id, ()):
+            postings = self.postings[term]
+            del postings[card_id]
+            if not postings:
+                del self.postings[term]
+                self._vocabulary = None
+        self.texts.pop(card_id, None)
+
+    def _drop(self, card_id: str, board_id: str):
+        """Removes a card indexed for `board_id`, unless it has since moved to another board."""
+        entry = self.texts.get(card_id)
+        if entry is not None and entry[0] != board_id:
+            return
+        self._remove_card(card_id)
+        self.cards.pop(card_id, None)
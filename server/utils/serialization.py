@@ -0,0 +1,142 @@
+# serialization.py
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, get_args, get_origin
+
+from mcp.types import CallToolResult, TextContent
+from pydantic import BaseModel
+
+from server.models import Page, list_adapter
+
+# "full" returns every field; "compact" drops nulls and defaults to save tokens
+FULL = "full"
+COMPACT = "compact"
+# Tool parameter type, so MCP clients see the allowed modes in the tool schema
+OutputMode = Literal["full", "compact"]
+DEFAULT_MAX_DESC_LENGTH = 500
+TRUNCATION_MARK = "…"
+
+_output_mode = FULL
+_flatten_labels = True
+_max_desc_length = DEFAULT_MAX_DESC_LENGTH
+
+
+def set_output_mode(
+    mode: str,
+    flatten_labels: bool = True,
+    max_desc_length: int = DEFAULT_MAX_DESC_LENGTH,
+):
+    """
+    Selects the server-wide output mode for tool results.
+
+    Args:
+        mode (str): "full" or "compact".
+        flatten_labels (bool): In compact mode, replace card labels by their names.
+        max_desc_length (int): In compact mode, truncate longer descriptions. 0 disables the cap.
+    """
+    global _output_mode, _flatten_labels, _max_desc_length
+    if mode not in (FULL, COMPACT):
+        raise ValueError(f"Unknown output mode: {mode}")
+    if max_desc_length < 0:
+        raise ValueError("max_desc_length must be >= 0")
+    _output_mode = mode
+    _flatten_labels = flatten_labels
+    _max_desc_length = max_desc_length
+
+
+@lru_cache(maxsize=None)
+def _plan(model: Type[BaseModel]) -> Tuple[bool, bool, Tuple[Tuple[str, type], ...]]:
+    """
+    Works out once per model type whether labels can be flattened, whether
+    desc can be capped, and which fields hold nested models to shrink too.
+    """
+    fields = model.model_fields
+    # Flattened names go to an extra key so the result still validates against the model
+    flatten = "labels" in fields and "labelNames" not in fields
+    nested = []
+    for name, info in fields.items():
+        annotation = info.annotation
+        if get_origin(annotation) in (list, List):
+            annotation = get_args(annotation)[0]
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested.append((name, annotation))
+    return flatten, "desc" in fields, tuple(nested)
+
+
+def _shrink(item: Dict[str, Any], model: Type[BaseModel]) -> Dict[str, Any]:
+    flatten, cap, nested = _plan(model)
+    if flatten and _flatten_labels and "labels" in item:
+        item["labelNames"] = [label["name"] for label in item.pop("labels")]
+    if cap and _max_desc_length:
+        desc = item.get("desc")
+        if desc and len(desc) > _max_desc_length:
+            item["desc"] = desc[: _max_desc_length] + TRUNCATION_MARK
+    for name, nested_model in nested:
+        value = item.get(name)
+        if isinstance(value, dict):
+            _shrink(value, nested_model)
+        elif isinstance(value, list):
+            for entry in value:
+                if isinstance(entry, dict):
+                    _shrink(entry, nested_model)
+    return item
+
+
+def compact_dump(value: Any) -> Any:
+    """
+    Dumps a model or list of models to JSON-ready data without nulls or defaults.
+
+    Lists of one model type are dumped in a single pydantic-core pass.
+    """
+    if isinstance(value, Page):
+        # Pages are built without a type parameter, so items are dumped by their own type
+        data = value.model_dump(mode="json", exclude_none=True, exclude={"items"})
+        data["items"] = compact_dump(value.items)
+        return data
+    if isinstance(value, BaseModel):
+        data = value.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
+        return _shrink(data, type(value))
+    if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+        model = type(value[0])
+        if all(type(item) is model for item in value):
+            data = list_adapter(model).dump_python(
+                value, mode="json", exclude_none=True, exclude_defaults=True
+            )
+            return [_shrink(item, model) for item in data]
+        return [compact_dump(item) for item in value]
+    return value
+
+
+def format_result(
+    value: Any, output_mode: Optional[OutputMode] = None, wrap: Optional[bool] = None
+) -> Any:
+    """
+    Formats a tool result according to the requested or server-wide output mode.
+
+    In full mode the value is returned unchanged and FastMCP serializes it as
+    usual. In compact mode it is returned as a ready-made `CallToolResult`
+    whose structured content still validates against the tool's return type.
+
+    Args:
+        value (Any): The tool result, usually a model or list of models.
+        output_mode (str, optional): "full" or "compact". Defaults to the server-wide mode.
+        wrap (bool, optional): Whether FastMCP wraps the tool's return type in {"result": ...}.
+            Defaults to wrapping anything but a single model; tools returning a union must pass True.
+
+    Returns:
+        Any: The value itself, or a `CallToolResult` in compact mode.
+    """
+    mode = output_mode or _output_mode
+    if mode not in (FULL, COMPACT):
+        raise ValueError(f"Unknown output mode: {mode}")
+    if mode == FULL:
+        return value
+    data = compact_dump(value)
+    text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    if wrap is None:
+        # FastMCP wraps return types other than a model or dict in {"result": ...}
+        wrap = not isinstance(data, dict)
+    structured = {"result": data} if wrap else data
+    return CallToolResult(
+        content=[TextContent(type="text", text=text)], structuredContent=structured
+    )
@@ -0,0 +1,68 @@
+# singleflight.py
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one upstream call.
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same result, and its exception if it fails. A caller
+    being cancelled only cancels the upstream call when no one else is
+    waiting on it.
+    """
+
+    def __init__(self):
+        self.calls: Dict[Hashable, _Call] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        call = self.calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(func()))
+            self.calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Removed now, not in the done-callback, so later callers never join a cancelled call
+                if self.calls.get(key) is call:
+                    del self.calls[key]
+                call.task.cancel()
+
+    def forget(self):
+        """
+        Stops new callers from joining calls already in flight, e.g. after a
+        write made their results stale. Current waiters are unaffected.
+        """
+        self.calls.clear()
+
+    def _forget(self, key: Hashable, call: _Call):
+        if self.calls.get(key) is call:
+            del self.calls[key]
+        if not call.task.cancelled():
+            # Mark the exception as retrieved in case every waiter was cancelled
+            call.task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self.calls),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
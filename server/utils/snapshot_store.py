@@ -0,0 +1,73 @@
+# snapshot_store.py
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from server.models import BoardSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Seconds a loaded board snapshot is reused before it is fetched again
+DEFAULT_SNAPSHOT_MAX_AGE = 60.0
+
+SnapshotListener = Callable[[str, Optional[BoardSnapshot]], None]
+
+
+class BoardSnapshotStore:
+    """
+    In-memory board snapshots shared by every tool.
+
+    Listeners are called with the board ID and the new snapshot whenever one
+    is stored, and with None when it is dropped, so derived state can follow
+    the board. Writes through the Trello client drop the snapshots they touch.
+    """
+
+    def __init__(self, max_age: float = DEFAULT_SNAPSHOT_MAX_AGE):
+        self.max_age = max_age
+        self.snapshots: Dict[str, Tuple[float, BoardSnapshot]] = {}
+        self.listeners: List[SnapshotListener] = []
+
+    def add_listener(self, listener: SnapshotListener):
+        self.listeners.append(listener)
+
+    def get(self, board_id: str, max_age: float | None = None) -> Optional[BoardSnapshot]:
+        """Returns the board's snapshot if it is younger than `max_age` seconds, else None."""
+        entry = self.snapshots.get(board_id)
+        if entry is None:
+            return None
+        loaded_at, snapshot = entry
+        if time.monotonic() - loaded_at > (self.max_age if max_age is None else max_age):
+            return None
+        return snapshot
+
+    def put(self, snapshot: BoardSnapshot):
+        self.snapshots[snapshot.id] = (time.monotonic(), snapshot)
+        self._notify(snapshot.id, snapshot)
+
+    def touch(self, snapshot: BoardSnapshot):
+        """Marks a stored snapshot as fresh without notifying listeners, e.g. when a sync found no changes."""
+        if snapshot.id not in self.snapshots:
+            self.put(snapshot)
+            return
+        self.snapshots[snapshot.id] = (time.monotonic(), snapshot)
+
+    def discard(self, board_id: str):
+        if self.snapshots.pop(board_id, None) is not None:
+            self._notify(board_id, None)
+
+    def invalidate(self, ids: Iterable[str]):
+        """Drops every snapshot containing one of `ids`, e.g. after a write."""
+        ids = set(ids)
+        for board_id, (_, snapshot) in list(self.snapshots.items()):
+            if any(snapshot.contains(resource_id) for resource_id in ids):
+                self.discard(board_id)
+
+    def board_ids(self) -> List[str]:
+        return list(self.snapshots)
+
+    def _notify(self, board_id: str, snapshot: Optional[BoardSnapshot]):
+        for listener in self.listeners:
+            try:
+                listener(board_id, snapshot)
+            except Exception:
+                logger.exception(f"Board snapshot listener failed for board {board_id}")
@@ -0,0 +1,78 @@
+# summary.py
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from server.models import BoardSnapshot, BoardSummary, LabelSummary, ListSummary
+
+# Cards due within this window count as due soon
+DUE_SOON = timedelta(days=7)
+
+
+def summarize_board(snapshot: BoardSnapshot, now: datetime | None = None) -> BoardSummary:
+    """
+    Computes a board's card counts in one pass over its snapshot.
+
+    Args:
+        snapshot (BoardSnapshot): The board and its contents.
+        now (datetime, optional): The time overdue and due-soon cards are measured against. Defaults to now.
+
+    Returns:
+        BoardSummary: Counts per list, member and label, due dates and checklist completion.
+    """
+    now = now or datetime.now(timezone.utc)
+    per_list: Counter = Counter()
+    per_member: Counter = Counter()
+    per_label: Counter = Counter()
+    overdue = due_soon = unassigned = 0
+    for card in snapshot.cards:
+        per_list[card.idList] += 1
+        if card.due and not card.dueComplete:
+            if card.due < now:
+                overdue += 1
+            elif card.due < now + DUE_SOON:
+                due_soon += 1
+        if not card.idMembers:
+            unassigned += 1
+        for member_id in card.idMembers:
+            member = snapshot.get_member(member_id)
+            per_member[(member.username or member_id) if member else member_id] += 1
+        # Keyed by ID, as labels may share a name, or have none and share a color
+        for label_id in card.idLabels or [label.id for label in card.labels]:
+            per_label[label_id] += 1
+
+    items = complete = 0
+    for checklist in snapshot.checklists:
+        if checklist.idCard and snapshot.get_card(checklist.idCard) is None:
+            continue  # Belongs to an archived card
+        items += len(checklist.checkItems)
+        complete += sum(item.checked for item in checklist.checkItems)
+
+    labels = []
+    for label_id, count in per_label.most_common():
+        label = snapshot.get_label(label_id)
+        labels.append(
+            LabelSummary(
+                id=label_id,
+                name=label.name if label else None,
+                color=label.color if label else None,
+                cards=count,
+            )
+        )
+
+    return BoardSummary(
+        board_id=snapshot.id,
+        name=snapshot.board.name,
+        cards=len(snapshot.cards),
+        lists=[
+            ListSummary(id=trello_list.id, name=trello_list.name, cards=per_list[trello_list.id])
+            for trello_list in sorted(snapshot.lists, key=lambda trello_list: trello_list.pos)
+        ],
+        overdue=overdue,
+        due_soon=due_soon,
+        checklist_items=items,
+        checklist_items_complete=complete,
+        checklist_completion=round(complete / items, 3) if items else None,
+        cards_per_member=dict(per_member.most_common()),
+        unassigned=unassigned,
+        cards_per_label=labels,
+    )
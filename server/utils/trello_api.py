@@ -1,13 +1,35 @@
 # trello_api.py
 import logging
 import asyncio
+from typing import Any, AsyncIterator, Callable, List, Set
 
 import httpx
 
+from server.utils.cache import MISS, ResponseCache, endpoint_ids, parent_ids
+from server.utils.concurrency import gather_bounded
+from server.utils.json_codec import OrjsonCodec, StdlibCodec, get_codec
+from server.utils.json_stream import JSONArrayStreamParser
+from server.utils.rate_limiter import TrelloRateLimiter
+from server.utils.singleflight import SingleFlight
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 TRELLO_API_BASE = "https://api.trello.com/1"
+BATCH_MAX_URLS = 10  # Trello rejects /batch calls with more routes than this
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=10.0)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 def trello_rate_limit_handler(func):
@@ -29,6 +51,8 @@ def trello_rate_limit_handler(func):
                         wait_time = int(retry_after)
                     else:
                         wait_time = delay * (2**attempt)  # exponential backoff
+                    if self.rate_limiter:
+                        self.rate_limiter.backoff(wait_time)
                     await asyncio.sleep(wait_time)
                     continue
                 raise
@@ -53,24 +77,151 @@ class TrelloClient:
     Client class for interacting with the Trello API over REST.
     """
 
-    def __init__(self, api_key: str, token: str):
+    def __init__(
+        self,
+        api_key: str,
+        token: str,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        rate_limiter: TrelloRateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        codec: StdlibCodec | OrjsonCodec | None = None,
+    ):
         self.api_key = api_key
         self.token = token
         self.base_url = TRELLO_API_BASE
-        self.client = httpx.AsyncClient(base_url=self.base_url)
+        self.limits = limits or DEFAULT_LIMITS
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        if http2 and not _http2_available():
+            logger.warning(
+                "HTTP/2 requested but the 'h2' package is not installed "
+                "(pip install 'httpx[http2]'). Falling back to HTTP/1.1."
+            )
+            http2 = False
+        self.http2 = http2
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=self.limits,
+            timeout=self.timeout,
+            http2=self.http2,
+            transport=transport,
+        )
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        # Identical concurrent GETs share one upstream request
+        self.inflight = SingleFlight() if coalesce else None
+        # Encodes request bodies and decodes responses straight from bytes
+        self.codec = codec or get_codec()
+        # Called with the IDs touched by every successful write or reported change
+        self.write_listeners: List[Callable[[Set[str]], None]] = []
+        self._warmed_up = False
 
     async def close(self):
         await self.client.aclose()
 
+    async def warm_up(self):
+        """
+        Opens a pooled connection to the Trello API ahead of the first tool call,
+        so the TCP and TLS handshakes are not paid on the request path.
+
+        Failures are logged and ignored; the client will simply connect lazily.
+        """
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+        try:
+            await self.client.head("/")
+            logger.info("Trello API connection pool warmed up")
+        except httpx.HTTPError as e:
+            logger.warning(f"Trello API warm-up failed: {e}")
+
+    def stats(self) -> dict:
+        """Returns runtime counters for the client's rate limiter, cache and coalescing."""
+        return {
+            "rate_limiter": self.rate_limiter.stats() if self.rate_limiter else None,
+            "cache": self.cache.stats() if self.cache else None,
+            "inflight": self.inflight.stats() if self.inflight else None,
+        }
+
+    def add_write_listener(self, listener: Callable[[Set[str]], None]):
+        """Registers a callback receiving the resource IDs touched by each successful write or reported change."""
+        self.write_listeners.append(listener)
+
+    def _invalidate(self, endpoint: str, *payloads):
+        """Drops cached and in-flight responses made stale by a successful write."""
+        self.invalidate(endpoint_ids(endpoint) | parent_ids(*payloads))
+
+    def invalidate(self, ids: Set[str]):
+        """Drops cached and in-flight responses for `ids`, e.g. after a change made outside this client."""
+        if self.cache is not None:
+            self.cache.invalidate(ids)
+        if self.inflight is not None:
+            self.inflight.forget()
+        for listener in self.write_listeners:
+            listener(ids)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        stream: bool = False,
+        json: Any = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends a request through the rate limiter and raises on HTTP errors.
+
+        A `json` body is encoded with the client's codec. With `stream=True`
+        the body is left unread and the caller must close the response.
+        """
+        if json is not None:
+            kwargs["content"] = self.codec.dumps(json)
+            kwargs["headers"] = {"Content-Type": "application/json"}
+        if self.rate_limiter:
+            await self.rate_limiter.acquire()
+        request = self.client.build_request(method, endpoint, **kwargs)
+        response = await self.client.send(request, stream=stream)
+        if self.rate_limiter:
+            self.rate_limiter.update_from_headers(response.headers)
+        if stream and response.is_error:
+            await response.aclose()
+        response.raise_for_status()
+        return response
+
+    async def GET(self, endpoint: str, params: dict | None = None, fresh: bool = False):
+        # A fresh GET skips the cache and any call in flight, but still refreshes the cache
+        if fresh:
+            return await self._fetch(endpoint, params)
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, params)
+            if cached is not MISS:
+                return cached
+        if self.inflight is None:
+            return await self._fetch(endpoint, params)
+        return await self.inflight.do(
+            ResponseCache.make_key(endpoint, params),
+            lambda: self._fetch(endpoint, params),
+        )
+
+    async def _fetch(self, endpoint: str, params: dict | None = None):
+        if self.cache is None:
+            return await self._get(endpoint, params)
+        generation = self.cache.generation
+        result = await self._get(endpoint, params)
+        self.cache.set(endpoint, params, result, generation=generation)
+        return result
+
     @trello_rate_limit_handler
-    async def GET(self, endpoint: str, params: dict | None = None):
+    async def _get(self, endpoint: str, params: dict | None = None):
         all_params = {"key": self.api_key, "token": self.token}
         if params:
             all_params.update(params)
         try:
-            response = await self.client.get(endpoint, params=all_params)
-            response.raise_for_status()
-            return response.json()
+            response = await self._send("GET", endpoint, params=all_params)
+            return self.codec.loads(response.content)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 headers = getattr(e.response, "headers", {})
@@ -98,9 +249,10 @@ class TrelloClient:
     async def POST(self, endpoint: str, data: dict | None = None):
         all_params = {"key": self.api_key, "token": self.token}
         try:
-            response = await self.client.post(endpoint, params=all_params, json=data)
-            response.raise_for_status()
-            return response.json()
+            response = await self._send("POST", endpoint, params=all_params, json=data)
+            result = self.codec.loads(response.content)
+            self._invalidate(endpoint, data, result)
+            return result
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 headers = getattr(e.response, "headers", {})
@@ -128,9 +280,10 @@ class TrelloClient:
     async def PUT(self, endpoint: str, data: dict | None = None):
         all_params = {"key": self.api_key, "token": self.token}
         try:
-            response = await self.client.put(endpoint, params=all_params, json=data)
-            response.raise_for_status()
-            return response.json()
+            response = await self._send("PUT", endpoint, params=all_params, json=data)
+            result = self.codec.loads(response.content)
+            self._invalidate(endpoint, data, result)
+            return result
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 headers = getattr(e.response, "headers", {})
@@ -160,9 +313,10 @@ class TrelloClient:
         if params:
             all_params.update(params)
         try:
-            response = await self.client.delete(endpoint, params=all_params)
-            response.raise_for_status()
-            return response.json()
+            response = await self._send("DELETE", endpoint, params=all_params)
+            result = self.codec.loads(response.content)
+            self._invalidate(endpoint, params, result)
+            return result
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 headers = getattr(e.response, "headers", {})
@@ -185,3 +339,163 @@ class TrelloClient:
                 f"Request error: {e} | endpoint: {endpoint} | params: {redact_sensitive(all_params)}"
             )
             raise httpx.RequestError(f"Failed to delete {endpoint}: {str(e)}")
+
+    async def iter_array(
+        self, endpoint: str, params: dict | None = None
+    ) -> AsyncIterator[Any]:
+        """
+        Streams the elements of a JSON array response as they arrive.
+
+        The body is parsed incrementally from the response stream instead of
+        being loaded whole, which keeps memory flat on very large collections.
+        Streamed responses bypass the response cache.
+
+        Args:
+            endpoint (str): The API endpoint returning a JSON array.
+            params (dict, optional): Extra query parameters.
+
+        Yields:
+            Any: Each decoded element of the array, in order.
+        """
+        response = await self._open_stream(endpoint, params)
+        try:
+            parser = JSONArrayStreamParser()
+            async for text in response.aiter_text():
+                for item in parser.feed(text):
+                    yield item
+            parser.close()
+        finally:
+            await response.aclose()
+
+    @trello_rate_limit_handler
+    async def _open_stream(self, endpoint: str, params: dict | None = None):
+        all_params = {"key": self.api_key, "token": self.token}
+        if params:
+            all_params.update(params)
+        try:
+            return await self._send("GET", endpoint, stream=True, params=all_params)
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error: {e} | endpoint: {endpoint} | params: {redact_sensitive(all_params)}"
+            )
+            raise httpx.HTTPStatusError(
+                f"Failed to stream {endpoint}: {str(e)}",
+                request=e.request,
+                response=e.response,
+            )
+        except httpx.RequestError as e:
+            logger.error(
+                f"Request error: {e} | endpoint: {endpoint} | params: {redact_sensitive(all_params)}"
+            )
+            raise httpx.RequestError(f"Failed to stream {endpoint}: {str(e)}")
+
+    async def paginate(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        page_size: int = 50,
+        max_items: int | None = None,
+        cursor: str = "before",
+        limit_param: str = "limit",
+        page_param: str = "page",
+        items_key: str | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterates over a paged Trello collection, prefetching the next page while
+        the current one is consumed.
+
+        Args:
+            endpoint (str): The API endpoint to page through.
+            params (dict, optional): Extra query parameters sent with every page, e.g. `since`.
+            page_size (int): Items requested per page. Defaults to 50.
+            max_items (int, optional): Stop after yielding this many items.
+            cursor (str): "before" pages newest-first by passing the last item's ID as
+                `before` (actions); "page" increments a page number (search). Defaults to "before".
+            limit_param (str): Name of the page size parameter. Defaults to "limit".
+            page_param (str): Name of the page number parameter for cursor="page". Defaults to "page".
+            items_key (str, optional): Key holding the items when the response is an object.
+
+        Yields:
+            Any: Each item, in the order Trello returns them.
+        """
+        if cursor not in ("before", "page"):
+            raise ValueError(f"Unsupported pagination cursor: {cursor}")
+        if max_items is not None:
+            page_size = min(page_size, max_items)
+
+        async def fetch(page_params: dict) -> list:
+            response = await self.GET(endpoint, params=page_params)
+            return response.get(items_key, []) if items_key else response
+
+        page_params = {**(params or {}), limit_param: page_size}
+        if cursor == "page":
+            page_params[page_param] = 0
+        next_page = asyncio.ensure_future(fetch(page_params))
+        yielded = 0
+        try:
+            while next_page is not None:
+                items = await next_page
+                next_page = None
+                if not items:
+                    break
+                remaining = None if max_items is None else max_items - yielded - len(items)
+                if len(items) == page_size and (remaining is None or remaining > 0):
+                    page_params = dict(page_params)
+                    if cursor == "page":
+                        page_params[page_param] += 1
+                    else:
+                        page_params["before"] = items[-1]["id"]
+                    next_page = asyncio.ensure_future(fetch(page_params))
+                for item in items:
+                    if max_items is not None and yielded >= max_items:
+                        return
+                    yielded += 1
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def BATCH(self, urls: list[str]) -> list[tuple[int, Any]]:
+        """
+        Fetches several GET routes through Trello's /batch endpoint.
+
+        Routes are sent in chunks of up to 10 per call, with the chunks fetched
+        concurrently. Each route's outcome is returned as a `(status_code, body)`
+        tuple in the same order as `urls`; if a whole chunk fails, each of its
+        routes gets that chunk's status (0 without a response) and the
+        exception itself as the body, so callers can tell it from a per-route error.
+
+        Args:
+            urls (list[str]): API routes without the version prefix, e.g. "/cards/{id}".
+
+        Returns:
+            list[tuple[int, Any]]: One (status, body) pair per requested route.
+        """
+        chunks = [
+            urls[start : start + BATCH_MAX_URLS]
+            for start in range(0, len(urls), BATCH_MAX_URLS)
+        ]
+        fanout = await gather_bounded(
+            chunks, lambda chunk: self.GET("/batch", params={"urls": ",".join(chunk)})
+        )
+        results: list[tuple[int, Any]] = []
+        for chunk, outcome in zip(chunks, fanout.outcomes):
+            if isinstance(outcome, httpx.HTTPStatusError):
+                results.extend((outcome.response.status_code, outcome) for _ in chunk)
+            elif isinstance(outcome, BaseException):
+                results.extend((0, outcome) for _ in chunk)
+            else:
+                results.extend(_parse_batch_entry(entry) for entry in outcome)
+        return results
+
+
+def _parse_batch_entry(entry: Any) -> tuple[int, Any]:
+    """Normalizes a /batch entry, which is keyed by its status code on success."""
+    if isinstance(entry, dict):
+        if len(entry) == 1:
+            status, body = next(iter(entry.items()))
+            if status.isdigit():
+                return int(status), body
+        if "statusCode" in entry:
+            return int(entry["statusCode"]), entry.get("message", entry)
+    return 0, entry
@@ -0,0 +1,46 @@
+# webhooks.py
+import base64
+import hashlib
+import hmac
+from typing import Any, Dict, Set
+
+# Header carrying Trello's signature of a webhook delivery
+SIGNATURE_HEADER = "X-Trello-Webhook"
+
+# Entities named in an action's data whose cached state it may change
+ACTION_ENTITIES = ("board", "list", "listBefore", "listAfter", "card", "checklist", "label")
+
+
+def sign(secret: str, body: bytes, callback_url: str) -> str:
+    """Returns Trello's signature of a delivery: base64 HMAC-SHA1 of the body followed by the callback URL."""
+    digest = hmac.new(secret.encode(), body + callback_url.encode(), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode()
+
+
+def verify_signature(secret: str, body: bytes, callback_url: str, signature: str | None) -> bool:
+    """
+    Checks that a delivery was signed by Trello.
+
+    Args:
+        secret (str): The application secret of the API key that registered the webhook.
+        body (bytes): The raw request body.
+        callback_url (str): The callback URL exactly as registered with Trello.
+        signature (str, optional): The value of the X-Trello-Webhook header.
+
+    Returns:
+        bool: True if the signature matches.
+    """
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(secret, body, callback_url), signature)
+
+
+def action_ids(action: Dict[str, Any]) -> Set[str]:
+    """Returns the IDs of the entities an action names, e.g. its card, list and board."""
+    data = action.get("data") or {}
+    ids = set()
+    for name in ACTION_ENTITIES:
+        entity = data.get(name)
+        if isinstance(entity, dict) and isinstance(entity.get("id"), str):
+            ids.add(entity["id"])
+    return ids
@@ -0,0 +1,66 @@
+import json
+import logging
+
+from server.mcp_instance import mcp
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.status import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from server.utils.webhooks import SIGNATURE_HEADER, action_ids, verify_signature
+
+logger = logging.getLogger(__name__)
+
+
+@mcp.custom_route("/webhooks/trello", methods=["HEAD", "POST"])
+async def trello_webhook(request: Request) -> Response:
+    # Trello checks the callback with a HEAD request before creating a webhook
+    if request.method == "HEAD":
+        return Response()
+
+    from server.config import settings
+    from server.tools.snapshot import sync
+    from server.trello import client
+
+    if not settings.TRELLO_API_SECRET or not settings.TRELLO_WEBHOOK_CALLBACK_URL:
+        return JSONResponse(
+            {"status": "error", "reason": "Webhooks are not configured"},
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    body = await request.body()
+    if not verify_signature(
+        settings.TRELLO_API_SECRET,
+        body,
+        settings.TRELLO_WEBHOOK_CALLBACK_URL,
+        request.headers.get(SIGNATURE_HEADER),
+    ):
+        logger.warning("Rejected Trello webhook delivery with an invalid signature")
+        return JSONResponse(
+            {"status": "error", "reason": "Invalid signature"},
+            status_code=HTTP_401_UNAUTHORIZED,
+        )
+    try:
+        payload = json.loads(body)
+        action = payload["action"]
+        webhook = payload["webhook"]
+        board_id = webhook["idModel"]
+    except (ValueError, KeyError, TypeError):
+        return JSONResponse(
+            {"status": "error", "reason": "Malformed delivery"},
+            status_code=HTTP_400_BAD_REQUEST,
+        )
+
+    # Cached responses and snapshots of the touched entities are stale now
+    client.invalidate(action_ids(action) | {board_id})
+    try:
+        result = await sync.receive(board_id, action, webhook.get("id"))
+    except Exception:
+        # Trello retries failed deliveries; the next sync catches up anyway
+        logger.exception(f"Failed to apply webhook action to board {board_id}")
+        result = None
+    return JSONResponse(
+        {"status": "ok", "sync": result.model_dump() if result else None}
+    )
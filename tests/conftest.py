@@ -2,6 +2,41 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from mcp.server.fastmcp import Context
 
+from server.models import STRICT, BoardSnapshot, set_validation_mode
+from server.utils.serialization import FULL, set_output_mode
+
+
+@pytest.fixture(autouse=True)
+def strict_models():
+    # Server startup may select trusted mode; tests always validate strictly
+    set_validation_mode(STRICT)
+
+
+@pytest.fixture(autouse=True)
+def full_output():
+    # Tool tests compare models, so results must not be compacted by default
+    set_output_mode(FULL)
+
+@pytest.fixture
+def make_snapshot():
+    """Builds board snapshots from partial cards and labels, filling in the required fields."""
+
+    def make(board_id="b1", cards=None, checklists=None, labels=None, members=None):
+        return BoardSnapshot.model_validate(
+            {
+                "board": {"id": board_id, "name": "Board", "url": "u"},
+                "cards": [
+                    {"name": card["id"], "idList": "l1", "idBoard": board_id, "url": "u", "pos": 1.0, **card}
+                    for card in cards or []
+                ],
+                "checklists": checklists or [],
+                "labels": [{"idBoard": board_id, **label} for label in labels or []],
+                "members": members or [],
+            }
+        )
+
+    return make
+
 @pytest.fixture
 def mock_context():
     context = AsyncMock(spec=Context)
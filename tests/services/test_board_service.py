@@ -22,7 +22,7 @@ async def test_get_board(board_service, mock_client):
     assert isinstance(board, TrelloBoard)
     assert board.id == board_id
     assert board.name == "Test Board"
-    mock_client.GET.assert_called_once_with(f"/boards/{board_id}")
+    mock_client.GET.assert_called_once_with(f"/boards/{board_id}", params=None)
 
 @pytest.mark.asyncio
 async def test_get_boards(board_service, mock_client):
@@ -37,7 +37,7 @@ async def test_get_boards(board_service, mock_client):
     assert len(boards) == 2
     assert isinstance(boards[0], TrelloBoard)
     assert boards[0].id == "board1"
-    mock_client.GET.assert_called_once_with("/members/me/boards")
+    mock_client.GET.assert_called_once_with("/members/me/boards", params=None)
 
 @pytest.mark.asyncio
 async def test_get_boards_specific_member(board_service, mock_client):
@@ -46,4 +46,18 @@ async def test_get_boards_specific_member(board_service, mock_client):
 
     await board_service.get_boards(member_id)
 
-    mock_client.GET.assert_called_once_with(f"/members/{member_id}/boards")
+    mock_client.GET.assert_called_once_with(f"/members/{member_id}/boards", params=None)
+
+@pytest.mark.asyncio
+async def test_iter_actions(board_service, mock_client):
+    async def pages(endpoint, params=None, page_size=50, max_items=None):
+        yield {"id": "a1", "type": "createCard"}
+
+    mock_client.paginate = MagicMock(side_effect=pages)
+
+    actions = [action async for action in board_service.iter_actions("board1", since="a0", max_items=10)]
+
+    assert actions == [{"id": "a1", "type": "createCard"}]
+    mock_client.paginate.assert_called_once_with(
+        "/boards/board1/actions", params={"since": "a0"}, page_size=50, max_items=10
+    )
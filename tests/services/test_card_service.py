@@ -1,7 +1,10 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from server.services.card import CardService
-from server.models import TrelloCard
+from datetime import datetime, timezone
+
+from server.models import TrelloCard, TrelloCardDetail
+from server.utils.query import CardQuery
 
 @pytest.fixture
 def mock_client():
@@ -29,7 +32,7 @@ async def test_get_card(card_service, mock_client):
     assert isinstance(card, TrelloCard)
     assert card.id == card_id
     assert card.name == "Test Card"
-    mock_client.GET.assert_called_once_with(f"/cards/{card_id}")
+    mock_client.GET.assert_called_once_with(f"/cards/{card_id}", params=None)
 
 @pytest.mark.asyncio
 async def test_get_cards(card_service, mock_client):
@@ -59,7 +62,27 @@ async def test_get_cards(card_service, mock_client):
     assert len(cards) == 2
     assert isinstance(cards[0], TrelloCard)
     assert cards[0].id == "card1"
-    mock_client.GET.assert_called_once_with(f"/lists/{list_id}/cards")
+    mock_client.GET.assert_called_once_with(f"/lists/{list_id}/cards", params=None)
+
+@pytest.mark.asyncio
+async def test_get_cards_by_ids(card_service, mock_client):
+    mock_client.BATCH.return_value = [
+        (200, {
+            "id": "card1", 
+            "name": "Card 1", 
+            "idList": "list1", 
+            "idBoard": "board1", 
+            "url": "http://trello.com/c/1", 
+            "pos": 100.0
+        }),
+        (404, "The requested resource was not found."),
+    ]
+
+    cards, errors = await card_service.get_cards_by_ids(["card1", "card2"])
+
+    assert [card.id for card in cards] == ["card1"]
+    assert errors == {"card2": "HTTP 404: The requested resource was not found."}
+    mock_client.BATCH.assert_called_once_with(["/cards/card1", "/cards/card2"])
 
 @pytest.mark.asyncio
 async def test_create_card(card_service, mock_client):
@@ -112,3 +135,167 @@ async def test_delete_card(card_service, mock_client):
 
     assert response == mock_data
     mock_client.DELETE.assert_called_once_with(f"/cards/{card_id}")
+
+@pytest.mark.asyncio
+async def test_get_cards_with_fields_projection(card_service, mock_client):
+    mock_client.GET.return_value = []
+
+    await card_service.get_cards("list123", fields="name,due")
+
+    mock_client.GET.assert_called_once_with(
+        "/lists/list123/cards", params={"fields": "id,name,idList,idBoard,url,pos,due"}
+    )
+
+@pytest.mark.asyncio
+async def test_get_cards_by_ids_with_fields_projection(card_service, mock_client):
+    mock_client.BATCH.return_value = []
+
+    await card_service.get_cards_by_ids(["card1"], fields="all")
+
+    mock_client.BATCH.assert_called_once_with(["/cards/card1?fields=all"])
+
+@pytest.mark.asyncio
+async def test_iter_cards(card_service, mock_client):
+    async def stream(endpoint, params=None):
+        yield {
+            "id": "card1", 
+            "name": "Card 1", 
+            "idList": "list1", 
+            "idBoard": "board1", 
+            "url": "http://trello.com/c/1", 
+            "pos": 100.0
+        }
+
+    mock_client.iter_array = MagicMock(side_effect=stream)
+
+    cards = [card async for card in card_service.iter_cards("list1")]
+
+    assert [card.id for card in cards] == ["card1"]
+    mock_client.iter_array.assert_called_once_with("/lists/list1/cards", params=None)
+
+@pytest.mark.asyncio
+async def test_get_cards_pushes_filters_down(card_service, mock_client):
+    mock_client.GET.return_value = [
+        {"id": "65a0000000000000000000c1", "name": "C1", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 1.0},
+        {"id": "65a0000000000000000000c2", "name": "C2", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 2.0},
+    ]
+    query = CardQuery(
+        status="closed",
+        created_since=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        limit=1,
+    )
+
+    cards = await card_service.get_cards("l1", fields="name", query=query)
+
+    assert [card.id for card in cards] == ["65a0000000000000000000c1"]
+    mock_client.GET.assert_called_once_with(
+        "/lists/l1/cards/closed",
+        params={
+            "fields": "id,name,idList,idBoard,url,pos",
+            "since": "2024-01-01T00:00:00+00:00",
+            "limit": "1",
+        },
+    )
+
+@pytest.mark.asyncio
+async def test_get_cards_by_ids_filters_locally(card_service, mock_client):
+    mock_client.BATCH.return_value = [
+        (200, {"id": "c1", "name": "C1", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 1.0, "closed": True}),
+        (200, {"id": "c2", "name": "C2", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 2.0}),
+    ]
+
+    cards, _ = await card_service.get_cards_by_ids(["c1", "c2"], query=CardQuery(status="open"))
+
+    assert [card.id for card in cards] == ["c2"]
+
+
+@pytest.mark.asyncio
+async def test_get_card_details(card_service, mock_client):
+    mock_client.GET.return_value = {
+        "id": "card123",
+        "name": "Test Card",
+        "idList": "list1",
+        "idBoard": "board1",
+        "url": "http://trello.com/c/123",
+        "pos": 100.0,
+        "checklists": [{"id": "cl1", "name": "Steps", "checkItems": [{"id": "i1", "name": "One", "state": "complete"}]}],
+        "attachments": [{"id": "at1", "name": "spec.pdf", "bytes": 1024, "mimeType": "application/pdf"}],
+        "members": [{"id": "m1", "username": "ada"}],
+        "actions": [
+            {"id": "a1", "type": "commentCard", "date": "2026-01-01T00:00:00.000Z", "data": {"text": "Done?"},
+             "memberCreator": {"id": "m1", "username": "ada"}}
+        ],
+    }
+
+    card = await card_service.get_card_details("card123", fields="id,name", actions_limit=5)
+
+    assert isinstance(card, TrelloCardDetail)
+    assert card.checklists[0].checkItems[0].checked
+    assert card.attachments[0].bytes == 1024
+    assert card.members[0].username == "ada"
+    assert card.actions[0].data == {"text": "Done?"}
+    assert card.actions[0].memberCreator.username == "ada"
+    params = mock_client.GET.call_args.kwargs["params"]
+    assert mock_client.GET.call_args.args == ("/cards/card123",)
+    assert params["checklists"] == "all"
+    assert params["attachments"] == "true"
+    assert params["members"] == "true"
+    assert params["actions_limit"] == "5"
+    assert params["fields"].startswith("id,name")
+
+
+@pytest.mark.asyncio
+async def test_get_card_details_without_actions(card_service, mock_client):
+    mock_client.GET.return_value = {
+        "id": "card123", "name": "Test Card", "idList": "list1", "idBoard": "board1", "url": "u", "pos": 1.0
+    }
+
+    card = await card_service.get_card_details("card123")
+
+    assert card.checklists == [] and card.actions == []
+    params = mock_client.GET.call_args.kwargs["params"]
+    assert "actions" not in params and "fields" not in params
+
+
+@pytest.mark.asyncio
+async def test_create_cards_keeps_order_and_reports_failures(card_service, mock_client):
+    mock_client.GET.return_value = [
+        {"id": "c1", "name": "Old", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 1000.0}
+    ]
+
+    async def post(endpoint, data):
+        if data["name"] == "Broken":
+            raise ValueError("invalid value for idLabels")
+        return {"id": f"new-{data['name']}", "idBoard": "b1", "url": "u", **data, "pos": 1.0}
+
+    mock_client.POST.side_effect = post
+    cards = [
+        {"idList": "l1", "name": "First"},
+        {"idList": "l1", "name": "Broken", "idLabels": ["bad"]},
+        {"idList": "l1", "name": "Top", "pos": "top"},
+        {"idList": "l1", "name": "Third"},
+    ]
+
+    result = await card_service.create_cards(cards)
+
+    assert [item["name"] for item in result.items] == ["First", "Broken", "Top", "Third"]
+    assert [card.name for _, card in result.results] == ["First", "Top", "Third"]
+    assert [str(error) for _, error in result.errors] == ["invalid value for idLabels"]
+    # Unpositioned cards follow the list's last card in request order
+    positions = {call.kwargs["data"]["name"]: call.kwargs["data"]["pos"] for call in mock_client.POST.call_args_list}
+    assert positions == {"First": 66536.0, "Broken": 132072.0, "Top": "top", "Third": 197608.0}
+    mock_client.GET.assert_called_once()
+    assert "pos" not in cards[0]
+
+
+@pytest.mark.asyncio
+async def test_create_cards_without_list_positions(card_service, mock_client):
+    mock_client.GET.side_effect = RuntimeError("list unavailable")
+    mock_client.POST.side_effect = lambda endpoint, data: {
+        "id": "n1", "idBoard": "b1", "url": "u", "pos": 1.0, **data
+    }
+
+    result = await card_service.create_cards([{"idList": "l1", "name": "First"}])
+
+    assert [card.name for _, card in result.results] == ["First"]
+    assert "pos" not in mock_client.POST.call_args.kwargs["data"]
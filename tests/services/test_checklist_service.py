@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock
 from server.services.checklist import ChecklistService
+from server.models import TrelloCheckItem, TrelloChecklist
 
 @pytest.fixture
 def mock_client():
@@ -13,12 +14,26 @@ def checklist_service(mock_client):
 @pytest.mark.asyncio
 async def test_get_checklist(checklist_service, mock_client):
     checklist_id = "chk123"
-    mock_data = {"id": checklist_id, "name": "Test Checklist"}
+    mock_data = {
+        "id": checklist_id,
+        "name": "Test Checklist",
+        "idCard": "card1",
+        "idBoard": "board1",
+        "pos": 16384,
+        "limits": {},
+        "checkItems": [
+            {"id": "item1", "name": "Item 1", "state": "complete", "idChecklist": checklist_id, "pos": 1, "nameData": {"emoji": {}}}
+        ],
+    }
     mock_client.GET.return_value = mock_data
 
     checklist = await checklist_service.get_checklist(checklist_id)
 
-    assert checklist == mock_data
+    assert isinstance(checklist, TrelloChecklist)
+    assert checklist.idCard == "card1"
+    assert isinstance(checklist.checkItems[0], TrelloCheckItem)
+    assert checklist.checkItems[0].checked
+    assert "limits" not in checklist.model_dump()
     mock_client.GET.assert_called_once_with(f"/checklists/{checklist_id}")
 
 @pytest.mark.asyncio
@@ -29,7 +44,7 @@ async def test_get_card_checklists(checklist_service, mock_client):
 
     checklists = await checklist_service.get_card_checklists(card_id)
 
-    assert checklists == mock_data
+    assert checklists == [TrelloChecklist(id="chk1", name="Checklist 1")]
     mock_client.GET.assert_called_once_with(f"/cards/{card_id}/checklists")
 
 @pytest.mark.asyncio
@@ -41,7 +56,7 @@ async def test_create_checklist(checklist_service, mock_client):
 
     checklist = await checklist_service.create_checklist(card_id, name)
 
-    assert checklist == mock_data
+    assert checklist == TrelloChecklist(**mock_data)
     mock_client.POST.assert_called_once_with("/checklists", data={"idCard": card_id, "name": name})
 
 @pytest.mark.asyncio
@@ -53,7 +68,7 @@ async def test_update_checklist(checklist_service, mock_client):
 
     checklist = await checklist_service.update_checklist(checklist_id, name=name)
 
-    assert checklist == mock_data
+    assert checklist.name == name
     mock_client.PUT.assert_called_once_with(f"/checklists/{checklist_id}", data={"name": name})
 
 @pytest.mark.asyncio
@@ -76,19 +91,20 @@ async def test_add_checkitem(checklist_service, mock_client):
 
     item = await checklist_service.add_checkitem(checklist_id, name)
 
-    assert item == mock_data
+    assert item == TrelloCheckItem(**mock_data)
+    assert not item.checked
     mock_client.POST.assert_called_once_with(f"/checklists/{checklist_id}/checkItems", data={"name": name, "checked": False})
 
 @pytest.mark.asyncio
 async def test_update_checkitem(checklist_service, mock_client):
     checklist_id = "chk123"
     checkitem_id = "item1"
-    mock_data = {"id": checkitem_id, "state": "complete"}
+    mock_data = {"id": checkitem_id, "name": "Item 1", "state": "complete"}
     mock_client.PUT.return_value = mock_data
 
     item = await checklist_service.update_checkitem(checklist_id, checkitem_id, checked=True)
 
-    assert item == mock_data
+    assert item.checked
     mock_client.PUT.assert_called_once_with(f"/checklists/{checklist_id}/checkItems/{checkitem_id}", data={"checked": True})
 
 @pytest.mark.asyncio
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from server.services.list import ListService
 from server.models import TrelloList
 
@@ -27,7 +27,7 @@ async def test_get_list(list_service, mock_client):
     assert isinstance(trello_list, TrelloList)
     assert trello_list.id == list_id
     assert trello_list.name == "Test List"
-    mock_client.GET.assert_called_once_with(f"/lists/{list_id}")
+    mock_client.GET.assert_called_once_with(f"/lists/{list_id}", params=None)
 
 @pytest.mark.asyncio
 async def test_get_lists(list_service, mock_client):
@@ -43,7 +43,7 @@ async def test_get_lists(list_service, mock_client):
     assert len(lists) == 2
     assert isinstance(lists[0], TrelloList)
     assert lists[0].id == "list1"
-    mock_client.GET.assert_called_once_with(f"/boards/{board_id}/lists")
+    mock_client.GET.assert_called_once_with(f"/boards/{board_id}/lists", params=None)
 
 @pytest.mark.asyncio
 async def test_create_list(list_service, mock_client):
@@ -96,3 +96,18 @@ async def test_delete_list(list_service, mock_client):
 
     assert archived_list.closed is True
     mock_client.PUT.assert_called_once_with(f"/lists/{list_id}/closed", data={"value": "true"})
+
+@pytest.mark.asyncio
+async def test_iter_lists(list_service, mock_client):
+    async def stream(endpoint, params=None):
+        yield {"id": "list1", "name": "List 1", "idBoard": "board1", "pos": 1.0}
+        yield {"id": "list2", "name": "List 2", "idBoard": "board1", "pos": 2.0}
+
+    mock_client.iter_array = MagicMock(side_effect=stream)
+
+    lists = [list_data async for list_data in list_service.iter_lists("board1", fields="name")]
+
+    assert [list_data.id for list_data in lists] == ["list1", "list2"]
+    mock_client.iter_array.assert_called_once_with(
+        "/boards/board1/lists", params={"fields": "id,name,idBoard,pos"}
+    )
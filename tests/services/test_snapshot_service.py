@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from server.models import BoardSnapshot
+from server.services.snapshot import SNAPSHOT_PARAMS, BoardSnapshotService
+from server.utils.disk_cache import SnapshotDiskCache
+from server.utils.snapshot_store import BoardSnapshotStore
+
+BOARD = {
+    "id": "b1",
+    "name": "Board",
+    "url": "http://trello.com/b/1",
+    "lists": [
+        {"id": "l1", "name": "Todo", "idBoard": "b1", "pos": 1.0},
+        {"id": "l2", "name": "Done", "idBoard": "b1", "pos": 2.0},
+    ],
+    "cards": [
+        {"id": "c2", "name": "Second", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 2.0, "idMembers": ["m1"]},
+        {"id": "c1", "name": "First", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 1.0},
+    ],
+    "checklists": [
+        {"id": "cl1", "name": "Steps", "idCard": "c1", "checkItems": [{"id": "i1", "name": "One"}]},
+    ],
+    "labels": [{"id": "lb1", "idBoard": "b1", "name": "Bug"}],
+    "members": [{"id": "m1", "username": "ada", "fullName": "Ada"}],
+}
+
+@pytest.fixture
+def mock_client():
+    client = AsyncMock()
+    client.GET.return_value = BOARD
+    return client
+
+@pytest.fixture
+def snapshot_service(mock_client):
+    return BoardSnapshotService(mock_client, BoardSnapshotStore())
+
+@pytest.mark.asyncio
+async def test_load_snapshot_uses_one_request(snapshot_service, mock_client):
+    snapshot = await snapshot_service.load_snapshot("b1")
+
+    mock_client.GET.assert_called_once_with(
+        "/boards/b1", params=SNAPSHOT_PARAMS, fresh=False
+    )
+    assert "dateLastActivity" in SNAPSHOT_PARAMS["fields"].split(",")
+    assert isinstance(snapshot, BoardSnapshot)
+    assert snapshot.board.name == "Board"
+    assert [card.id for card in snapshot.cards_in_list("l1")] == ["c1", "c2"]
+    assert snapshot.checklists_for_card("c1")[0].checkItems[0].name == "One"
+    assert snapshot.members_of_card(snapshot.get_card("c2"))[0].username == "ada"
+    assert snapshot.get_label("lb1").name == "Bug"
+
+@pytest.mark.asyncio
+async def test_get_snapshot_reuses_the_stored_snapshot(snapshot_service, mock_client):
+    first = await snapshot_service.get_snapshot("b1")
+    second = await snapshot_service.get_snapshot("b1")
+
+    assert first is second
+    mock_client.GET.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_snapshot_reloads_when_stale(snapshot_service, mock_client):
+    await snapshot_service.get_snapshot("b1")
+    await snapshot_service.get_snapshot("b1", max_age=0)
+
+    assert mock_client.GET.call_count == 2
+
+@pytest.mark.asyncio
+async def test_load_snapshot_tolerates_missing_collections(snapshot_service, mock_client):
+    mock_client.GET.return_value = {"id": "b2", "name": "Empty", "url": "u"}
+
+    snapshot = await snapshot_service.load_snapshot("b2")
+
+    assert snapshot.cards == [] and snapshot.get_list("l1") is None
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_from_disk_when_version_matches(mock_client, tmp_path):
+    disk_cache = SnapshotDiskCache(tmp_path / "snapshots.sqlite3")
+    board = {**BOARD, "dateLastActivity": "2024-05-01T00:00:00.000Z"}
+    await disk_cache.save("b1", board["dateLastActivity"], board)
+    mock_client.GET.return_value = {"id": "b1", "dateLastActivity": board["dateLastActivity"]}
+    service = BoardSnapshotService(mock_client, BoardSnapshotStore(), disk_cache)
+
+    snapshot = await service.get_snapshot("b1")
+
+    mock_client.GET.assert_called_once_with(
+        "/boards/b1", params={"fields": "dateLastActivity"}, fresh=True
+    )
+    assert snapshot.get_card("c1").name == "First"
+    disk_cache.close()
+
+@pytest.mark.asyncio
+async def test_stale_disk_snapshot_is_reloaded_and_saved(mock_client, tmp_path):
+    disk_cache = SnapshotDiskCache(tmp_path / "snapshots.sqlite3")
+    await disk_cache.save("b1", "2024-05-01T00:00:00.000Z", BOARD)
+    fresh = {**BOARD, "name": "Fresh", "dateLastActivity": "2024-05-02T00:00:00.000Z"}
+    mock_client.GET.side_effect = [{"id": "b1", "dateLastActivity": fresh["dateLastActivity"]}, fresh]
+    service = BoardSnapshotService(mock_client, BoardSnapshotStore(), disk_cache)
+
+    snapshot = await service.get_snapshot("b1")
+
+    assert snapshot.board.name == "Fresh"
+    assert await disk_cache.load("b1") == (fresh["dateLastActivity"], fresh)
+    disk_cache.close()
@@ -0,0 +1,313 @@
+import asyncio
+import copy
+
+import httpx
+import pytest
+
+from server.services.snapshot import BoardSnapshotService
+from server.services.sync import MAX_DELTA_ACTIONS, WEBHOOK_SILENCE_INTERVALS, BoardSyncService
+from server.utils.cache import ResponseCache
+from server.utils.snapshot_store import BoardSnapshotStore
+from server.utils.trello_api import TrelloClient
+
+BOARD = {
+    "id": "b1",
+    "name": "Board",
+    "url": "http://trello.com/b/1",
+    "lists": [{"id": "l1", "name": "Todo", "idBoard": "b1", "pos": 1.0}],
+    "cards": [
+        {"id": "c1", "name": "First", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 1.0},
+        {"id": "c2", "name": "Second", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 2.0},
+    ],
+    "checklists": [
+        {"id": "cl1", "name": "Steps", "idCard": "c1", "checkItems": [{"id": "i1", "name": "One"}]},
+    ],
+}
+
+
+class FakeClient:
+    """Serves a board, its actions feed (newest first) and /batch lookups."""
+
+    def __init__(self):
+        self.board = copy.deepcopy(BOARD)
+        self.actions = [{"id": "a0", "type": "createCard"}]
+        self.entities = {}
+        self.requests = []
+
+    async def GET(self, endpoint, params=None, fresh=False):
+        self.requests.append(("GET", endpoint))
+        return copy.deepcopy(self.board)
+
+    async def paginate(self, endpoint, params=None, page_size=50, max_items=None, **kwargs):
+        self.requests.append(("actions", (params or {}).get("since")))
+        actions = self.actions
+        if params and "since" in params:
+            ids = [action["id"] for action in actions]
+            actions = actions[: ids.index(params["since"])]
+        for action in actions[:max_items]:
+            yield action
+
+    async def BATCH(self, urls):
+        self.requests.append(("BATCH", tuple(urls)))
+        return [self.entities.get(url, (404, "not found")) for url in urls]
+
+    def add_action(self, action_type, **data):
+        self.actions.insert(0, {"id": f"a{len(self.actions)}", "type": action_type, "data": data})
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def sync(client):
+    return BoardSyncService(client, BoardSnapshotService(client, BoardSnapshotStore()))
+
+
+@pytest.mark.asyncio
+async def test_first_sync_loads_the_board_in_full(sync, client):
+    result = await sync.sync_board("b1")
+
+    assert result.mode == "full"
+    assert sync.cursors["b1"] == "a0"
+    assert sync.mirrors["b1"].get_card("c1").name == "First"
+
+
+@pytest.mark.asyncio
+async def test_no_new_actions_leaves_the_mirror_unchanged(sync, client):
+    await sync.sync_board("b1")
+    client.requests.clear()
+
+    result = await sync.sync_board("b1")
+
+    assert result.mode == "unchanged"
+    assert client.requests == [("actions", "a0")]
+
+
+@pytest.mark.asyncio
+async def test_card_actions_refetch_only_touched_cards(sync, client):
+    await sync.sync_board("b1")
+    client.add_action("updateCard", card={"id": "c1"})
+    client.add_action("createCard", card={"id": "c3"}, list={"id": "l1"})
+    client.add_action("deleteCard", card={"id": "c2"})
+    client.entities["/cards/c1"] = (200, {**BOARD["cards"][0], "name": "Renamed"})
+    client.entities["/cards/c3"] = (200, {**BOARD["cards"][0], "id": "c3", "name": "New", "pos": 3.0})
+    client.requests.clear()
+
+    result = await sync.sync_board("b1")
+
+    snapshot = sync.mirrors["b1"]
+    assert result.mode == "incremental" and result.actions == 3
+    assert [card.name for card in snapshot.cards_in_list("l1")] == ["Renamed", "New"]
+    assert snapshot.get_card("c2") is None
+    assert client.requests == [("actions", "a0"), ("BATCH", ("/cards/c1", "/cards/c3"))]
+    assert sync.cursors["b1"] == "a3"
+
+
+@pytest.mark.asyncio
+async def test_archived_or_moved_cards_leave_the_mirror(sync, client):
+    await sync.sync_board("b1")
+    client.add_action("updateCard", card={"id": "c1"})
+    client.add_action("moveCardFromBoard", card={"id": "c2"})
+    client.entities["/cards/c1"] = (200, {**BOARD["cards"][0], "closed": True})
+
+    await sync.sync_board("b1")
+
+    assert sync.mirrors["b1"].cards == []
+
+
+@pytest.mark.asyncio
+async def test_check_item_state_is_applied_without_requests(sync, client):
+    await sync.sync_board("b1")
+    client.add_action(
+        "updateCheckItemStateOnCard",
+        card={"id": "c1"},
+        checklist={"id": "cl1"},
+        checkItem={"id": "i1", "state": "complete"},
+    )
+    client.requests.clear()
+
+    await sync.sync_board("b1")
+
+    assert sync.mirrors["b1"].get_checklist("cl1").checkItems[0].checked
+    assert client.requests == [("actions", "a0")]
+
+
+@pytest.mark.asyncio
+async def test_unknown_action_type_triggers_full_resync(sync, client):
+    await sync.sync_board("b1")
+    client.add_action("enablePowerUp")
+    client.board["name"] = "Reloaded"
+
+    result = await sync.sync_board("b1")
+
+    assert result.mode == "full"
+    assert "enablePowerUp" in result.reason
+    assert sync.mirrors["b1"].board.name == "Reloaded"
+    assert sync.cursors["b1"] == "a1"
+
+
+@pytest.mark.asyncio
+async def test_large_backlog_triggers_full_resync(sync, client):
+    await sync.sync_board("b1")
+    for _ in range(MAX_DELTA_ACTIONS + 1):
+        client.add_action("updateCard", card={"id": "c1"})
+
+    result = await sync.sync_board("b1")
+
+    assert result.mode == "full"
+    assert not any(request[0] == "BATCH" for request in client.requests)
+
+
+@pytest.mark.asyncio
+async def test_failed_refetch_triggers_full_resync(sync, client):
+    await sync.sync_board("b1")
+    client.add_action("updateCard", card={"id": "c1"})
+    client.entities["/cards/c1"] = (500, "error")
+
+    result = await sync.sync_board("b1")
+
+    assert result.mode == "full"
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_call_triggers_full_resync_instead_of_removal(sync, client):
+    await sync.sync_board("b1")
+    client.add_action("updateCard", card={"id": "c1"})
+    # A chunk-level failure carries the exception, not a per-route body
+    client.entities["/cards/c1"] = (404, RuntimeError("batch failed"))
+
+    result = await sync.sync_board("b1")
+
+    assert result.mode == "full"
+    assert sync.mirrors["b1"].get_card("c1") is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_apply_leaves_the_stored_snapshot_untouched(sync, client):
+    await sync.sync_board("b1")
+    before = sync.mirrors["b1"]
+    client.add_action(
+        "updateCheckItemStateOnCard",
+        card={"id": "c1"},
+        checklist={"id": "cl1"},
+        checkItem={"id": "i1", "state": "complete"},
+    )
+    client.add_action("deleteCard", card={"id": "c2"})
+    client.add_action("updateCard", card={"id": "c1"})
+    client.entities["/cards/c1"] = (500, "error")
+
+    await sync.sync_board("b1")
+
+    assert not before.get_checklist("cl1").checkItems[0].checked
+    assert before.get_card("c2") is not None
+    assert [card.id for card in before.cards] == ["c1", "c2"]
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_serves_fresh_store_entries(sync, client):
+    first = await sync.get_snapshot("b1")
+    client.requests.clear()
+
+    assert await sync.get_snapshot("b1") is first
+    assert client.requests == []
+
+    sync.store.discard("b1")
+    await sync.get_snapshot("b1")
+
+    assert client.requests == [("actions", "a0")]
+
+
+@pytest.mark.asyncio
+async def test_pushed_action_is_applied_without_polling(sync, client):
+    await sync.sync_board("b1")
+    client.requests.clear()
+
+    result = await sync.receive("b1", {"id": "a1", "type": "deleteCard", "data": {"card": {"id": "c2"}}}, "w1")
+
+    assert result.mode == "incremental"
+    assert sync.mirrors["b1"].get_card("c2") is None
+    assert sync.cursors["b1"] == "a1"
+    assert sync.webhooks == {"b1": "w1"}
+    assert client.requests == []
+
+
+@pytest.mark.asyncio
+async def test_pushed_action_already_synced_is_skipped(sync, client):
+    await sync.sync_board("b1")
+
+    result = await sync.receive("b1", {"id": "a0", "type": "deleteCard", "data": {"card": {"id": "c2"}}})
+
+    assert result.mode == "unchanged"
+    assert sync.mirrors["b1"].get_card("c2") is not None
+
+
+@pytest.mark.asyncio
+async def test_pushed_action_for_unmirrored_board_is_ignored(sync, client):
+    assert await sync.receive("b1", {"id": "a1", "type": "updateCard"}, "w1") is None
+    assert sync.webhooks == {"b1": "w1"}
+
+
+@pytest.mark.asyncio
+async def test_polling_skips_boards_with_webhooks(sync, client):
+    await sync.sync_board("b1")
+    sync.set_webhook("b1", "w1")
+    client.requests.clear()
+
+    sync.start(0.005)
+    await asyncio.sleep(0.02)
+    await sync.stop()
+
+    assert client.requests == []
+
+    sync.clear_webhook("b1")
+    sync.start(0.005)
+    await asyncio.sleep(0.02)
+    await sync.stop()
+
+    assert ("actions", "a0") in client.requests
+
+
+@pytest.mark.asyncio
+async def test_polling_resumes_when_a_webhook_goes_silent(sync, client):
+    await sync.sync_board("b1")
+    sync.set_webhook("b1", "w1")
+    # No delivery for longer than the allowed silence
+    sync.webhook_seen["b1"] -= 0.005 * WEBHOOK_SILENCE_INTERVALS + 1
+    client.requests.clear()
+
+    sync.start(0.005)
+    await asyncio.sleep(0.02)
+    await sync.stop()
+
+    assert ("actions", "a0") in client.requests
+
+    await sync.receive("b1", {"id": "a0", "type": "createCard"}, "w1")
+    client.requests.clear()
+    sync.start(0.005)
+    await asyncio.sleep(0.02)
+    await sync.stop()
+
+    assert client.requests == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_not_served_from_the_response_cache():
+    board = copy.deepcopy(BOARD)
+
+    def handler(request):
+        if request.url.path.endswith("/actions"):
+            return httpx.Response(200, json=[{"id": "a0", "type": "createCard"}])
+        return httpx.Response(200, json=board)
+
+    client = TrelloClient(
+        "key", "token", transport=httpx.MockTransport(handler), cache=ResponseCache()
+    )
+    sync = BoardSyncService(client, BoardSnapshotService(client, BoardSnapshotStore()))
+    await sync.get_snapshot("b1")
+    board["name"] = "Renamed"
+
+    snapshot = await sync.get_snapshot("b1", refresh=True)
+
+    assert snapshot.board.name == "Renamed"
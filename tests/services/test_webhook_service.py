@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from server.models import TrelloWebhook
+from server.services.webhook import WebhookService
+
+CALLBACK = "https://example.com/webhooks/trello"
+
+
+@pytest.fixture
+def mock_client():
+    return AsyncMock()
+
+
+@pytest.fixture
+def webhook_service(mock_client):
+    return WebhookService(mock_client)
+
+
+@pytest.mark.asyncio
+async def test_get_webhooks(webhook_service, mock_client):
+    mock_client.GET.return_value = [
+        {"id": "t1", "webhooks": [{"id": "w1", "idModel": "b1", "callbackURL": CALLBACK}]},
+        {"id": "t2", "webhooks": [{"id": "w2", "idModel": "b2", "callbackURL": CALLBACK}]},
+        {"id": "t3"},
+    ]
+
+    result = await webhook_service.get_webhooks("b1")
+
+    assert result == [TrelloWebhook(id="w1", idModel="b1", callbackURL=CALLBACK)]
+    mock_client.GET.assert_called_once_with("/members/me/tokens", params={"webhooks": "true"})
+
+
+@pytest.mark.asyncio
+async def test_create_webhook(webhook_service, mock_client):
+    mock_client.POST.return_value = {"id": "w1", "idModel": "b1", "callbackURL": CALLBACK}
+
+    result = await webhook_service.create_webhook("b1", CALLBACK, "Board sync")
+
+    assert result.id == "w1"
+    mock_client.POST.assert_called_once_with(
+        "/webhooks",
+        data={"idModel": "b1", "callbackURL": CALLBACK, "description": "Board sync"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_webhook(webhook_service, mock_client):
+    mock_client.DELETE.return_value = {}
+
+    await webhook_service.delete_webhook("w1")
+
+    mock_client.DELETE.assert_called_once_with("/webhooks/w1")
@@ -0,0 +1,76 @@
+from server.utils import cache as cache_module
+from server.utils.cache import MISS, ResponseCache
+
+
+def test_get_returns_cached_payload_and_counts_hits():
+    cache = ResponseCache()
+    cache.set("/boards/b1", {"fields": "name", "token": "secret"}, {"id": "b1"})
+
+    assert cache.get("/boards/b1", {"fields": "name", "token": "other"}) == {"id": "b1"}
+    assert cache.get("/boards/b1") is MISS
+    assert cache.stats()["hits"] == {"boards": 1}
+    assert cache.stats()["misses"] == {"boards": 1}
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttls={"cards": 10})
+    cache.set("/cards/c1", None, {"id": "c1"})
+
+    now[0] += 11
+
+    assert cache.get("/cards/c1") is MISS
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.set("/cards/c1", None, {"id": "c1"})
+    cache.set("/cards/c2", None, {"id": "c2"})
+    cache.get("/cards/c1")
+    cache.set("/cards/c3", None, {"id": "c3"})
+
+    assert cache.get("/cards/c2") is MISS
+    assert cache.get("/cards/c1") == {"id": "c1"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_card_write_invalidates_card_and_parent_lists():
+    cache = ResponseCache()
+    cache.set("/cards/c1", None, {"id": "c1", "idList": "l1"})
+    cache.set("/lists/l1/cards", None, [{"id": "c1"}, {"id": "c2"}])
+    cache.set("/lists/l2/cards", None, [{"id": "c3"}])
+    cache.set("/lists/l3/cards", None, [{"id": "c4"}])
+
+    cache.invalidate_write("/cards/c1", {"idList": "l2"}, {"id": "c1", "idList": "l2"})
+
+    assert cache.get("/cards/c1") is MISS
+    assert cache.get("/lists/l1/cards") is MISS
+    assert cache.get("/lists/l2/cards") is MISS
+    assert cache.get("/lists/l3/cards") == [{"id": "c4"}]
+
+
+def test_set_skips_results_fetched_before_an_invalidation():
+    cache = ResponseCache()
+    generation = cache.generation
+
+    cache.invalidate(["c1"])
+    cache.set("/cards/c1", None, {"id": "c1"}, generation=generation)
+
+    assert cache.get("/cards/c1") is MISS
+
+
+def test_batch_is_never_cached():
+    cache = ResponseCache()
+    cache.set("/batch", {"urls": "/cards/c1"}, [{"200": {"id": "c1"}}])
+
+    assert cache.get("/batch", {"urls": "/cards/c1"}) is MISS
+
+
+def test_ttl_follows_the_returned_resource_type():
+    cache = ResponseCache(ttls={"cards": 5, "lists": 7})
+
+    assert cache.ttl_for("/lists/l1/cards") == 5
+    assert cache.ttl_for("/boards/b1/lists") == 7
+    assert cache.ttl_for("/boards/b1/actions") == 0
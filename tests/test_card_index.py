@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+
+from server.utils.card_index import CardIndex
+from server.utils.snapshot_store import BoardSnapshotStore
+
+
+CARDS = [
+    {"id": "c1", "idLabels": ["lb1"], "idMembers": ["m1"], "due": "2026-01-10T00:00:00Z"},
+    {"id": "c2", "idLabels": ["lb1"], "due": "2026-01-05T00:00:00Z", "dueComplete": True},
+    {"id": "c3", "idList": "l2", "idMembers": ["m1"], "due": "2026-02-01T00:00:00Z"},
+    {"id": "c4", "idList": "l2"},
+]
+LABELS = [{"id": "lb1", "name": "Bug"}]
+MEMBERS = [{"id": "m1", "username": "ada", "fullName": "Ada Lovelace"}]
+
+
+def date(value):
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def query_ids(index, **kwargs):
+    return [card.id for card in index.query(**kwargs)]
+
+
+def test_query_without_predicates_returns_all_cards_soonest_due_first(make_snapshot):
+    index = CardIndex()
+    index.index_board(make_snapshot(cards=CARDS))
+
+    assert query_ids(index) == ["c2", "c1", "c3", "c4"]
+
+
+def test_query_intersects_predicates(make_snapshot):
+    index = CardIndex()
+    index.index_board(make_snapshot(cards=CARDS))
+
+    assert query_ids(index, list_id="l2") == ["c3", "c4"]
+    assert query_ids(index, label_ids=[{"lb1"}], member_ids=[{"m1"}]) == ["c1"]
+    assert query_ids(index, member_ids=[{"m1"}], list_id="l2") == ["c3"]
+    assert query_ids(index, label_ids=[{"missing"}]) == []
+
+
+def test_query_due_range_and_completion(make_snapshot):
+    index = CardIndex()
+    index.index_board(make_snapshot(cards=CARDS))
+
+    assert query_ids(index, due_after=date("2026-01-05"), due_before=date("2026-02-01")) == ["c2", "c1"]
+    assert query_ids(index, due_before=date("2026-01-31"), due_complete=False) == ["c1"]
+    assert query_ids(index, label_ids=[{"lb1"}], due_after=date("2026-01-06")) == ["c1"]
+
+
+def test_resolves_label_and_member_names(make_snapshot):
+    index = CardIndex()
+    index.index_board(make_snapshot(cards=CARDS, labels=LABELS, members=MEMBERS))
+
+    assert index.resolve_labels("bug") == {"lb1"}
+    assert index.resolve_members("ADA") == {"m1"}
+    assert index.resolve_members("Ada Lovelace", board_ids=["b1"]) == {"m1"}
+    # Unknown names are taken as IDs
+    assert index.resolve_labels("lb9") == {"lb9"}
+    assert index.resolve_labels("bug", board_ids=["b2"]) == {"bug"}
+
+
+def test_query_filters_by_board(make_snapshot):
+    index = CardIndex()
+    index.index_board(make_snapshot("b1", cards=CARDS[:1]))
+    index.index_board(make_snapshot("b2", cards=[{"id": "c9", "idMembers": ["m1"]}]))
+
+    assert query_ids(index, member_ids=[{"m1"}]) == ["c1", "c9"]
+    assert query_ids(index, board_ids=["b2"], member_ids=[{"m1"}]) == ["c9"]
+
+
+def test_reindexing_moves_cards_between_keys(make_snapshot):
+    index = CardIndex()
+    index.index_board(make_snapshot(cards=CARDS))
+
+    index.index_board(
+        make_snapshot(cards=[{**CARDS[0], "idList": "l2", "idLabels": [], "due": None}, CARDS[3]])
+    )
+
+    assert set(query_ids(index, list_id="l2")) == {"c1", "c4"}
+    assert query_ids(index, label_ids=[{"lb1"}]) == []
+    assert index.by_due == []
+    assert "l1" not in index.by_list
+
+
+def test_follows_snapshot_store(make_snapshot):
+    store = BoardSnapshotStore()
+    index = CardIndex()
+    store.add_listener(index.update)
+
+    store.put(make_snapshot(cards=CARDS))
+    assert len(query_ids(index)) == 4
+
+    store.discard("b1")
+    assert query_ids(index) == []
+    assert index.by_due == [] and index.label_names == {}
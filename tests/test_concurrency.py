@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from server.utils.concurrency import describe_error, gather_bounded, set_default_fanout_limit
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item * 2
+
+    result = await gather_bounded(range(10), work, limit=3)
+
+    assert peak == 3
+    assert [value for _, value in result.results] == [i * 2 for i in range(10)]
+    assert result.errors == []
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_returns_partial_results_and_errors():
+    async def work(item):
+        if item == "bad":
+            raise ValueError("boom")
+        return item.upper()
+
+    result = await gather_bounded(["a", "bad", "c"], work)
+
+    assert result.results == [("a", "A"), ("c", "C")]
+    assert [item for item, _ in result.errors] == ["bad"]
+    assert isinstance(result.errors[0][1], ValueError)
+    assert result.outcomes[0] == "A"
+
+
+def test_set_default_fanout_limit_rejects_zero():
+    with pytest.raises(ValueError):
+        set_default_fanout_limit(0)
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_reports_each_outcome_as_it_completes():
+    reported = []
+
+    async def work(item):
+        await asyncio.sleep(0.01 * (3 - item))
+        if item == 1:
+            raise ValueError("boom")
+        return item
+
+    async def on_result(item, outcome):
+        reported.append((item, outcome if not isinstance(outcome, BaseException) else "error"))
+
+    result = await gather_bounded(range(3), work, on_result=on_result)
+
+    assert reported == [(2, 2), (1, "error"), (0, 0)]
+    assert [item for item, _ in result.errors] == [1]
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_change_outcomes(caplog):
+    async def work(item):
+        if item == 1:
+            raise ValueError("boom")
+        return item
+
+    async def on_result(item, outcome):
+        raise RuntimeError("progress failed")
+
+    result = await gather_bounded(range(2), work, on_result=on_result)
+
+    assert result.outcomes[0] == 0
+    assert isinstance(result.outcomes[1], ValueError)
+    assert caplog.text.count("Result callback failed") == 2
+
+
+def test_describe_error_falls_back_to_the_type_name():
+    assert describe_error(ValueError("boom")) == "boom"
+    assert describe_error(TimeoutError()) == "TimeoutError"
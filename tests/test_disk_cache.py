@@ -0,0 +1,99 @@
+import pytest
+
+from server.utils.disk_cache import SnapshotDiskCache
+
+BOARD = {"id": "b1", "name": "Board", "dateLastActivity": "2024-05-01T00:00:00.000Z", "cards": []}
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    cache = SnapshotDiskCache(tmp_path / "cache" / "snapshots.sqlite3")
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_round_trip_survives_reopen(disk_cache, tmp_path):
+    await disk_cache.save("b1", "v1", BOARD)
+    disk_cache.close()
+
+    reopened = SnapshotDiskCache(disk_cache.path)
+    assert await reopened.load("b1") == ("v1", BOARD)
+    assert await reopened.load("b2") is None
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_database_is_opened_lazily(disk_cache):
+    assert disk_cache.connection is None
+    assert not disk_cache.path.exists()
+
+    await disk_cache.load("b1")
+
+    assert disk_cache.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_same_version_is_not_rewritten(disk_cache):
+    await disk_cache.save("b1", "v1", BOARD)
+    await disk_cache.save("b1", "v1", {**BOARD, "name": "Changed"})
+    await disk_cache.save("b1", None, {**BOARD, "name": "Unversioned"})
+
+    assert disk_cache.writes == 1
+    assert (await disk_cache.load("b1"))[1]["name"] == "Board"
+
+    await disk_cache.save("b1", "v2", {**BOARD, "name": "Changed"})
+
+    assert await disk_cache.load("b1") == ("v2", {**BOARD, "name": "Changed"})
+
+
+@pytest.mark.asyncio
+async def test_entry_cap_drops_least_recently_used(disk_cache):
+    disk_cache.max_entries = 2
+    await disk_cache.save("b1", "v1", BOARD)
+    await disk_cache.save("b2", "v1", BOARD)
+    await disk_cache.load("b1")
+    await disk_cache.save("b3", "v1", BOARD)
+
+    assert await disk_cache.load("b2") is None
+    assert await disk_cache.load("b1") is not None
+    assert disk_cache.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_size_cap_keeps_the_newest_board(disk_cache):
+    disk_cache.max_bytes = 10
+    await disk_cache.save("b1", "v1", BOARD)
+    await disk_cache.save("b2", "v1", BOARD)
+
+    assert await disk_cache.load("b1") is None
+    assert await disk_cache.load("b2") is not None
+
+
+@pytest.mark.asyncio
+async def test_unreadable_file_disables_the_cache(tmp_path):
+    path = tmp_path / "snapshots.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+    cache = SnapshotDiskCache(path)
+
+    assert await cache.load("b1") is None
+    await cache.save("b1", "v1", BOARD)
+
+    assert cache.stats()["enabled"] is False
+
+
+@pytest.mark.asyncio
+async def test_corrupt_payload_is_dropped_as_a_miss(disk_cache):
+    await disk_cache.save("b1", "v1", BOARD)
+    disk_cache.connection.execute("UPDATE snapshots SET payload = ? WHERE board_id = ?", (b"{not json", "b1"))
+
+    assert await disk_cache.load("b1") is None
+    assert await disk_cache.load("b1") is None
+
+    stats = disk_cache.stats()
+    assert stats["enabled"] is True
+    assert stats["misses"] == 2 and stats["hits"] == 0
+
+    await disk_cache.save("b1", "v1", BOARD)
+
+    assert await disk_cache.load("b1") == ("v1", BOARD)
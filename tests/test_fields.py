@@ -0,0 +1,16 @@
+from server.models import TrelloCard, TrelloList
+from server.utils.fields import field_params, projection
+
+
+def test_projection_adds_required_fields_once():
+    assert projection(TrelloList, "name, closed") == "id,name,idBoard,pos,closed"
+
+
+def test_projection_accepts_lists_and_all():
+    assert projection(TrelloCard, ["due"]) == "id,name,idList,idBoard,url,pos,due"
+    assert projection(TrelloCard, "all") == "all"
+
+
+def test_field_params_defaults_to_none():
+    assert field_params(TrelloCard, None) is None
+    assert field_params(TrelloList, "name") == {"fields": "id,name,idBoard,pos"}
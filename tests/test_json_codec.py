@@ -0,0 +1,43 @@
+import pytest
+
+from server.utils import json_codec
+from server.utils.json_codec import OrjsonCodec, StdlibCodec, get_codec
+
+PAYLOAD = {"id": "c1", "name": "Café ✓", "pos": 16384.5, "labels": [], "due": None}
+
+
+def test_stdlib_codec_round_trip():
+    codec = StdlibCodec()
+
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == PAYLOAD
+
+
+def test_orjson_codec_round_trip():
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+
+    assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+    assert codec.loads(StdlibCodec().dumps(PAYLOAD)) == PAYLOAD
+
+
+def test_get_codec_auto_prefers_orjson(monkeypatch):
+    monkeypatch.setattr(json_codec, "_orjson_available", lambda: True)
+    monkeypatch.setattr(OrjsonCodec, "__init__", lambda self: None)
+
+    assert get_codec().name == "orjson"
+
+
+def test_get_codec_falls_back_when_orjson_missing(monkeypatch):
+    monkeypatch.setattr(json_codec, "_orjson_available", lambda: False)
+
+    assert get_codec().name == "stdlib"
+    assert get_codec("orjson").name == "stdlib"
+
+
+def test_get_codec_stdlib_and_unknown():
+    assert get_codec("stdlib").name == "stdlib"
+    with pytest.raises(ValueError):
+        get_codec("simdjson")
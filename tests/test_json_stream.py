@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from server.utils.json_stream import JSONArrayStreamParser
+
+DOCUMENT = json.dumps(
+    [
+        {"id": "c1", "name": "Card, with [brackets]", "labels": [{"id": "l1"}]},
+        {"id": "c2", "desc": "quote \" and unicode é"},
+        12345,
+        "text",
+        None,
+    ],
+    indent=1,
+)
+
+
+def parse_in_chunks(text, size):
+    parser = JSONArrayStreamParser()
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start : start + size]))
+    parser.close()
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, len(DOCUMENT)])
+def test_parses_any_chunking(size):
+    assert parse_in_chunks(DOCUMENT, size) == json.loads(DOCUMENT)
+
+
+def test_yields_elements_before_the_array_ends():
+    parser = JSONArrayStreamParser()
+
+    assert parser.feed('[{"id": "c1"}, {"id"') == [{"id": "c1"}]
+    assert parser.feed(': "c2"}]') == [{"id": "c2"}]
+
+
+def test_empty_array():
+    assert parse_in_chunks(" [ ] ", 1) == []
+
+
+def test_incomplete_array_raises_on_close():
+    parser = JSONArrayStreamParser()
+    parser.feed('[{"id": "c1"}')
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_rejects_non_array_documents():
+    with pytest.raises(ValueError):
+        JSONArrayStreamParser().feed('{"id": "b1"}')
@@ -0,0 +1,48 @@
+import pytest
+from pydantic import ValidationError
+
+from server.models import (
+    STRICT,
+    TRUSTED,
+    TrelloCard,
+    parse_model,
+    parse_models,
+    set_validation_mode,
+)
+
+CARD = {
+    "id": "card1",
+    "name": "Card 1",
+    "idList": "list1",
+    "idBoard": "board1",
+    "url": "http://trello.com/c/1",
+    "pos": 100.0,
+    "due": "2024-06-01T12:00:00.000Z",
+    "labels": [{"id": "label1", "idBoard": "board1", "name": "Bug"}],
+}
+
+
+@pytest.fixture
+def trusted_mode():
+    set_validation_mode(TRUSTED)
+    yield
+    set_validation_mode(STRICT)
+
+
+def test_trusted_mode_builds_the_same_models(trusted_mode):
+    cards = parse_models(TrelloCard, [CARD, CARD])
+
+    assert cards == [TrelloCard(**CARD), TrelloCard(**CARD)]
+    assert cards[0].labels[0].name == "Bug"
+    assert cards[0].due.year == 2024
+    assert parse_model(TrelloCard, CARD) == TrelloCard(**CARD)
+
+
+def test_trusted_mode_raises_on_bad_items(trusted_mode):
+    with pytest.raises(ValidationError):
+        parse_models(TrelloCard, [CARD, {"id": "broken"}])
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        set_validation_mode("lazy")
@@ -0,0 +1,95 @@
+import pytest
+
+from server.models import Page
+from server.utils import pagination
+from server.utils.pagination import (
+    CursorError,
+    SnapshotStore,
+    decode_cursor,
+    encode_cursor,
+    first_page,
+    next_page,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_store(monkeypatch):
+    store = SnapshotStore()
+    monkeypatch.setattr(pagination, "snapshots", store)
+    return store
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor("abc_-9", 20, 10)) == ("abc_-9", 20, 10)
+
+
+def test_decode_cursor_rejects_garbage():
+    with pytest.raises(CursorError):
+        decode_cursor("not a cursor!")
+
+
+def test_pages_walk_the_snapshot():
+    items = list(range(25))
+
+    page = first_page("cards:l1", items, 10)
+    pages = [page]
+    while page.next_cursor:
+        page = next_page("cards:l1", page.next_cursor)
+        pages.append(page)
+
+    assert [p.items for p in pages] == [items[:10], items[10:20], items[20:]]
+    assert all(p.total == 25 for p in pages)
+
+
+def test_later_pages_do_not_see_changes_to_the_source():
+    items = list(range(4))
+    page = first_page("cards:l1", items, 2)
+    items.clear()
+
+    assert next_page("cards:l1", page.next_cursor).items == [2, 3]
+
+
+def test_single_page_is_not_stored(fresh_store):
+    page = first_page("cards:l1", [1, 2], 5)
+
+    assert page == Page(items=[1, 2], total=2)
+    assert not fresh_store.snapshots
+
+
+def test_next_page_accepts_a_new_limit():
+    page = first_page("cards:l1", list(range(10)), 2)
+
+    page = next_page("cards:l1", page.next_cursor, limit=5)
+
+    assert page.items == [2, 3, 4, 5, 6]
+    assert decode_cursor(page.next_cursor)[1:] == (7, 5)
+
+
+def test_cursor_is_bound_to_its_scope():
+    page = first_page("cards:l1", list(range(10)), 2)
+
+    with pytest.raises(CursorError, match="different query"):
+        next_page("cards:l2", page.next_cursor)
+
+
+def test_expired_snapshot(fresh_store, monkeypatch):
+    page = first_page("cards:l1", list(range(10)), 2)
+    now = pagination.time.monotonic()
+    monkeypatch.setattr(pagination.time, "monotonic", lambda: now + fresh_store.ttl + 1)
+
+    with pytest.raises(CursorError, match="expired"):
+        next_page("cards:l1", page.next_cursor)
+
+
+def test_store_drops_least_recently_used(fresh_store):
+    fresh_store.max_snapshots = 2
+    cursors = [first_page(f"s{i}", [1, 2], 1).next_cursor for i in range(3)]
+
+    with pytest.raises(CursorError):
+        next_page("s0", cursors[0])
+    assert next_page("s2", cursors[2]).items == [2]
+
+
+def test_invalid_limit():
+    with pytest.raises(ValueError):
+        first_page("cards:l1", [1], 0)
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from server.models import TrelloCard
+from server.utils.query import CardQuery, parse_date
+
+JAN = datetime(2024, 1, 1, tzinfo=timezone.utc)
+MAR = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+
+def make_card(created: datetime, last_activity: datetime | None = None, closed=False):
+    card_id = f"{int(created.timestamp()):08x}" + "0" * 16
+    return TrelloCard(
+        id=card_id,
+        name="Card",
+        idList="l1",
+        idBoard="b1",
+        url="u",
+        pos=1.0,
+        closed=closed,
+        dateLastActivity=last_activity,
+    )
+
+
+def test_parse_date_defaults_to_utc():
+    assert parse_date("2024-01-01") == JAN
+    assert parse_date("2024-01-01T00:00:00Z") == JAN
+    with pytest.raises(ValueError):
+        parse_date("yesterday")
+
+
+def test_default_query_pushes_nothing():
+    query = CardQuery()
+
+    assert query.path("l1") == "/lists/l1/cards"
+    assert query.params() == {}
+
+
+def test_status_goes_into_the_path():
+    assert CardQuery(status="all").path("l1") == "/lists/l1/cards/all"
+    with pytest.raises(ValueError):
+        CardQuery(status="archived")
+
+
+def test_limit_is_not_pushed_with_a_local_filter():
+    assert CardQuery(limit=5).params() == {"limit": "5"}
+    assert CardQuery(limit=5, active_since=JAN).params() == {}
+
+
+def test_active_since_matches_created_or_updated():
+    query = CardQuery(active_since=MAR)
+    old = make_card(JAN)
+    touched = make_card(JAN, last_activity=datetime(2024, 4, 1, tzinfo=timezone.utc))
+    new = make_card(datetime(2024, 5, 1, tzinfo=timezone.utc))
+
+    assert query.apply([old, touched, new]) == [touched, new]
+
+
+def test_created_range_is_rechecked_locally():
+    query = CardQuery(created_since=JAN, created_before=MAR)
+    cards = [make_card(datetime(2023, 12, 1, tzinfo=timezone.utc)), make_card(JAN), make_card(MAR)]
+
+    assert query.apply(cards) == [cards[1]]
+
+
+def test_status_is_only_checked_when_not_pushed():
+    closed = make_card(JAN, closed=True)
+    query = CardQuery(status="open")
+
+    assert query.apply([closed]) == [closed]
+    assert query.apply([closed], pushed=False) == []
@@ -0,0 +1,78 @@
+import pytest
+
+from server.utils import rate_limiter as rl
+from server.utils.rate_limiter import TokenBucket, TrelloRateLimiter
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(rl.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def test_bucket_reservations_queue_in_order():
+    bucket = TokenBucket(capacity=2, interval=1.0)
+    now = bucket.updated
+
+    assert bucket.reserve(now) == 0.0
+    assert bucket.reserve(now) == 0.0
+    assert bucket.reserve(now) == pytest.approx(0.5)
+    assert bucket.reserve(now) == pytest.approx(1.0)
+
+
+def test_bucket_sync_only_lowers_tokens():
+    bucket = TokenBucket(capacity=100, interval=10.0)
+
+    bucket.sync(remaining=40, capacity=100, interval=10.0)
+    assert bucket.tokens == pytest.approx(40, abs=0.1)
+
+    bucket.sync(remaining=90, capacity=None, interval=None)
+    assert bucket.tokens < 41
+
+
+@pytest.mark.asyncio
+async def test_acquire_queues_when_token_budget_is_spent(sleeps):
+    limiter = TrelloRateLimiter(key_max=300, token_max=2, interval=10.0)
+
+    await limiter.acquire()
+    await limiter.acquire()
+    waited = await limiter.acquire()
+
+    assert waited == pytest.approx(5.0, abs=0.01)
+    assert sleeps == [waited]
+    stats = limiter.stats()
+    assert stats["requests"] == 3
+    assert stats["queued"] == 1
+    assert stats["max_wait_seconds"] == pytest.approx(5.0, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_headers_resync_budget(sleeps):
+    limiter = TrelloRateLimiter()
+
+    limiter.update_from_headers(
+        {
+            "x-rate-limit-api-token-remaining": "0",
+            "x-rate-limit-api-token-max": "100",
+            "x-rate-limit-api-token-interval-ms": "10000",
+            "x-rate-limit-api-key-remaining": "not-a-number",
+        }
+    )
+    waited = await limiter.acquire()
+
+    assert waited == pytest.approx(0.1, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_backoff_holds_requests(sleeps):
+    limiter = TrelloRateLimiter()
+
+    limiter.backoff(3)
+    waited = await limiter.acquire()
+
+    assert waited == pytest.approx(3, abs=0.01)
@@ -0,0 +1,92 @@
+from server.utils.search_index import CardSearchIndex, tokenize
+from server.utils.snapshot_store import BoardSnapshotStore
+
+
+CARDS = [
+    {"id": "c1", "name": "Fix login bug", "desc": "Users cannot sign in", "idLabels": ["lb1"]},
+    {"id": "c2", "name": "Release notes", "desc": "Mention the login changes"},
+    {"id": "c3", "name": "Deployment pipeline"},
+]
+CHECKLISTS = [
+    {"id": "cl1", "idCard": "c3", "name": "Steps", "checkItems": [{"id": "i1", "name": "Rotate secrets"}]},
+]
+LABELS = [{"id": "lb1", "idBoard": "b1", "name": "Urgent"}]
+
+
+def search_ids(index, query, **kwargs):
+    return [hit.card.id for hit in index.search(query, **kwargs)]
+
+
+def test_tokenize():
+    assert tokenize("Fix LOGIN-bug, now!") == ["fix", "login", "bug", "now"]
+
+
+def test_ranks_name_matches_above_description_matches(make_snapshot):
+    index = CardSearchIndex()
+    index.index_board(make_snapshot(cards=CARDS))
+
+    assert search_ids(index, "login") == ["c1", "c2"]
+
+
+def test_all_terms_must_match(make_snapshot):
+    index = CardSearchIndex()
+    index.index_board(make_snapshot(cards=CARDS))
+
+    assert search_ids(index, "login bug") == ["c1"]
+    assert search_ids(index, "login pipeline") == []
+    assert search_ids(index, "") == []
+
+
+def test_matches_labels_checklist_items_and_prefixes(make_snapshot):
+    index = CardSearchIndex()
+    index.index_board(make_snapshot(cards=CARDS, checklists=CHECKLISTS, labels=LABELS))
+
+    assert search_ids(index, "urgent") == ["c1"]
+    assert search_ids(index, "secrets") == ["c3"]
+    assert search_ids(index, "deploy") == ["c3"]
+    # Prefixes shorter than three letters are not expanded
+    assert search_ids(index, "de") == []
+
+
+def test_reindexing_follows_changed_and_removed_cards(make_snapshot):
+    index = CardSearchIndex()
+    index.index_board(make_snapshot(cards=CARDS))
+
+    index.index_board(make_snapshot(cards=[{**CARDS[0], "name": "Fix signup"}, CARDS[2]]))
+
+    assert search_ids(index, "signup") == ["c1"]
+    assert search_ids(index, "release") == []
+    assert "release" not in index.postings
+
+
+def test_filters_by_board_and_limit(make_snapshot):
+    index = CardSearchIndex()
+    index.index_board(make_snapshot("b1", cards=CARDS))
+    index.index_board(make_snapshot("b2", cards=[{"id": "c9", "name": "Login page"}]))
+
+    assert set(search_ids(index, "login")) == {"c1", "c2", "c9"}
+    assert search_ids(index, "login", board_ids=["b2"]) == ["c9"]
+    assert len(search_ids(index, "login", limit=1)) == 1
+
+
+def test_card_moved_to_another_board_stays_indexed(make_snapshot):
+    index = CardSearchIndex()
+    index.index_board(make_snapshot("b1", cards=CARDS))
+    index.index_board(make_snapshot("b2", cards=[CARDS[2]]))
+
+    index.index_board(make_snapshot("b1", cards=CARDS[:2]))
+
+    assert search_ids(index, "pipeline", board_ids=["b2"]) == ["c3"]
+
+
+def test_follows_snapshot_store(make_snapshot):
+    store = BoardSnapshotStore()
+    index = CardSearchIndex()
+    store.add_listener(index.update)
+
+    store.put(make_snapshot(cards=CARDS))
+    assert search_ids(index, "pipeline") == ["c3"]
+
+    store.invalidate({"c3"})
+    assert search_ids(index, "pipeline") == []
+    assert index.boards == {}
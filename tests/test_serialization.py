@@ -0,0 +1,204 @@
+import json
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import CallToolResult
+
+from server.models import BoardSnapshot, Page, TrelloBoard, TrelloCard, TrelloChecklist, TrelloCheckItem
+from server.utils.serialization import (
+    COMPACT,
+    FULL,
+    OutputMode,
+    compact_dump,
+    format_result,
+    set_output_mode,
+)
+
+
+def make_card(**overrides):
+    data = {
+        "id": "card1",
+        "name": "Card 1",
+        "idList": "list1",
+        "idBoard": "board1",
+        "url": "http://trello.com/c/1",
+        "pos": 1.0,
+        "labels": [
+            {"id": "label1", "idBoard": "board1", "name": "Bug", "color": "red"},
+            {"id": "label2", "idBoard": "board1", "name": "UX"},
+        ],
+    }
+    data.update(overrides)
+    return TrelloCard(**data)
+
+
+def test_compact_dump_drops_nulls_and_defaults():
+    data = compact_dump(make_card(closed=False))
+
+    assert data == {
+        "id": "card1",
+        "name": "Card 1",
+        "idList": "list1",
+        "idBoard": "board1",
+        "url": "http://trello.com/c/1",
+        "pos": 1.0,
+        "labelNames": ["Bug", "UX"],
+    }
+
+
+def test_compact_dump_keeps_labels_when_not_flattening():
+    set_output_mode(FULL, flatten_labels=False)
+
+    data = compact_dump(make_card())
+
+    assert "labelNames" not in data
+    assert data["labels"][0] == {
+        "id": "label1",
+        "idBoard": "board1",
+        "name": "Bug",
+        "color": "red",
+    }
+
+
+def test_compact_dump_caps_description():
+    set_output_mode(FULL, max_desc_length=10)
+
+    data = compact_dump(make_card(desc="x" * 50))
+
+    assert data["desc"] == "x" * 10 + "…"
+
+
+def test_compact_dump_without_description_cap():
+    set_output_mode(FULL, max_desc_length=0)
+
+    data = compact_dump(make_card(desc="x" * 5000))
+
+    assert data["desc"] == "x" * 5000
+
+
+def test_compact_dump_list_and_nested_models():
+    checklists = [
+        TrelloChecklist(
+            id="cl1",
+            name="Todo",
+            checkItems=[
+                TrelloCheckItem(id="i1", name="One"),
+                TrelloCheckItem(id="i2", name="Two", state="complete"),
+            ],
+        )
+    ]
+
+    data = compact_dump(checklists)
+
+    assert data == [
+        {
+            "id": "cl1",
+            "name": "Todo",
+            "checkItems": [
+                {"id": "i1", "name": "One"},
+                {"id": "i2", "name": "Two", "state": "complete"},
+            ],
+        }
+    ]
+
+
+def test_compact_dump_shrinks_nested_models():
+    set_output_mode(FULL, max_desc_length=3)
+    snapshot = BoardSnapshot(
+        board=TrelloBoard(id="b1", name="Board", url="u", desc="long board text"),
+        cards=[make_card(desc="long card text")],
+    )
+
+    data = compact_dump(snapshot)
+
+    assert data["board"]["desc"] == "lon…"
+    assert data["cards"][0]["labelNames"] == ["Bug", "UX"]
+    assert data["cards"][0]["desc"] == "lon…"
+    assert "lists" not in data
+
+
+def test_format_result_full_returns_value_unchanged():
+    card = make_card()
+
+    assert format_result(card) is card
+    assert format_result(card, FULL) is card
+
+
+def test_format_result_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        format_result(make_card(), "tiny")
+
+
+def test_set_output_mode_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        set_output_mode("tiny")
+
+
+def test_format_result_compact_wraps_lists():
+    result = format_result([make_card(), make_card(id="card2")], COMPACT)
+
+    assert isinstance(result, CallToolResult)
+    assert len(result.structuredContent["result"]) == 2
+    assert json.loads(result.content[0].text) == result.structuredContent["result"]
+
+
+def test_format_result_compact_uses_server_mode():
+    set_output_mode(COMPACT)
+    board = TrelloBoard(id="b1", name="Board", url="http://trello.com/b/1")
+
+    result = format_result(board)
+
+    assert result.structuredContent == {
+        "id": "b1",
+        "name": "Board",
+        "url": "http://trello.com/b/1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_compact_result_passes_tool_output_validation():
+    mcp = FastMCP("test")
+
+    @mcp.tool()
+    async def cards() -> list[TrelloCard]:
+        return format_result([make_card(desc=None)], COMPACT)
+
+    result = await mcp.call_tool("cards", {})
+
+    structured = result.structuredContent
+    assert structured["result"][0]["labelNames"] == ["Bug", "UX"]
+    assert "desc" not in structured["result"][0]
+
+
+@pytest.mark.asyncio
+async def test_compact_page_passes_tool_output_validation():
+    mcp = FastMCP("test")
+
+    @mcp.tool()
+    async def cards() -> list[TrelloCard] | Page[TrelloCard]:
+        return format_result(
+            Page(items=[make_card()], total=3, next_cursor="abc"), COMPACT, wrap=True
+        )
+
+    result = await mcp.call_tool("cards", {})
+
+    page = result.structuredContent["result"]
+    assert page["items"][0]["labelNames"] == ["Bug", "UX"]
+    assert (page["total"], page["next_cursor"]) == (3, "abc")
+
+
+@pytest.mark.asyncio
+async def test_output_mode_parameter_lists_allowed_modes():
+    mcp = FastMCP("test")
+
+    @mcp.tool()
+    async def cards(output_mode: OutputMode | None = None) -> list[TrelloCard]:
+        return format_result([make_card()], output_mode)
+
+    [tool] = await mcp.list_tools()
+    schema = tool.inputSchema["properties"]["output_mode"]
+
+    assert {"enum": [FULL, COMPACT], "type": "string"} in schema["anyOf"]
+    with pytest.raises(ToolError):
+        await mcp.call_tool("cards", {"output_mode": "verbose"})
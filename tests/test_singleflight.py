@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from server.utils.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_upstream_call():
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"id": "b1"}
+
+    waiters = [asyncio.create_task(flight.do("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert results == [{"id": "b1"}] * 3
+    assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 2}
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        raise ValueError("boom")
+
+    waiters = [asyncio.create_task(flight.do("key", fetch)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_the_call_for_others():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "ok"
+
+    first = asyncio.create_task(flight.do("key", fetch))
+    second = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "ok"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_every_waiter_cancels_the_upstream_call():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiter = asyncio.create_task(flight.do("key", fetch))
+    await started.wait()
+    waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+    assert flight.calls == {}
+
+
+@pytest.mark.asyncio
+async def test_forget_starts_a_fresh_call_for_new_callers():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        call_number = calls
+        await release.wait()
+        return call_number
+
+    first = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    flight.forget()
+    second = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == 1
+    assert await second == 2
+
+
+@pytest.mark.asyncio
+async def test_caller_arriving_after_last_waiter_cancelled_starts_a_new_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    first = asyncio.create_task(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # The cancelled call must not be joined, even before its done-callback has run
+    assert await flight.do("k", fetch) == 2
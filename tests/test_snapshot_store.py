@@ -0,0 +1,43 @@
+from server.utils.snapshot_store import BoardSnapshotStore
+
+
+def test_get_returns_fresh_snapshots_only(make_snapshot):
+    store = BoardSnapshotStore(max_age=60)
+    snapshot = make_snapshot()
+    store.put(snapshot)
+
+    assert store.get("b1") is snapshot
+    assert store.get("b1", max_age=-1) is None
+    assert store.get("b2") is None
+
+
+def test_listeners_follow_puts_and_discards(make_snapshot):
+    store = BoardSnapshotStore()
+    events = []
+    store.add_listener(lambda board_id, snapshot: events.append((board_id, snapshot)))
+    snapshot = make_snapshot()
+
+    store.put(snapshot)
+    store.discard("b1")
+    store.discard("b1")
+
+    assert events == [("b1", snapshot), ("b1", None)]
+
+
+def test_invalidate_drops_boards_containing_the_ids(make_snapshot):
+    store = BoardSnapshotStore()
+    store.put(make_snapshot("b1"))
+    store.put(make_snapshot("b2", cards=[{"id": "b2-c1"}]))
+
+    store.invalidate({"b2-c1"})
+
+    assert store.board_ids() == ["b1"]
+
+
+def test_failing_listener_does_not_break_the_store(make_snapshot):
+    store = BoardSnapshotStore()
+    store.add_listener(lambda board_id, snapshot: 1 / 0)
+
+    store.put(make_snapshot())
+
+    assert store.board_ids() == ["b1"]
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+from server.models import BoardSnapshot
+from server.utils.summary import summarize_board
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+SNAPSHOT = {
+    "board": {"id": "b1", "name": "Board", "url": "u"},
+    "lists": [
+        {"id": "l2", "name": "Done", "idBoard": "b1", "pos": 2.0},
+        {"id": "l1", "name": "Todo", "idBoard": "b1", "pos": 1.0},
+        {"id": "l3", "name": "Empty", "idBoard": "b1", "pos": 3.0},
+    ],
+    "cards": [
+        {"id": "c1", "name": "A", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 1.0,
+         "due": "2026-02-20T00:00:00Z", "idMembers": ["m1"], "idLabels": ["lb1"]},
+        {"id": "c2", "name": "B", "idList": "l1", "idBoard": "b1", "url": "u", "pos": 2.0,
+         "due": "2026-02-20T00:00:00Z", "dueComplete": True, "idMembers": ["m1", "m2"]},
+        {"id": "c3", "name": "C", "idList": "l2", "idBoard": "b1", "url": "u", "pos": 1.0,
+         "due": "2026-03-05T00:00:00Z", "idLabels": ["lb1", "lb2", "lb3"]},
+    ],
+    "checklists": [
+        {"id": "cl1", "name": "Steps", "idCard": "c1", "checkItems": [
+            {"id": "i1", "name": "One", "state": "complete"},
+            {"id": "i2", "name": "Two"},
+            {"id": "i3", "name": "Three", "state": "complete"},
+        ]},
+        {"id": "cl2", "name": "Archived", "idCard": "c9", "checkItems": [{"id": "i4", "name": "Gone"}]},
+    ],
+    "labels": [
+        {"id": "lb1", "idBoard": "b1", "name": "Bug", "color": "red"},
+        {"id": "lb2", "idBoard": "b1", "name": "", "color": "green"},
+        {"id": "lb3", "idBoard": "b1", "name": "Bug", "color": "blue"},
+    ],
+    "members": [{"id": "m1", "username": "ada"}],
+}
+
+
+def test_summarize_board():
+    summary = summarize_board(BoardSnapshot.model_validate(SNAPSHOT), now=NOW)
+
+    assert summary.cards == 3
+    assert [(item.name, item.cards) for item in summary.lists] == [("Todo", 2), ("Done", 1), ("Empty", 0)]
+    assert summary.overdue == 1
+    assert summary.due_soon == 1
+    assert summary.checklist_items == 3
+    assert summary.checklist_items_complete == 2
+    assert summary.checklist_completion == 0.667
+    assert summary.cards_per_member == {"ada": 2, "m2": 1}
+    assert summary.unassigned == 1
+    # Labels sharing a name are counted apart
+    assert [(item.id, item.name, item.color, item.cards) for item in summary.cards_per_label] == [
+        ("lb1", "Bug", "red", 2),
+        ("lb2", "", "green", 1),
+        ("lb3", "Bug", "blue", 1),
+    ]
+
+
+def test_summarize_empty_board():
+    summary = summarize_board(BoardSnapshot.model_validate({"board": SNAPSHOT["board"]}), now=NOW)
+
+    assert summary.cards == 0
+    assert summary.lists == []
+    assert summary.checklist_completion is None
@@ -0,0 +1,289 @@
+import asyncio
+
+import httpx
+import pytest
+
+from server.utils import trello_api
+from server.utils.cache import ResponseCache
+from server.utils.json_codec import StdlibCodec
+from server.utils.rate_limiter import TrelloRateLimiter
+from server.utils.trello_api import TrelloClient
+
+
+def make_client(handler, **kwargs):
+    return TrelloClient("key", "token", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_client_uses_configured_limits_and_timeouts():
+    limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+    timeout = httpx.Timeout(10.0, connect=1.0, pool=2.0)
+
+    client = TrelloClient("key", "token", limits=limits, timeout=timeout)
+
+    assert client.limits is limits
+    assert client.client.timeout == timeout
+    assert client.http2 is False
+
+
+def test_http2_falls_back_when_h2_missing(monkeypatch):
+    monkeypatch.setattr(trello_api, "_http2_available", lambda: False)
+
+    client = TrelloClient("key", "token", http2=True)
+
+    assert client.http2 is False
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_once():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404)
+
+    client = make_client(handler)
+    await client.warm_up()
+    await client.warm_up()
+
+    assert len(calls) == 1
+    assert calls[0].method == "HEAD"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_ignores_connection_errors():
+    def handler(request):
+        raise httpx.ConnectError("unreachable", request=request)
+
+    client = make_client(handler)
+
+    await client.warm_up()
+
+
+@pytest.mark.asyncio
+async def test_requests_pass_through_rate_limiter():
+    class RecordingLimiter(TrelloRateLimiter):
+        acquired = 0
+        headers = None
+
+        async def acquire(self):
+            self.acquired += 1
+            return 0.0
+
+        def update_from_headers(self, headers):
+            self.headers = headers
+
+    def handler(request):
+        return httpx.Response(
+            200, json={"id": "b1"}, headers={"x-rate-limit-api-token-remaining": "99"}
+        )
+
+    limiter = RecordingLimiter()
+    client = make_client(handler, rate_limiter=limiter)
+
+    result = await client.GET("/boards/b1")
+
+    assert result == {"id": "b1"}
+    assert limiter.acquired == 1
+    assert limiter.headers["x-rate-limit-api-token-remaining"] == "99"
+    assert client.stats()["rate_limiter"]["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_chunks_urls_and_maps_results():
+    seen = []
+
+    def handler(request):
+        urls = request.url.params["urls"].split(",")
+        seen.append(urls)
+        entries = []
+        for url in urls:
+            if url == "/cards/missing":
+                entries.append({"404": "The requested resource was not found."})
+            else:
+                entries.append({"200": {"id": url.rsplit("/", 1)[1]}})
+        return httpx.Response(200, json=entries)
+
+    client = make_client(handler)
+    urls = [f"/cards/c{i}" for i in range(11)] + ["/cards/missing"]
+
+    results = await client.BATCH(urls)
+
+    assert [len(chunk) for chunk in seen] == [10, 2]
+    assert results[0] == (200, {"id": "c0"})
+    assert results[10] == (200, {"id": "c10"})
+    assert results[11] == (404, "The requested resource was not found.")
+
+
+@pytest.mark.asyncio
+async def test_batch_maps_chunk_failure_to_every_url():
+    def handler(request):
+        return httpx.Response(400, json={"message": "bad"})
+
+    client = make_client(handler)
+
+    results = await client.BATCH(["/cards/a", "/cards/b"])
+
+    assert [status for status, _ in results] == [400, 400]
+    assert all(isinstance(body, httpx.HTTPStatusError) for _, body in results)
+
+
+@pytest.mark.asyncio
+async def test_request_bodies_are_encoded_with_the_codec():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b'{"id": "c1", "name": "Caf\xc3\xa9"}')
+
+    client = make_client(handler, codec=StdlibCodec())
+
+    result = await client.POST("/cards", data={"name": "Café"})
+
+    assert result == {"id": "c1", "name": "Café"}
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert requests[0].content == '{"name":"Café"}'.encode()
+
+
+@pytest.mark.asyncio
+async def test_get_is_served_from_cache_until_a_write():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.method == "PUT":
+            return httpx.Response(200, json={"id": "c1", "idList": "l1", "name": "New"})
+        return httpx.Response(200, json=[{"id": "c1", "name": "Old"}])
+
+    client = make_client(handler, cache=ResponseCache())
+
+    first = await client.GET("/lists/l1/cards")
+    second = await client.GET("/lists/l1/cards")
+    await client.PUT("/cards/c1", data={"name": "New"})
+    await client.GET("/lists/l1/cards")
+
+    assert first == second
+    assert calls.count(("GET", "/1/lists/l1/cards")) == 2
+    assert client.stats()["cache"]["hits"] == {"cards": 1}
+
+
+@pytest.mark.asyncio
+async def test_fresh_get_bypasses_the_cache_and_refreshes_it():
+    names = iter(["Old", "New"])
+
+    def handler(request):
+        return httpx.Response(200, json={"id": "b1", "name": next(names)})
+
+    client = make_client(handler, cache=ResponseCache())
+
+    await client.GET("/boards/b1")
+    fresh = await client.GET("/boards/b1", fresh=True)
+    cached = await client.GET("/boards/b1")
+
+    assert fresh["name"] == "New"
+    assert cached["name"] == "New"
+
+
+@pytest.mark.asyncio
+async def test_write_listeners_receive_touched_ids():
+    def handler(request):
+        return httpx.Response(200, json={"id": "c1", "idList": "l1", "idBoard": "b1"})
+
+    client = make_client(handler)
+    touched = []
+    client.add_write_listener(touched.append)
+
+    await client.PUT("/cards/c1", data={"name": "New"})
+
+    assert touched == [{"c1", "l1", "b1"}]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_are_coalesced():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=[{"id": "l1"}])
+
+    client = make_client(handler)
+
+    results = await asyncio.gather(*(client.GET("/boards/b1/lists") for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == [{"id": "l1"}] for result in results)
+    assert client.stats()["inflight"]["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_iter_array_streams_elements():
+    def handler(request):
+        return httpx.Response(200, content=b'[{"id": "c1"}, {"id": "c2"}]')
+
+    client = make_client(handler)
+
+    items = [item async for item in client.iter_array("/lists/l1/cards")]
+
+    assert items == [{"id": "c1"}, {"id": "c2"}]
+
+
+@pytest.mark.asyncio
+async def test_iter_array_raises_http_errors():
+    def handler(request):
+        return httpx.Response(404, content=b"not found")
+
+    client = make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        [item async for item in client.iter_array("/lists/missing/cards")]
+
+
+@pytest.mark.asyncio
+async def test_paginate_follows_before_cursor_until_short_page():
+    actions = [{"id": f"a{i}"} for i in range(7, 0, -1)]
+    requests = []
+
+    def handler(request):
+        params = request.url.params
+        requests.append(dict(params))
+        before = params.get("before")
+        start = next(i for i, a in enumerate(actions) if a["id"] == before) + 1 if before else 0
+        return httpx.Response(200, json=actions[start : start + int(params["limit"])])
+
+    client = make_client(handler)
+
+    items = [item async for item in client.paginate("/boards/b1/actions", {"filter": "createCard"}, page_size=3)]
+
+    assert items == actions
+    assert [r.get("before") for r in requests] == [None, "a5", "a2"]
+    assert all(r["filter"] == "createCard" for r in requests)
+
+
+@pytest.mark.asyncio
+async def test_paginate_page_cursor_with_items_key_and_max_items():
+    pages = []
+
+    def handler(request):
+        page = int(request.url.params["cards_page"])
+        pages.append(page)
+        return httpx.Response(200, json={"cards": [{"id": f"c{page}-{i}"} for i in range(2)]})
+
+    client = make_client(handler)
+
+    items = [
+        item
+        async for item in client.paginate(
+            "/search",
+            {"query": "bug"},
+            page_size=2,
+            max_items=3,
+            cursor="page",
+            limit_param="cards_limit",
+            page_param="cards_page",
+            items_key="cards",
+        )
+    ]
+
+    assert [item["id"] for item in items] == ["c0-0", "c0-1", "c1-0"]
+    assert pages == [0, 1]
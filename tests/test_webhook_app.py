@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from server.config import settings
+from server.models import BoardSyncResult
+from server.utils.webhooks import SIGNATURE_HEADER, sign
+from server.webhook_app import trello_webhook
+
+SECRET = "secret"
+CALLBACK = "https://example.com/webhooks/trello"
+
+DELIVERY = {
+    "action": {
+        "id": "a1",
+        "type": "updateCard",
+        "data": {"board": {"id": "b1"}, "card": {"id": "c1"}},
+    },
+    "model": {"id": "b1", "name": "Board"},
+    "webhook": {"id": "w1", "idModel": "b1", "callbackURL": CALLBACK},
+}
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    monkeypatch.setattr(settings, "TRELLO_API_SECRET", SECRET)
+    monkeypatch.setattr(settings, "TRELLO_WEBHOOK_CALLBACK_URL", CALLBACK)
+
+
+@pytest.fixture
+def mock_sync(mocker):
+    sync = mocker.patch("server.tools.snapshot.sync", autospec=True)
+    sync.receive.return_value = BoardSyncResult(board_id="b1", mode="incremental", actions=1)
+    return sync
+
+
+@pytest.fixture
+def mock_invalidate(mocker):
+    return mocker.patch("server.trello.client.invalidate", autospec=True)
+
+
+@pytest.fixture
+def app():
+    routes = [Route("/webhooks/trello", trello_webhook, methods=["HEAD", "POST"])]
+    return TestClient(Starlette(routes=routes))
+
+
+def deliver(app, payload, secret=SECRET):
+    """Posts a delivery signed the way Trello signs it."""
+    body = json.dumps(payload).encode()
+    return app.post(
+        "/webhooks/trello",
+        content=body,
+        headers={SIGNATURE_HEADER: sign(secret, body, CALLBACK)},
+    )
+
+
+def test_head_handshake(app):
+    assert app.head("/webhooks/trello").status_code == 200
+
+
+def test_signed_delivery_is_applied(app, configured, mock_sync, mock_invalidate):
+    response = deliver(app, DELIVERY)
+
+    assert response.status_code == 200
+    assert response.json()["sync"]["mode"] == "incremental"
+    mock_invalidate.assert_called_once_with({"b1", "c1"})
+    mock_sync.receive.assert_called_once_with("b1", DELIVERY["action"], "w1")
+
+
+def test_bad_signature_is_rejected(app, configured, mock_sync, mock_invalidate):
+    response = deliver(app, DELIVERY, secret="forged")
+
+    assert response.status_code == 401
+    mock_sync.receive.assert_not_called()
+    mock_invalidate.assert_not_called()
+
+
+def test_malformed_delivery_is_rejected(app, configured, mock_sync, mock_invalidate):
+    response = deliver(app, {"model": {"id": "b1"}})
+
+    assert response.status_code == 400
+    mock_sync.receive.assert_not_called()
+
+
+def test_unconfigured_server_refuses_deliveries(app, monkeypatch, mock_sync):
+    monkeypatch.setattr(settings, "TRELLO_API_SECRET", "")
+
+    assert deliver(app, DELIVERY).status_code == 503
+
+
+def test_sync_failure_still_acknowledges(app, configured, mock_sync, mock_invalidate):
+    mock_sync.receive.side_effect = RuntimeError("boom")
+
+    response = deliver(app, DELIVERY)
+
+    assert response.status_code == 200
+    assert response.json()["sync"] is None
+    mock_invalidate.assert_called_once()
@@ -0,0 +1,44 @@
+import base64
+import hashlib
+import hmac
+
+from server.utils.webhooks import action_ids, sign, verify_signature
+
+SECRET = "secret"
+CALLBACK = "https://example.com/webhooks/trello"
+
+
+def test_sign_matches_trello_scheme():
+    body = b'{"action": {}}'
+    expected = base64.b64encode(
+        hmac.new(SECRET.encode(), body + CALLBACK.encode(), hashlib.sha1).digest()
+    ).decode()
+
+    assert sign(SECRET, body, CALLBACK) == expected
+
+
+def test_verify_signature():
+    body = b'{"action": {}}'
+    signature = sign(SECRET, body, CALLBACK)
+
+    assert verify_signature(SECRET, body, CALLBACK, signature)
+    assert not verify_signature(SECRET, body + b" ", CALLBACK, signature)
+    assert not verify_signature(SECRET, body, CALLBACK + "/", signature)
+    assert not verify_signature("other", body, CALLBACK, signature)
+    assert not verify_signature(SECRET, body, CALLBACK, None)
+
+
+def test_action_ids():
+    action = {
+        "type": "updateCard",
+        "data": {
+            "board": {"id": "b1"},
+            "card": {"id": "c1"},
+            "listBefore": {"id": "l1"},
+            "listAfter": {"id": "l2"},
+            "old": {"idList": "l1"},
+        },
+    }
+
+    assert action_ids(action) == {"b1", "c1", "l1", "l2"}
+    assert action_ids({"type": "updateBoard"}) == set()
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from mcp.server.fastmcp import Context
-from server.tools.board import get_board, get_boards
+from server.tools.board import get_board, get_boards, DEFAULT_BOARD_FIELDS
 from server.models import TrelloBoard
 
 @pytest.fixture
@@ -21,7 +21,7 @@ async def test_get_board_tool(mock_context, mock_service):
     result = await get_board(mock_context, board_id)
 
     assert result == expected_board
-    mock_service.get_board.assert_called_once_with(board_id)
+    mock_service.get_board.assert_called_once_with(board_id, fields=DEFAULT_BOARD_FIELDS)
 
 @pytest.mark.asyncio
 async def test_get_boards_tool(mock_context, mock_service):
@@ -31,4 +31,4 @@ async def test_get_boards_tool(mock_context, mock_service):
     result = await get_boards(mock_context)
 
     assert result == expected_boards
-    mock_service.get_boards.assert_called_once()
+    mock_service.get_boards.assert_called_once_with(fields=DEFAULT_BOARD_FIELDS)
@@ -1,9 +1,12 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from mcp.server.fastmcp import Context
-from server.tools.card import get_card, get_cards, create_card, update_card, delete_card, move_card
-from server.models import TrelloCard
+from server.tools.card import get_card, get_cards, create_card, create_cards, update_card, delete_card, move_card, DEFAULT_CARD_FIELDS
+from server.models import TrelloCard, TrelloCardDetail
+from server.utils.query import CardQuery
+from server.dtos.create_card import CreateCardPayload
 from server.dtos.update_card import UpdateCardPayload
+from server.utils.concurrency import FanOutResult
 
 @pytest.fixture
 def mock_context():
@@ -29,7 +32,7 @@ async def test_get_card_tool(mock_context, mock_service):
     result = await get_card(mock_context, card_id)
 
     assert result == expected_card
-    mock_service.get_card.assert_called_once_with(card_id)
+    mock_service.get_card.assert_called_once_with(card_id, fields=DEFAULT_CARD_FIELDS)
 
 @pytest.mark.asyncio
 async def test_get_cards_tool_list(mock_context, mock_service):
@@ -49,7 +52,7 @@ async def test_get_cards_tool_list(mock_context, mock_service):
     result = await get_cards(mock_context, list_id)
 
     assert result == expected_cards
-    mock_service.get_cards.assert_called_once_with(list_id)
+    mock_service.get_cards.assert_called_once_with(list_id, fields=DEFAULT_CARD_FIELDS, query=CardQuery())
 
 @pytest.mark.asyncio
 async def test_get_cards_tool_by_ids(mock_context, mock_service):
@@ -71,14 +74,32 @@ async def test_get_cards_tool_by_ids(mock_context, mock_service):
         pos=2.0
     )
     
-    mock_service.get_card.side_effect = [expected_card1, expected_card2]
+    mock_service.get_cards_by_ids.return_value = ([expected_card1, expected_card2], {})
 
     result = await get_cards(mock_context, list_id="dummy", card_ids=card_ids)
 
     assert len(result) == 2
     assert result[0] == expected_card1
     assert result[1] == expected_card2
-    assert mock_service.get_card.call_count == 2
+    mock_service.get_cards_by_ids.assert_called_once_with(card_ids, fields=DEFAULT_CARD_FIELDS, query=CardQuery())
+    mock_service.get_card.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_cards_tool_by_ids_reports_failures(mock_context, mock_service):
+    expected_card = TrelloCard(
+        id="c1", 
+        name="C1", 
+        idList="l1", 
+        idBoard="b1", 
+        url="http://url", 
+        pos=1.0
+    )
+    mock_service.get_cards_by_ids.return_value = ([expected_card], {"c2": "HTTP 404: not found"})
+
+    result = await get_cards(mock_context, list_id="dummy", card_ids=["c1", "c2"])
+
+    assert result == [expected_card]
+    mock_context.error.assert_called_once_with("Failed to fetch card c2: HTTP 404: not found")
 
 @pytest.mark.asyncio
 async def test_create_card_tool(mock_context, mock_service):
@@ -149,3 +170,121 @@ async def test_move_card_tool(mock_context, mock_service):
 
     assert result == expected_card
     mock_service.update_card.assert_called_once_with(card_id, idList=target_list_id)
+
+@pytest.mark.asyncio
+async def test_get_cards_tool_compact_output(mock_context, mock_service):
+    mock_service.get_cards.return_value = [
+        TrelloCard(id="c1", name="C1", idList="l1", idBoard="b1", url="http://url", pos=1.0)
+    ]
+
+    result = await get_cards(mock_context, "l1", output_mode="compact")
+
+    assert result.structuredContent == {
+        "result": [
+            {"id": "c1", "name": "C1", "idList": "l1", "idBoard": "b1", "url": "http://url", "pos": 1.0}
+        ]
+    }
+
+@pytest.mark.asyncio
+async def test_get_cards_tool_paginates_from_snapshot(mock_context, mock_service):
+    mock_service.get_cards.return_value = [
+        TrelloCard(id=f"c{i}", name=f"C{i}", idList="l1", idBoard="b1", url="http://url", pos=i)
+        for i in range(5)
+    ]
+
+    first = await get_cards(mock_context, "l1", limit=2)
+    second = await get_cards(mock_context, "l1", cursor=first.next_cursor)
+    third = await get_cards(mock_context, "l1", cursor=second.next_cursor)
+
+    assert [card.id for card in first.items] == ["c0", "c1"]
+    assert [card.id for card in second.items] == ["c2", "c3"]
+    assert [card.id for card in third.items] == ["c4"]
+    assert first.total == 5 and third.next_cursor is None
+    mock_service.get_cards.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_cards_tool_builds_pushdown_query(mock_context, mock_service):
+    mock_service.get_cards.return_value = []
+
+    await get_cards(
+        mock_context,
+        "l1",
+        status="closed",
+        created_after="2024-01-01",
+        from_date="2024-03-01T00:00:00Z",
+        max_cards=20,
+    )
+
+    query = mock_service.get_cards.call_args.kwargs["query"]
+    assert query.path("l1") == "/lists/l1/cards/closed"
+    assert query.params() == {"since": "2024-01-01T00:00:00+00:00"}
+    assert query.active_since.isoformat() == "2024-03-01T00:00:00+00:00"
+
+@pytest.mark.asyncio
+async def test_get_cards_tool_rejects_invalid_date(mock_context, mock_service):
+    mock_context.error = AsyncMock()
+
+    result = await get_cards(mock_context, "l1", from_date="yesterday")
+
+    assert result == []
+    mock_service.get_cards.assert_not_called()
+    mock_context.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_card_tool_with_details(mock_context, mock_service):
+    expected_card = TrelloCardDetail(
+        id="card123", name="Test Card", idList="l1", idBoard="b1", url="http://url", pos=1.0
+    )
+    mock_service.get_card_details.return_value = expected_card
+
+    result = await get_card(mock_context, "card123", actions_limit=3)
+
+    assert result == expected_card
+    mock_service.get_card_details.assert_called_once_with(
+        "card123", fields=DEFAULT_CARD_FIELDS, actions_limit=3
+    )
+    mock_service.get_card.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_cards_tool(mock_service):
+    context = AsyncMock(spec=Context)
+    created = TrelloCard(id="n1", name="First", idList="l1", idBoard="b1", url="u", pos=1.0)
+    mock_service.create_cards.return_value = FanOutResult(
+        items=[{}, {}], outcomes=[created, RuntimeError("HTTP 400")]
+    )
+    cards = [
+        CreateCardPayload(name="First", labels=["lb1"], members=["m1"], due="2026-01-01T00:00:00Z"),
+        CreateCardPayload(name="Second", list_id="l2", pos="top"),
+        CreateCardPayload(name="Nowhere"),
+    ]
+
+    result = await create_cards(context, cards[:2], list_id="l1")
+
+    assert [(item.index, item.name) for item in result] == [(0, "First"), (1, "Second")]
+    assert result[0].card == created and result[0].error is None
+    assert result[1].card is None and result[1].error == "HTTP 400"
+    mock_service.create_cards.assert_called_once_with([
+        {"idList": "l1", "name": "First", "idLabels": ["lb1"], "idMembers": ["m1"], "due": "2026-01-01T00:00:00Z"},
+        {"idList": "l2", "name": "Second", "pos": "top"},
+    ])
+    context.error.assert_called_once()
+
+    mock_service.create_cards.reset_mock()
+    mock_service.create_cards.return_value = FanOutResult(items=[], outcomes=[])
+    result = await create_cards(context, cards[2:])
+
+    assert result[0].error == "No list_id given for this card"
+    mock_service.create_cards.assert_called_once_with([])
+
+
+@pytest.mark.asyncio
+async def test_create_cards_tool_reports_errors_without_a_message(mock_service):
+    context = AsyncMock(spec=Context)
+    mock_service.create_cards.return_value = FanOutResult(items=[{}], outcomes=[TimeoutError()])
+
+    result = await create_cards(context, [CreateCardPayload(name="Slow")], list_id="l1")
+
+    assert result[0].card is None and result[0].error == "TimeoutError"
+    context.error.assert_called_once()
@@ -5,6 +5,7 @@ from server.tools.checklist import (
     get_checklist, get_card_checklists, create_checklist, update_checklist, 
     delete_checklist, add_checkitem, update_checkitem, delete_checkitem
 )
+from server.models import TrelloCheckItem, TrelloChecklist
 
 @pytest.fixture
 def mock_context():
@@ -17,7 +18,7 @@ def mock_service(mocker):
 @pytest.mark.asyncio
 async def test_get_checklist_tool(mock_context, mock_service):
     checklist_id = "chk1"
-    expected_data = {"id": checklist_id, "name": "Checklist"}
+    expected_data = TrelloChecklist(id=checklist_id, name="Checklist")
     mock_service.get_checklist.return_value = expected_data
 
     result = await get_checklist(mock_context, checklist_id)
@@ -28,7 +29,7 @@ async def test_get_checklist_tool(mock_context, mock_service):
 @pytest.mark.asyncio
 async def test_get_card_checklists_tool(mock_context, mock_service):
     card_id = "c1"
-    expected_data = [{"id": "chk1", "name": "Checklist"}]
+    expected_data = [TrelloChecklist(id="chk1", name="Checklist")]
     mock_service.get_card_checklists.return_value = expected_data
 
     result = await get_card_checklists(mock_context, card_id)
@@ -40,7 +41,7 @@ async def test_get_card_checklists_tool(mock_context, mock_service):
 async def test_create_checklist_tool(mock_context, mock_service):
     card_id = "c1"
     name = "New Checklist"
-    expected_data = {"id": "chk1", "name": name, "idCard": card_id}
+    expected_data = TrelloChecklist(id="chk1", name=name, idCard=card_id)
     mock_service.create_checklist.return_value = expected_data
 
     result = await create_checklist(mock_context, card_id, name)
@@ -52,7 +53,7 @@ async def test_create_checklist_tool(mock_context, mock_service):
 async def test_update_checklist_tool(mock_context, mock_service):
     checklist_id = "chk1"
     name = "Updated Name"
-    expected_data = {"id": checklist_id, "name": name}
+    expected_data = TrelloChecklist(id=checklist_id, name=name)
     mock_service.update_checklist.return_value = expected_data
 
     result = await update_checklist(mock_context, checklist_id, name=name)
@@ -75,7 +76,7 @@ async def test_delete_checklist_tool(mock_context, mock_service):
 async def test_add_checkitem_tool(mock_context, mock_service):
     checklist_id = "chk1"
     name = "Item 1"
-    expected_data = {"id": "item1", "name": name, "state": "incomplete"}
+    expected_data = TrelloCheckItem(id="item1", name=name, state="incomplete")
     mock_service.add_checkitem.return_value = expected_data
 
     result = await add_checkitem(mock_context, checklist_id, name)
@@ -87,7 +88,7 @@ async def test_add_checkitem_tool(mock_context, mock_service):
 async def test_update_checkitem_tool(mock_context, mock_service):
     checklist_id = "chk1"
     checkitem_id = "item1"
-    expected_data = {"id": checkitem_id, "state": "complete"}
+    expected_data = TrelloCheckItem(id=checkitem_id, name="Item 1", state="complete")
     mock_service.update_checkitem.return_value = expected_data
 
     result = await update_checkitem(mock_context, checklist_id, checkitem_id, checked=True)
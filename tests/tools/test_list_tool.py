@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from mcp.server.fastmcp import Context
-from server.tools.list import get_list, get_lists, create_list, update_list, delete_list
+from server.tools.list import get_list, get_lists, create_list, update_list, delete_list, DEFAULT_LIST_FIELDS
 from server.models import TrelloList
 
 @pytest.fixture
@@ -26,7 +26,7 @@ async def test_get_list_tool(mock_context, mock_service):
     result = await get_list(mock_context, list_id)
 
     assert result == expected_list
-    mock_service.get_list.assert_called_once_with(list_id)
+    mock_service.get_list.assert_called_once_with(list_id, fields=DEFAULT_LIST_FIELDS)
 
 @pytest.mark.asyncio
 async def test_get_lists_tool(mock_context, mock_service):
@@ -44,7 +44,21 @@ async def test_get_lists_tool(mock_context, mock_service):
     result = await get_lists(mock_context, board_id)
 
     assert result == expected_lists
-    mock_service.get_lists.assert_called_once_with(board_id)
+    mock_service.get_lists.assert_called_once_with(board_id, fields=DEFAULT_LIST_FIELDS)
+
+@pytest.mark.asyncio
+async def test_get_lists_tool_paginated(mock_context, mock_service):
+    mock_service.get_lists.return_value = [
+        TrelloList(id=f"l{i}", name=f"L{i}", idBoard="b1", pos=i) for i in range(3)
+    ]
+
+    first = await get_lists(mock_context, "b1", limit=2)
+    second = await get_lists(mock_context, "b1", cursor=first.next_cursor, output_mode="compact")
+
+    assert [lst.id for lst in first.items] == ["l0", "l1"]
+    assert second.structuredContent == {
+        "result": {"items": [{"id": "l2", "name": "L2", "idBoard": "b1", "pos": 2.0}], "total": 3}
+    }
 
 @pytest.mark.asyncio
 async def test_create_list_tool(mock_context, mock_service):
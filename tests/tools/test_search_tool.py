@@ -0,0 +1,158 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from mcp.server.fastmcp import Context
+from server.tools.search import query_all_boards, query_cards, search_cards
+from server.models import BoardSnapshot, CardSearchHit, TrelloBoard, TrelloCard
+
+@pytest.fixture
+def mock_context():
+    return MagicMock(spec=Context)
+
+@pytest.fixture
+def mock_sync(mocker):
+    sync = mocker.patch("server.tools.search.sync", autospec=True)
+    sync.mirrors = {"b1": MagicMock(), "b2": MagicMock()}
+    return sync
+
+@pytest.fixture
+def mock_index(mocker):
+    index = mocker.patch("server.tools.search.card_index", autospec=True)
+    index.boards = {"b1": {"c1"}}
+    return index
+
+@pytest.fixture
+def mock_query_index(mocker):
+    index = mocker.patch("server.tools.search.card_query_index", autospec=True)
+    index.boards = {"b1": {"c1"}}
+    index.resolve_labels.side_effect = lambda value, board_ids: {f"id-{value}"}
+    index.resolve_members.side_effect = lambda value, board_ids: {f"id-{value}"}
+    return index
+
+@pytest.fixture
+def hits():
+    card = TrelloCard(id="c1", name="Login", idList="l1", idBoard="b1", url="u", pos=1.0)
+    return [CardSearchHit(card=card, score=1.5)]
+
+@pytest.mark.asyncio
+async def test_search_cards_tool(mock_context, mock_sync, mock_index, mock_query_index, hits):
+    mock_index.search.return_value = hits
+
+    result = await search_cards(mock_context, "login")
+
+    assert result == hits
+    # b2 was dropped from the index by a write, so it is synced before searching
+    mock_sync.get_snapshot.assert_called_once_with("b2")
+    mock_index.search.assert_called_once_with("login", board_ids=["b1", "b2"], limit=20)
+
+@pytest.mark.asyncio
+async def test_search_cards_tool_loads_requested_board(mock_context, mock_sync, mock_index, mock_query_index, hits):
+    mock_index.search.return_value = []
+
+    result = await search_cards(mock_context, "login", board_id="b3", limit=5)
+
+    assert result == []
+    mock_sync.get_snapshot.assert_called_once_with("b3")
+    mock_index.search.assert_called_once_with("login", board_ids=["b3"], limit=5)
+
+@pytest.mark.asyncio
+async def test_query_cards_tool(mock_context, mock_sync, mock_index, mock_query_index, hits):
+    mock_index.boards = {"b1": {"c1"}, "b2": set()}
+    mock_query_index.boards = {"b1": {"c1"}, "b2": set()}
+    cards = [hits[0].card, hits[0].card.model_copy(update={"id": "c2"})]
+    mock_query_index.query.return_value = cards
+
+    result = await query_cards(
+        mock_context, list_id="l1", labels=["Bug"], members=["ada"], due_after="2026-01-01", limit=1
+    )
+
+    assert result == cards[:1]
+    mock_sync.get_snapshot.assert_not_called()
+    kwargs = mock_query_index.query.call_args.kwargs
+    assert kwargs["board_ids"] == ["b1", "b2"]
+    assert kwargs["list_id"] == "l1"
+    assert kwargs["label_ids"] == [{"id-Bug"}]
+    assert kwargs["member_ids"] == [{"id-ada"}]
+    assert kwargs["due_after"].isoformat() == "2026-01-01T00:00:00+00:00"
+    assert kwargs["due_before"] is None
+    assert kwargs["due_complete"] is None
+
+@pytest.mark.asyncio
+async def test_query_cards_tool_overdue(mock_context, mock_sync, mock_index, mock_query_index):
+    mock_query_index.query.return_value = []
+
+    await query_cards(mock_context, board_id="b1", overdue=True)
+
+    kwargs = mock_query_index.query.call_args.kwargs
+    assert kwargs["due_before"] is not None
+    assert kwargs["due_complete"] is False
+
+@pytest.mark.asyncio
+async def test_query_cards_tool_invalid_date(mock_context, mock_sync, mock_index, mock_query_index):
+    result = await query_cards(mock_context, due_before="next week")
+
+    assert result == []
+    mock_context.error.assert_called_once()
+    mock_query_index.query.assert_not_called()
+
+@pytest.fixture
+def mock_board_service(mocker):
+    return mocker.patch("server.tools.search.board_service", autospec=True)
+
+@pytest.mark.asyncio
+async def test_query_all_boards_tool(mock_sync, mock_index, mock_query_index, mock_board_service, hits):
+    context = AsyncMock(spec=Context)
+    mock_board_service.get_boards.return_value = [
+        TrelloBoard(id="b1", name="One", url="u"),
+        TrelloBoard(id="b2", name="Two", url="u"),
+        TrelloBoard(id="b3", name="Old", url="u", closed=True),
+    ]
+
+    async def get_snapshot(board_id):
+        if board_id == "b2":
+            raise RuntimeError("HTTP 500")
+        return BoardSnapshot(board=TrelloBoard(id=board_id, name="One", url="u"))
+
+    mock_sync.get_snapshot.side_effect = get_snapshot
+    mock_query_index.query.return_value = [hits[0].card]
+
+    result = await query_all_boards(context, overdue=True)
+
+    assert result.cards == [hits[0].card]
+    assert result.total == 1
+    assert result.boards == ["b1"]
+    assert result.errors == {"b2": "HTTP 500"}
+    assert context.report_progress.call_count == 2
+    assert context.report_progress.call_args_list[0].args[1] == 2
+    messages = {call.args[2] for call in context.report_progress.call_args_list}
+    assert messages == {"One: 1 matching cards", "Board b2 failed: HTTP 500"}
+    assert mock_query_index.query.call_args.kwargs["due_complete"] is False
+
+@pytest.mark.asyncio
+async def test_query_all_boards_tool_ranks_by_text(mock_sync, mock_index, mock_query_index, mock_board_service, hits):
+    context = AsyncMock(spec=Context)
+    first = hits[0].card
+    second = first.model_copy(update={"id": "c2"})
+    third = first.model_copy(update={"id": "c3"})
+    mock_sync.get_snapshot.return_value = BoardSnapshot(board=TrelloBoard(id="b1", name="One", url="u"))
+    mock_query_index.query.return_value = [first, second]
+    mock_index.search.return_value = [
+        CardSearchHit(card=third, score=3.0),
+        CardSearchHit(card=second, score=2.0),
+        CardSearchHit(card=first, score=1.0),
+    ]
+
+    result = await query_all_boards(context, board_ids=["b1"], text="login", limit=1)
+
+    assert result.cards == [second]
+    assert result.total == 2
+    mock_board_service.get_boards.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_query_all_boards_tool_names_errors_without_a_message(mock_sync, mock_index, mock_query_index, mock_board_service):
+    context = AsyncMock(spec=Context)
+    mock_sync.get_snapshot.side_effect = TimeoutError()
+
+    result = await query_all_boards(context, board_ids=["b1"])
+
+    assert result.errors == {"b1": "TimeoutError"}
+    context.report_progress.assert_called_once_with(1, 1, "Board b1 failed: TimeoutError")
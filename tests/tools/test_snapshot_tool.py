@@ -0,0 +1,45 @@
+import pytest
+from unittest.mock import MagicMock
+from mcp.server.fastmcp import Context
+from server.tools.snapshot import board_summary, get_board_snapshot
+from server.models import BoardSnapshot, TrelloBoard
+
+@pytest.fixture
+def mock_context():
+    return MagicMock(spec=Context)
+
+@pytest.fixture
+def mock_sync(mocker):
+    return mocker.patch("server.tools.snapshot.sync", autospec=True)
+
+@pytest.fixture
+def snapshot():
+    return BoardSnapshot(board=TrelloBoard(id="b1", name="Board", url="http://url"))
+
+@pytest.mark.asyncio
+async def test_get_board_snapshot_tool(mock_context, mock_sync, snapshot):
+    mock_sync.get_snapshot.return_value = snapshot
+
+    result = await get_board_snapshot(mock_context, "b1")
+
+    assert result is snapshot
+    mock_sync.get_snapshot.assert_called_once_with("b1", refresh=False)
+
+@pytest.mark.asyncio
+async def test_get_board_snapshot_tool_refresh(mock_context, mock_sync, snapshot):
+    mock_sync.get_snapshot.return_value = snapshot
+
+    result = await get_board_snapshot(mock_context, "b1", refresh=True)
+
+    assert result is snapshot
+    mock_sync.get_snapshot.assert_called_once_with("b1", refresh=True)
+
+@pytest.mark.asyncio
+async def test_board_summary_tool(mock_context, mock_sync, snapshot):
+    mock_sync.get_snapshot.return_value = snapshot
+
+    result = await board_summary(mock_context, "b1")
+
+    assert result.board_id == "b1"
+    assert result.cards == 0
+    mock_sync.get_snapshot.assert_called_once_with("b1", refresh=False)
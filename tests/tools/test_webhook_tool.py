@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import MagicMock
+from mcp.server.fastmcp import Context
+from server.config import settings
+from server.tools.webhook import register_board_webhook, unregister_board_webhook
+from server.models import TrelloWebhook
+
+CALLBACK = "https://example.com/webhooks/trello"
+
+@pytest.fixture
+def mock_context():
+    return MagicMock(spec=Context)
+
+@pytest.fixture
+def mock_service(mocker):
+    return mocker.patch("server.tools.webhook.service", autospec=True)
+
+@pytest.fixture
+def mock_sync(mocker):
+    return mocker.patch("server.tools.webhook.sync", autospec=True)
+
+@pytest.fixture
+def configured(monkeypatch):
+    monkeypatch.setattr(settings, "TRELLO_API_SECRET", "secret")
+    monkeypatch.setattr(settings, "TRELLO_WEBHOOK_CALLBACK_URL", CALLBACK)
+
+@pytest.mark.asyncio
+async def test_register_board_webhook_tool(mock_context, mock_service, mock_sync, configured):
+    webhook = TrelloWebhook(id="w1", idModel="b1", callbackURL=CALLBACK)
+    mock_service.get_webhooks.return_value = []
+    mock_service.create_webhook.return_value = webhook
+
+    result = await register_board_webhook(mock_context, "b1")
+
+    assert result == webhook
+    mock_service.create_webhook.assert_called_once_with("b1", CALLBACK, None)
+    mock_sync.set_webhook.assert_called_once_with("b1", "w1")
+
+@pytest.mark.asyncio
+async def test_register_board_webhook_tool_reuses_existing(mock_context, mock_service, mock_sync, configured):
+    webhook = TrelloWebhook(id="w1", idModel="b1", callbackURL=CALLBACK)
+    mock_service.get_webhooks.return_value = [webhook]
+
+    result = await register_board_webhook(mock_context, "b1")
+
+    assert result == webhook
+    mock_service.create_webhook.assert_not_called()
+    mock_sync.set_webhook.assert_called_once_with("b1", "w1")
+
+@pytest.mark.asyncio
+async def test_register_board_webhook_tool_requires_secret(mock_context, mock_service, mock_sync, configured, monkeypatch):
+    monkeypatch.setattr(settings, "TRELLO_API_SECRET", "")
+
+    with pytest.raises(ValueError):
+        await register_board_webhook(mock_context, "b1")
+
+    mock_service.create_webhook.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_unregister_board_webhook_tool(mock_context, mock_service, mock_sync):
+    webhooks = [TrelloWebhook(id="w1", idModel="b1", callbackURL=CALLBACK)]
+    mock_service.get_webhooks.return_value = webhooks
+
+    result = await unregister_board_webhook(mock_context, "b1")
+
+    assert result == webhooks
+    mock_service.delete_webhook.assert_called_once_with("w1")
+    mock_sync.clear_webhook.assert_called_once_with("b1")
+
+@pytest.mark.asyncio
+async def test_register_board_webhook_tool_requires_callback_url(mock_context, mock_service, mock_sync, configured, monkeypatch):
+    monkeypatch.setattr(settings, "TRELLO_WEBHOOK_CALLBACK_URL", "")
+
+    with pytest.raises(ValueError):
+        await register_board_webhook(mock_context, "b1")
+
+    mock_service.create_webhook.assert_not_called()
+    mock_sync.set_webhook.assert_not_called()